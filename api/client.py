@@ -3,9 +3,15 @@ import json
 import time
 import re
 import logging
-from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
-from utils.exceptions import AuthenticationError, APIError, RateLimitError, QueryError, ConfigurationError
+from rich.console import Console
+from utils.exceptions import Rapid7Error, AuthenticationError, APIError, RateLimitError, QueryError, ConfigurationError
+from utils.keys import docs_search_key
+from utils import json_fast
 logger = logging.getLogger(__name__)
+# Warnings go to stderr so piped JSON stays clean
+stderr_console = Console(stderr=True)
+# ETag-tagged bodies outlive cache_ttl by this much, since a 304 proves them current
+ETAG_GRACE = 7 * 24 * 3600
 class Rapid7Client:
     def __init__(self, api_key, region='us', cache_manager=None):
         if not api_key:
@@ -21,8 +27,13 @@ class Rapid7Client:
             'Accept': 'application/json',
             'Content-Type': 'application/json'
         }
+        self._base_urls = None
     def get_base_url(self, product='idr'):
         """Get base URL for different Rapid7 products"""
+        # The table only depends on region, so build it once per (client, region)
+        cached = self._base_urls
+        if cached is not None and cached[0] == self.region:
+            return cached[1].get(product)
         urls = {
             'idr': f"https://{self.region}.api.insight.rapid7.com/log_search",
             'idr_query': f"https://{self.region}.rest.logs.insight.rapid7.com",
@@ -36,26 +47,31 @@ class Rapid7Client:
             'ic': f"https://{self.region}.api.insight.rapid7.com/connect",
             'vm_export': f"https://{self.region}.api.insight.rapid7.com/export/graphql"
         }
+        self._base_urls = (self.region, urls)
         return urls.get(product)
-    def make_request(self, method, url, data=None, params=None, retries=5, timeout=30):
-        """Make HTTP request with retry logic and error handling"""
+    def make_request(self, method, url, data=None, params=None, retries=5, timeout=30, stream=False, headers=None):
+        """Make HTTP request with retry logic and error handling.
+        stream=True defers reading the body so callers can consume it with iter_content;
+        headers are sent on top of the client's defaults.
+        """
+        request_headers = {**self.headers, **headers} if headers else self.headers
         for attempt in range(retries):
             try:
                 if method == 'POST':
-                    response = requests.post(url, headers=self.headers, json=data,
-                                           params=params, timeout=timeout)
+                    response = requests.post(url, headers=request_headers, json=data,
+                                           params=params, timeout=timeout, stream=stream)
                 elif method == 'GET':
-                    response = requests.get(url, headers=self.headers,
-                                          params=params, timeout=timeout)
+                    response = requests.get(url, headers=request_headers,
+                                          params=params, timeout=timeout, stream=stream)
                 elif method == 'PUT':
-                    response = requests.put(url, headers=self.headers, json=data,
-                                          params=params, timeout=timeout)
+                    response = requests.put(url, headers=request_headers, json=data,
+                                          params=params, timeout=timeout, stream=stream)
                 elif method == 'DELETE':
-                    response = requests.delete(url, headers=self.headers,
-                                             params=params, timeout=timeout)
+                    response = requests.delete(url, headers=request_headers,
+                                             params=params, timeout=timeout, stream=stream)
                 elif method == 'PATCH':
-                    response = requests.patch(url, headers=self.headers, json=data,
-                                            params=params, timeout=timeout)
+                    response = requests.patch(url, headers=request_headers, json=data,
+                                            params=params, timeout=timeout, stream=stream)
                 else:
                     raise ValueError(f"Unsupported HTTP method: {method}")
                 logger.debug(f"Request: {method} {url} - Status: {response.status_code}")
@@ -110,6 +126,7 @@ class Rapid7Client:
         start_time = time.time()
         
         if show_progress:
+            from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
             with Progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
@@ -489,15 +506,39 @@ class Rapid7Client:
         sort = [{"field": "vulnerability.severity", "order": "DESC"}]
         return self.search_vulnerabilities(query, size=size, sort=sort)
 
+    def _get_json_revalidated(self, url, params, error, allow_stale=False):
+        """GET url as JSON, keeping the body with its ETag in the cache.
+        Later calls send If-None-Match, so an unchanged resource comes back as an empty 304.
+        With allow_stale, a failed request (rate limiting included) falls back to the cached
+        body with a warning. Nothing is stored while the etag TTL is zero.
+        """
+        cache_key = (url, sorted((params or {}).items()))
+        cached = self.cache_manager.get('etag', cache_key) if self.cache_manager else None
+        try:
+            response = self.make_request("GET", url, params=params,
+                                         headers={'If-None-Match': cached['etag']} if cached else None)
+            if response.status_code == 304 and cached:
+                return cached['body']
+            if response.status_code != 200:
+                raise APIError(f"{error}: {response.status_code} - {response.text}")
+        except (Rapid7Error, requests.exceptions.RequestException) as e:
+            if not (allow_stale and cached):
+                raise
+            stderr_console.print(f"[yellow]Warning: stale cached data shown ({e})[/yellow]")
+            return cached['body']
+        data = response.json()
+        etag = response.headers.get('ETag')
+        if etag and self.cache_manager and self.cache_manager.ttl_for('etag') > 0:
+            self.cache_manager.set('etag', cache_key, {'etag': etag, 'body': data},
+                                   ttl=self.cache_manager.ttl_for('etag') + ETAG_GRACE)
+        return data
+
     # IDR Methods
-    def list_investigations(self, params=None):
+    def list_investigations(self, params=None, allow_stale=False):
         """List investigations with optional filtering"""
         base_url = f"https://{self.region}.api.insight.rapid7.com"
         url = f"{base_url}/idr/v2/investigations"
-        response = self.make_request("GET", url, params=params)
-        if response.status_code != 200:
-            raise APIError(f"Error fetching investigations: {response.status_code} - {response.text}")
-        return response.json()
+        return self._get_json_revalidated(url, params, "Error fetching investigations", allow_stale)
 
     def get_investigation(self, investigation_id):
         """Get investigation details"""
@@ -650,7 +691,7 @@ class Rapid7Client:
         response = self.make_request("PATCH", url, data=update_data)
         return response.json() if response.text else {"status": "success"}
 
-    def list_investigation_alerts(self, investigation_id, index=0, size=20, multi_customer=False):
+    def list_investigation_alerts(self, investigation_id, index=0, size=20, multi_customer=False, allow_stale=False):
         """List alerts associated with an investigation"""
         base_url = f"https://{self.region}.api.insight.rapid7.com"
         url = f"{base_url}/idr/v2/investigations/{investigation_id}/alerts"
@@ -661,10 +702,8 @@ class Rapid7Client:
             "multi-customer": str(multi_customer).lower()
         }
         
-        response = self.make_request("GET", url, params=params)
-        if response.status_code != 200:
-            raise APIError(f"Error fetching alerts for investigation {investigation_id}: {response.status_code} - {response.text}")
-        return response.json()
+        return self._get_json_revalidated(
+            url, params, f"Error fetching alerts for investigation {investigation_id}", allow_stale)
 
     # Account Management Methods
     def list_organizations(self):
@@ -759,7 +798,8 @@ class Rapid7Client:
         response = self.make_request("GET", url)
         if response.status_code != 200:
             raise APIError(f"Error fetching workflow {workflow_id}: {response.status_code} - {response.text}")
-        return response.json()
+        # Workflow definitions can be large; parse the body bytes directly (orjson when available)
+        return json_fast.loads(response.content)
 
     # ----------------------
     # InsightConnect (Jobs)
@@ -869,6 +909,10 @@ class Rapid7Client:
 
     def ic_export_workflow(self, workflow_id: str, exclude_config_details: bool = False):
         """Export a workflow definition (v2)."""
+        return json_fast.loads(self.ic_export_workflow_raw(workflow_id, exclude_config_details))
+
+    def ic_export_workflow_raw(self, workflow_id: str, exclude_config_details: bool = False) -> bytes:
+        """Export a workflow definition (v2) as the undecoded JSON response body."""
         base_url = self.get_base_url('ic')
         if not base_url:
             raise ConfigurationError("InsightConnect base URL could not be determined from region")
@@ -877,7 +921,7 @@ class Rapid7Client:
         response = self.make_request("GET", url, params=params)
         if response.status_code != 200:
             raise APIError(f"Error exporting workflow {workflow_id}: {response.status_code} - {response.text}")
-        return response.json()
+        return response.content
 
     # --------------------------------
     # InsightConnect (Global Artifacts)
@@ -1394,7 +1438,7 @@ class DocsClient:
     
     def search_docs(self, query, limit=15):
         """Search Rapid7 documentation"""
-        cache_key = f"docs_search_{query.lower()}_{limit}"
+        cache_key = docs_search_key(query, limit)
         if self.cache_manager:
             cached_result = self.cache_manager.get('docs_search', cache_key)
             if cached_result:
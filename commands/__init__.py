@@ -1,6 +1,17 @@
-from .config_commands import config_group
-from .credential_commands import cred_group
+# Command groups are resolved on first access; importing one command module
+# (e.g. commands.config_commands) no longer imports every other one
 # logs_group moved to siem.logs
-from .asm_commands import asm_group
-from .docs_commands import docs
-from .ic_commands import ic_group
\ No newline at end of file
+_LAZY_EXPORTS = {
+    'config_group': '.config_commands',
+    'cred_group': '.credential_commands',
+    'asm_group': '.asm_commands',
+    'docs': '.docs_commands',
+    'ic_group': '.ic_commands',
+}
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        import importlib
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
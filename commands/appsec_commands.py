@@ -32,11 +32,11 @@ def get_client(ctx, no_cache=False):
     config_manager = ConfigManager()
     config_manager.validate()
     
-    api_key = CredentialManager.get_api_key(ctx.obj.get('api_key'))
+    api_key = CredentialManager.get_api_key(ctx.obj.api_key)
     if not api_key:
         raise AuthenticationError("API key not found. Use 'r7 config cred store' to save credentials.")
     
-    region = ctx.obj.get('region') or config_manager.get('region', 'us')
+    region = ctx.obj.region or config_manager.get('region', 'us')
     
     cache_manager = None
     if config_manager.get('cache_enabled') and not no_cache:
@@ -1,88 +1,185 @@
+import functools
+import hashlib
 import json
+import operator
+import os
+import re
 import sys
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import urlencode
 import click
 from rich.console import Console
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
 from api.client import Rapid7Client
-from utils.cli import ClientManager
+from utils.cli import ClientManager, OutputFormatter
 from utils.config import ConfigManager
 from utils.cache import CacheManager
 from utils.credentials import CredentialManager
 from utils.exceptions import *
-
-console = Console()
+from utils import json_fast
+
+# stdout doesn't change for the life of the process, so probe the terminal once;
+# tests that swap stdout can reset this to None
+_STDOUT_ISATTY: bool | None = None
+
+def _stdout_isatty():
+    """Return whether stdout is a terminal, probing it on first use only."""
+    global _STDOUT_ISATTY
+    if _STDOUT_ISATTY is None:
+        _STDOUT_ISATTY = sys.stdout.isatty()
+    return _STDOUT_ISATTY
+
+# Skip colour and auto-highlighting work when output is piped
+console = Console(no_color=not _stdout_isatty(), highlight=False)
+
+# Patterns used by _parse_return_clause, compiled once at import
+_RETURN_RE = re.compile(r'\bRETURN\s+(.+?)(?:\s+(?:ORDER\s+BY|SKIP|LIMIT)|$)', re.IGNORECASE | re.DOTALL)
+_ALIAS_RE = re.compile(r'\s+[Aa][Ss]\s+(\w+)$')
+_IDENT_RE = re.compile(r'^[a-zA-Z_]\w*$')
+_FUNC_RE = re.compile(r'^(\w+)\s*\(')
+_STRUCTURAL_RE = re.compile(r'[,()\[\]]')
+_COLS_CSV_RE = re.compile(r'([^,.]*)(\.?)([^,]*)(?:,|$)')
+
+# --columns values that mean "no explicit columns", and their cache normaliser
+_EMPTY_SENTINELS = frozenset(('', '[]', 'none', 'None', 'auto'))
+_EMPTY_NORM = '[]'
+
+# Platform-internal apps left out of the connector health profile table
+_HEALTH_HIDDEN_APPS = frozenset(('rapid7.command_platform.app', 'combined.vuln.app'))
+
+# (label, id_token key) rows for the profile table, in display order
+_PROFILE_FIELDS = (
+    ("User ID", "sub"),
+    ("Email", "email"),
+    ("Name", "name"),
+    ("Given Name", "given_name"),
+    ("Family Name", "family_name"),
+    ("Username", "preferred_username"),
+    ("Customer ID", "customer_id"),
+    ("Organization ID", "org_id"),
+)
+_PROFILE_LIST_FIELDS = (
+    ("Permission Roles", "permission_roles"),
+    ("Features", "features"),
+    ("Capabilities", "capabilities"),
+)
+_PROFILE_LICENSE_FIELDS = (
+    ("License Type", "license_type"),
+    ("License Status", "license_status"),
+)
+
+# Static table layouts, as OutputFormatter.create_standard_table column specs
+_PROFILE_COLUMNS = (
+    {'name': 'Field', 'style': 'cyan'},
+    {'name': 'Value', 'style': 'white'},
+)
+_APPS_COLUMNS = (
+    {'name': 'App ID', 'style': 'cyan', 'width': 40},
+    {'name': 'Name', 'style': 'white', 'width': 30},
+    {'name': 'Version', 'style': 'yellow', 'width': 8},
+    {'name': 'Types', 'style': 'blue', 'width': 40},
+    {'name': 'Created', 'style': 'dim', 'width': 10},
+)
+_HEALTH_PROFILE_COLUMNS = (
+    {'name': 'Profile Name', 'style': 'white', 'width': 30},
+    {'name': 'App', 'style': 'cyan', 'width': 25},
+    {'name': 'Config', 'style': 'green', 'width': 12},
+    {'name': 'Execution', 'style': 'blue', 'width': 20},
+    {'name': 'Location', 'style': 'dim', 'width': 12},
+)
+_RUNS_COLUMNS = (
+    {'name': 'Execution ID', 'style': 'cyan', 'width': 36},
+    {'name': 'Profile ID', 'style': 'white', 'width': 36},
+    {'name': 'App', 'style': 'blue', 'width': 20},
+    {'name': 'Status', 'style': 'green', 'width': 10},
+    {'name': 'Timestamp', 'style': 'dim', 'width': 20},
+)
+_EXAMPLE_TEST_COLUMNS = (
+    {'name': 'File', 'style': 'cyan'},
+    {'name': 'Title', 'style': 'white'},
+    {'name': 'Status', 'style': 'green'},
+)
+_EXAMPLES_COLUMNS = (
+    {'name': 'File', 'style': 'cyan'},
+    {'name': 'Title', 'style': 'white'},
+    {'name': 'Description', 'style': 'yellow'},
+)
 
 def _parse_columns_arg(columns_str):
     """Parse --columns which may be JSON or csv like 'm.name,m.asset_class'.
     Returns a tuple (columns_list, normalized_str_for_cache).
     """
-    if not columns_str or columns_str.strip() in ('[]', 'none', 'None', 'auto'):
-        return [], '[]'
-    text = columns_str.strip()
+    if not columns_str or columns_str.strip() in _EMPTY_SENTINELS:
+        return [], _EMPTY_NORM
+    parsed = _parse_columns_cached(columns_str.strip())
+    if parsed is None:
+        raise QueryError("Invalid JSON for --columns. Use JSON or csv 'alias.prop,alias.prop'")
+    cols, norm = parsed
+    # Hand back fresh dicts so callers can't mutate the cached entry
+    return [dict(c) if isinstance(c, dict) else c for c in cols], norm
+
+@functools.lru_cache(maxsize=256)
+def _parse_columns_cached(text):
+    """Memoized body of _parse_columns_arg; returns None for invalid JSON."""
     # If it looks like JSON, parse and normalize
     if text.startswith('['):
         try:
             cols = json.loads(text)
-            # Normalize ordering and serialize
-            norm = json.dumps(cols, separators=(',', ':'), sort_keys=True)
-            return cols, norm
         except json.JSONDecodeError:
-            raise QueryError("Invalid JSON for --columns. Use JSON or csv 'alias.prop,alias.prop'")
-    # Otherwise, parse csv
-    parts = [p.strip() for p in text.split(',') if p.strip()]
-    cols = []
-    for p in parts:
-        if '.' in p:
-            alias, prop = p.split('.', 1)
-            cols.append({"alias": alias.strip(), "property_name": prop.strip()})
-        else:
+            return None
+    else:
+        # Otherwise, parse csv; each match is (alias_or_prop, dot, prop) for one entry
+        cols = [
+            {"alias": head.strip(), "property_name": tail.strip()} if dot
             # Only property provided; leave alias empty
-            cols.append({"alias": "", "property_name": p})
-    norm = json.dumps(cols, separators=(',', ':'), sort_keys=True)
-    return cols, norm
+            else {"alias": "", "property_name": head.strip()}
+            for head, dot, tail in _COLS_CSV_RE.findall(text)
+            if dot or head.strip()
+        ]
+    norm = json.dumps(cols, separators=(',', ':'), sort_keys=True) if cols else _EMPTY_NORM
+    return tuple(cols), norm
 
 def _parse_return_clause(query):
     """Parse RETURN clause from Cypher query to extract column names.
     Returns a list of column header names.
     """
-    import re
-    
+    return list(_return_clause_headers(query))
+
+@functools.lru_cache(maxsize=256)
+def _return_clause_headers(query):
+    """Memoized body of _parse_return_clause; returns a tuple of header names."""
     # Find the RETURN clause (case insensitive)
-    return_match = re.search(r'\bRETURN\s+(.+?)(?:\s+(?:ORDER\s+BY|SKIP|LIMIT)|$)', query, re.IGNORECASE | re.DOTALL)
+    return_match = _RETURN_RE.search(query)
     if not return_match:
-        return []
+        return ()
     
     return_clause = return_match.group(1).strip()
     
-    # Split by commas (but not within parentheses)
+    # Split by commas (but not within parentheses), visiting only structural chars
     columns = []
-    current = []
+    start = 0
     paren_depth = 0
     bracket_depth = 0
     
-    for char in return_clause:
-        if char == '(' and bracket_depth == 0:
-            paren_depth += 1
-            current.append(char)
-        elif char == ')' and bracket_depth == 0:
-            paren_depth -= 1
-            current.append(char)
-        elif char == '[':
+    for m in _STRUCTURAL_RE.finditer(return_clause):
+        char = m.group()
+        if char == '[':
             bracket_depth += 1
-            current.append(char)
         elif char == ']':
             bracket_depth -= 1
-            current.append(char)
-        elif char == ',' and paren_depth == 0 and bracket_depth == 0:
-            columns.append(''.join(current).strip())
-            current = []
-        else:
-            current.append(char)
+        elif bracket_depth == 0:
+            if char == '(':
+                paren_depth += 1
+            elif char == ')':
+                paren_depth -= 1
+            elif paren_depth == 0:
+                columns.append(return_clause[start:m.start()].strip())
+                start = m.end()
     
-    if current:
-        columns.append(''.join(current).strip())
+    if start < len(return_clause):
+        columns.append(return_clause[start:].strip())
     
     # Extract column names from each column expression
     header_names = []
@@ -90,7 +187,7 @@ def _parse_return_clause(query):
         col = col.strip()
         
         # Check for alias (e.g., "count(*) as count")
-        alias_match = re.search(r'\s+[Aa][Ss]\s+(\w+)$', col)
+        alias_match = _ALIAS_RE.search(col)
         if alias_match:
             header_names.append(alias_match.group(1))
         # Check for property access (e.g., "s.service_port")
@@ -99,12 +196,12 @@ def _parse_return_clause(query):
             parts = col.split('.')
             header_names.append(parts[-1].strip())
         # Check for simple identifier (e.g., "u" or "m")
-        elif re.match(r'^[a-zA-Z_]\w*$', col):
+        elif _IDENT_RE.match(col):
             header_names.append(col)
         # Check for function calls without alias (e.g., "count(m)")
         elif '(' in col:
             # Try to extract function name
-            func_match = re.match(r'^(\w+)\s*\(', col)
+            func_match = _FUNC_RE.match(col)
             if func_match:
                 header_names.append(func_match.group(1))
             else:
@@ -113,13 +210,41 @@ def _parse_return_clause(query):
             # Fallback to generic name
             header_names.append(f"Value {len(header_names) + 1}")
     
-    return header_names
+    return tuple(header_names)
+
+def _loads(response):
+    """Decode a JSON response body, using orjson when it is installed."""
+    if json_fast.orjson is not None:
+        return json_fast.loads(response.content)
+    return response.json()
+
+def _emit_json(data, pretty=None):
+    """Write data to stdout as JSON, using orjson when it is installed.
+    pretty=None defers to json_fast.write: indented unless R7_JSON_COMPACT=1 is set.
+    """
+    json_fast.write(data, indent=pretty)
+
+def _format_kv(label, value, width=20):
+    """Format one left-aligned label/value line for plain output."""
+    return f"{label:<{width}} {value}".rstrip() + "\n"
+
+def _to_columnar(records):
+    """Reshape {id: {field: value}} into {"keys": [...], "ids": [...], "rows": [[...]]}.
+    keys is the union of fields across all records in first-seen order; missing fields are null.
+    Rebuild the original with {i: {k: v for k, v in zip(keys, row) if v is not None} for i, row in zip(ids, rows)}.
+    """
+    keys = list(dict.fromkeys(k for record in records.values() for k in record))
+    return {
+        "keys": keys,
+        "ids": list(records),
+        "rows": [[record.get(k) for k in keys] for record in records.values()]
+    }
 
 def should_use_json_output(output_format, config_default):
     """Determine if we should use JSON output based on pipe detection and user preference"""
     if output_format:
         return output_format == 'json'
-    if not sys.stdout.isatty():
+    if not _stdout_isatty():
         return True
     return config_default == 'json'
 
@@ -133,7 +258,7 @@ def asm_group():
     pass
 
 @asm_group.command(name='profile')
-@click.option('--output', type=click.Choice(['table', 'json']), help='Output format')
+@click.option('--output', type=click.Choice(['table', 'plain', 'json']), help='Output format (plain prints aligned label/value lines)')
 @click.pass_context
 def asm_profile(ctx, output):
     """Get Surface Command user profile information"""
@@ -147,51 +272,40 @@ def asm_profile(ctx, output):
         if response.status_code != 200:
             raise APIError(f"Profile request failed: {response.status_code} - {response.text}")
         
-        data = response.json()
+        data = _loads(response)
         
         if use_json:
-            click.echo(json.dumps(data, indent=2))
+            _emit_json(data)
         else:
             if data:
-                table = Table(title="Surface Command Profile")
-                table.add_column("Field", style="cyan")
-                table.add_column("Value", style="white")
-                
                 # Extract data from id_token if present, otherwise use top level
                 id_token = data.get('id_token', {})
                 
                 # Display profile information in a structured way
-                table.add_row("User ID", str(id_token.get('sub', '')))
-                table.add_row("Email", str(id_token.get('email', '')))
-                table.add_row("Name", str(id_token.get('name', '')))
-                table.add_row("Given Name", str(id_token.get('given_name', '')))
-                table.add_row("Family Name", str(id_token.get('family_name', '')))
-                table.add_row("Username", str(id_token.get('preferred_username', '')))
-                table.add_row("Customer ID", str(id_token.get('customer_id', '')))
-                table.add_row("Organization ID", str(id_token.get('org_id', '')))
+                rows = [(label, str(id_token.get(key, ''))) for label, key in _PROFILE_FIELDS]
                 
-                # Handle permission roles
-                if 'permission_roles' in id_token and id_token['permission_roles']:
-                    table.add_row("Permission Roles", ', '.join(id_token['permission_roles']))
-                
-                # Handle features
-                if 'features' in id_token and id_token['features']:
-                    table.add_row("Features", ', '.join(id_token['features']))
-                
-                # Handle capabilities
-                if 'capabilities' in id_token and id_token['capabilities']:
-                    table.add_row("Capabilities", ', '.join(id_token['capabilities']))
+                # List-valued fields only get a row when non-empty
+                for label, key in _PROFILE_LIST_FIELDS:
+                    values = id_token.get(key)
+                    if values:
+                        rows.append((label, ', '.join(values)))
                 
                 # Handle license information
                 if 'license' in id_token:
                     license_info = id_token['license']
-                    table.add_row("License ID", str(license_info.get('license_id', '')))
-                    table.add_row("License Name", str(license_info.get('license_name', '')))
+                    rows.append(("License ID", str(license_info.get('license_id', ''))))
+                    rows.append(("License Name", str(license_info.get('license_name', ''))))
                 
-                table.add_row("License Type", str(id_token.get('license_type', '')))
-                table.add_row("License Status", str(id_token.get('license_status', '')))
+                rows.extend((label, str(id_token.get(key, ''))) for label, key in _PROFILE_LICENSE_FIELDS)
                 
-                console.print(table)
+                if output == 'plain':
+                    # Fixed two-column layout, no table measuring or markup
+                    click.echo(''.join(_format_kv(label, value) for label, value in rows), nl=False)
+                else:
+                    table = OutputFormatter.create_standard_table("Surface Command Profile", _PROFILE_COLUMNS)
+                    for label, value in rows:
+                        table.add_row(label, value)
+                    console.print(table)
             else:
                 console.print("No profile data found", style="yellow")
                 
@@ -209,8 +323,10 @@ def apps_group():
 @click.option('--all-types', is_flag=True, help='Show all types instead of truncating to first 3')
 @click.option('--exclude-apps', help='Comma-separated list of app IDs to exclude from output')
 @click.option('--full-output', is_flag=True, help='Include all fields in JSON output (default shows minimal fields matching table view)')
+@click.option('--json-shape', type=click.Choice(['dict', 'columnar']), default='dict', show_default=True,
+              help='JSON layout: dict keyed by app ID, or columnar {"keys","ids","rows"} without repeated field names')
 @click.pass_context
-def apps_list(ctx, output, no_cache, all_types, exclude_apps, full_output):
+def apps_list(ctx, output, no_cache, all_types, exclude_apps, full_output, json_shape):
     """List Surface Command apps"""
     client, config_manager = get_client_and_config(ctx)
     use_json = should_use_json_output(output, config_manager.get('default_output'))
@@ -235,20 +351,20 @@ def apps_list(ctx, output, no_cache, all_types, exclude_apps, full_output):
         
         # Apply exclusion filter if provided
         if exclude_apps and data and isinstance(data, dict):
-            exclude_list = [app_id.strip() for app_id in exclude_apps.split(',') if app_id.strip()]
-            if exclude_list:
-                original_count = len(data)
-                filtered_data = {app_id: app_data for app_id, app_data in data.items() if app_id not in exclude_list}
-                data = filtered_data
-                excluded_count = original_count - len(data)
-                if not use_json and excluded_count > 0:
-                    console.print(f"[dim]📝 Excluded {excluded_count} app(s) from output[/dim]")
+            exclude_set = frozenset(app_id.strip() for app_id in exclude_apps.split(',') if app_id.strip())
+            # Only IDs actually present cost anything; nothing is rebuilt
+            excluded = exclude_set & data.keys()
+            for app_id in excluded:
+                del data[app_id]
+            excluded_count = len(excluded)
+            if not use_json and excluded_count > 0:
+                console.print(f"[dim]📝 Excluded {excluded_count} app(s) from output[/dim]")
         
         if use_json:
             # Create minimal output by default to save context window space
             if full_output:
                 # Full output - include all fields
-                click.echo(json.dumps(data, separators=(',', ':')))
+                _emit_json(_to_columnar(data) if json_shape == 'columnar' else data, pretty=False)
             else:
                 # Minimal output - only include fields shown in table view
                 minimal_data = {}
@@ -268,24 +384,20 @@ def apps_list(ctx, output, no_cache, all_types, exclude_apps, full_output):
                     
                     minimal_data[app_id] = minimal_app
                 
-                click.echo(json.dumps(minimal_data, separators=(',', ':')))
+                _emit_json(_to_columnar(minimal_data) if json_shape == 'columnar' else minimal_data, pretty=False)
         else:
             # Display in table format - API returns apps as a dictionary with app IDs as keys
             if not data or not isinstance(data, dict):
                 console.print("No Surface Command apps found", style="yellow")
                 return
             
-            table = Table(title="Surface Command Apps")
-            table.add_column("App ID", style="cyan", width=40)
-            table.add_column("Name", style="white", width=30)
-            table.add_column("Version", style="yellow", width=8)
-            table.add_column("Types", style="blue", width=40)
-            table.add_column("Created", style="dim", width=10)
+            table = OutputFormatter.create_standard_table("Surface Command Apps", _APPS_COLUMNS)
             
             # Sort apps by name for consistent display
-            sorted_apps = sorted(data.items(), key=lambda x: x[1].get('name', x[0]))
+            keyed_apps = [(app_data.get('name') or app_id, app_id, app_data) for app_id, app_data in data.items()]
+            keyed_apps.sort(key=operator.itemgetter(0))
             
-            for app_id, app_data in sorted_apps:
+            for _, app_id, app_data in keyed_apps:
                 # Extract fields safely
                 name = app_data.get('name', 'Unknown')
                 description = app_data.get('description', '')
@@ -295,30 +407,23 @@ def apps_list(ctx, output, no_cache, all_types, exclude_apps, full_output):
                 types = app_data.get('types', [])
                 
                 # Format creation date from stored_object_metadata
-                created_display = ''
                 metadata = app_data.get('stored_object_metadata', {})
-                created_at = metadata.get('created', '')
-                if created_at:
-                    try:
-                        from datetime import datetime
-                        if 'T' in created_at:
-                            dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                            created_display = dt.strftime('%m-%d')
-                        else:
-                            created_display = created_at[:5]  # Just MM-DD
-                    except Exception:
-                        created_display = created_at[:5] if created_at else ''
+                created_at = metadata.get('created') or ''
+                # ISO dates (YYYY-MM-DD...) slice straight to MM-DD without parsing
+                if len(created_at) >= 10 and created_at[4] == '-':
+                    created_display = created_at[5:10]
+                else:
+                    created_display = created_at[:5]
                 
                 # Format types - show actual type names with line breaks for readability
                 if types:
-                    if all_types or len(types) <= 3:
+                    remaining = len(types) - 3
+                    if all_types or remaining <= 0:
                         # Show all types on separate lines
                         types_display = '\n'.join(types)
                     else:
                         # Show first 3 types + count of remaining
-                        types_display = '\n'.join(types[:3])
-                        remaining = len(types) - 3
-                        types_display += f'\n+ {remaining} more'
+                        types_display = '\n'.join(types[:3]) + f'\n+ {remaining} more'
                 else:
                     types_display = "None"
                 
@@ -367,7 +472,7 @@ def apps_health(ctx, output, no_cache, show_all):
             status_response = client.make_request('GET', f"{base_url}/apps/info/status")
             if status_response.status_code != 200:
                 raise APIError(f"Failed to get app statuses: {status_response.status_code} - {status_response.text}")
-            app_statuses = status_response.json()
+            app_statuses = _loads(status_response)
             if cache_enabled:
                 client.cache_manager.set('apps_health', status_cache_key, app_statuses)
 
@@ -382,7 +487,7 @@ def apps_health(ctx, output, no_cache, show_all):
             profiles_response = client.make_request('GET', f"{base_url}/profiles")
             if profiles_response.status_code != 200:
                 raise APIError(f"Failed to get profiles: {profiles_response.status_code} - {profiles_response.text}")
-            profiles = profiles_response.json()
+            profiles = _loads(profiles_response)
             if cache_enabled:
                 client.cache_manager.set('apps_health', profiles_cache_key, profiles)
 
@@ -402,7 +507,7 @@ def apps_health(ctx, output, no_cache, show_all):
                 exec_response = client.make_request('GET', f"{workflow_base}/executions?size=50")
 
                 if exec_response.status_code == 200:
-                    executions = exec_response.json()
+                    executions = _loads(exec_response)
 
                     # Track latest execution status per profile
                     latest_by_profile = {}
@@ -440,9 +545,8 @@ def apps_health(ctx, output, no_cache, show_all):
                                     f"{workflow_base}/executions/{exec_id}/logs?only_user_msgs=true&size=1000&offset=0")
 
                                 if logs_response.status_code == 200:
-                                    logs = logs_response.json()
+                                    logs = _loads(logs_response)
                                     if len(logs) >= 2:
-                                        from datetime import datetime
                                         start_time = datetime.fromisoformat(logs[0]['timestamp'].replace('Z', '+00:00'))
                                         end_time = datetime.fromisoformat(logs[-1]['timestamp'].replace('Z', '+00:00'))
                                         duration = (end_time - start_time).total_seconds()
@@ -526,7 +630,7 @@ def apps_health(ctx, output, no_cache, show_all):
                 'apps_without_profiles': apps_without_profiles,
                 'profiles_by_app': profiles_by_app if show_all else {k: v for k, v in profiles_by_app.items() if len(v) > 0}
             }
-            click.echo(json.dumps(health_data, indent=2))
+            _emit_json(health_data)
         else:
             # Display summary
             console.print("[bold]ASM Apps Health Status[/bold]\n")
@@ -575,7 +679,6 @@ def apps_health(ctx, output, no_cache, show_all):
                         short_error = error_msg[:100] + '...' if len(error_msg) > 100 else error_msg
                         console.print(f"    • {profile['name']} ({profile['integration_id']}): {short_error}")
                         if timestamp:
-                            from datetime import datetime
                             try:
                                 dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
                                 time_str = dt.strftime('%Y-%m-%d %H:%M UTC')
@@ -589,20 +692,11 @@ def apps_health(ctx, output, no_cache, show_all):
             # Profiles table - show individual profiles for better visibility
             if profiles_by_app:
                 console.print("[bold cyan]CONNECTOR PROFILES[/bold cyan]")
-                table = Table()
-                table.add_column("Profile Name", style="white", width=30)
-                table.add_column("App", style="cyan", width=25)
-                table.add_column("Config", style="green", width=12)
-                table.add_column("Execution", style="blue", width=20)
-                table.add_column("Location", style="dim", width=12)
-
-                excluded_from_display = {
-                    'rapid7.command_platform.app', 'combined.vuln.app'
-                }
+                table = OutputFormatter.create_standard_table(None, _HEALTH_PROFILE_COLUMNS)
 
                 all_profiles = []
                 for app_id, app_profiles in profiles_by_app.items():
-                    if app_id not in excluded_from_display:
+                    if app_id not in _HEALTH_HIDDEN_APPS:
                         for profile in app_profiles:
                             profile['app_id'] = app_id
                             all_profiles.append(profile)
@@ -647,7 +741,6 @@ def apps_health(ctx, output, no_cache, show_all):
                         timestamp = exec_data.get('timestamp', '')
                         if timestamp:
                             try:
-                                from datetime import datetime, timezone
                                 dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
                                 now = datetime.now(timezone.utc)
                                 diff = now - dt
@@ -745,25 +838,20 @@ def runlogs_list(ctx, profile, limit, output):
         if response.status_code != 200:
             raise APIError(f"Failed to get executions: {response.status_code} - {response.text}")
 
-        executions = response.json()
+        executions = _loads(response)
 
         # Filter by profile if specified
         if profile:
             executions = [e for e in executions if e.get('samos_workflow_id', '').startswith(f"{profile}/")]
 
         if use_json:
-            click.echo(json.dumps(executions, indent=2))
+            _emit_json(executions)
         else:
             if not executions:
                 console.print("No execution runs found", style="yellow")
                 return
 
-            table = Table(title=f"Execution Runs{' for ' + profile if profile else ''}")
-            table.add_column("Execution ID", style="cyan", width=36)
-            table.add_column("Profile ID", style="white", width=36)
-            table.add_column("App", style="blue", width=20)
-            table.add_column("Status", style="green", width=10)
-            table.add_column("Timestamp", style="dim", width=20)
+            table = OutputFormatter.create_standard_table(f"Execution Runs{' for ' + profile if profile else ''}", _RUNS_COLUMNS)
 
             for execution in executions:
                 exec_id = execution.get('execution_id', '')
@@ -779,7 +867,6 @@ def runlogs_list(ctx, profile, limit, output):
                 # Format timestamp
                 if timestamp:
                     try:
-                        from datetime import datetime
                         dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
                         time_display = dt.strftime('%Y-%m-%d %H:%M')
                     except:
@@ -823,13 +910,13 @@ def runlogs_show(ctx, run_id, output):
         if logs_response.status_code != 200:
             raise APIError(f"Failed to get execution logs: {logs_response.status_code} - {logs_response.text}")
 
-        logs = logs_response.json()
+        logs = _loads(logs_response)
 
         # Get execution metadata
         exec_response = client.make_request('GET', f"{workflow_base}/executions?size=100")
         execution = None
         if exec_response.status_code == 200:
-            all_execs = exec_response.json()
+            all_execs = _loads(exec_response)
             execution = next((e for e in all_execs if e['execution_id'] == exec_id), None)
 
         if use_json:
@@ -837,7 +924,7 @@ def runlogs_show(ctx, run_id, output):
                 'execution': execution,
                 'logs': logs
             }
-            click.echo(json.dumps(output_data, indent=2))
+            _emit_json(output_data)
         else:
             if execution:
                 console.print(f"[bold cyan]Execution Details[/bold cyan]\n")
@@ -849,7 +936,6 @@ def runlogs_show(ctx, run_id, output):
                 # Calculate duration if we have logs
                 if len(logs) >= 2:
                     try:
-                        from datetime import datetime
                         start_time = datetime.fromisoformat(logs[0]['timestamp'].replace('Z', '+00:00'))
                         end_time = datetime.fromisoformat(logs[-1]['timestamp'].replace('Z', '+00:00'))
                         duration = (end_time - start_time).total_seconds()
@@ -871,27 +957,7 @@ def runlogs_show(ctx, run_id, output):
             if logs:
                 console.print(f"[bold cyan]Execution Logs[/bold cyan] ({len(logs)} entries)\n")
 
-                for log in logs:
-                    timestamp = log.get('timestamp', '')
-                    content = log.get('content', {})
-                    message = content.get('message', '')
-                    level = content.get('level', 'INFO')
-
-                    # Format timestamp
-                    try:
-                        from datetime import datetime
-                        dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                        time_str = dt.strftime('%H:%M:%S')
-                    except:
-                        time_str = timestamp[:8] if timestamp else ''
-
-                    # Color by level
-                    if level == 'ERROR':
-                        console.print(f"[red]{time_str}[/red] {message}")
-                    elif level == 'WARNING':
-                        console.print(f"[yellow]{time_str}[/yellow] {message}")
-                    else:
-                        console.print(f"[dim]{time_str}[/dim] {message}")
+                _print_log_lines(logs)
             else:
                 console.print("No logs found", style="yellow")
 
@@ -915,7 +981,7 @@ def runlogs_latest(ctx, profile_id, output):
         if response.status_code != 200:
             raise APIError(f"Failed to get executions: {response.status_code} - {response.text}")
 
-        all_executions = response.json()
+        all_executions = _loads(response)
         profile_executions = [e for e in all_executions if e.get('samos_workflow_id', '').startswith(f"{profile_id}/")]
 
         if not profile_executions:
@@ -933,14 +999,14 @@ def runlogs_latest(ctx, profile_id, output):
         if logs_response.status_code != 200:
             raise APIError(f"Failed to get execution logs: {logs_response.status_code} - {logs_response.text}")
 
-        logs = logs_response.json()
+        logs = _loads(logs_response)
 
         if use_json:
             output_data = {
                 'execution': latest,
                 'logs': logs
             }
-            click.echo(json.dumps(output_data, indent=2))
+            _emit_json(output_data)
         else:
             console.print(f"[bold cyan]Latest Execution for Profile[/bold cyan]\n")
             console.print(f"Profile ID: {profile_id}")
@@ -952,7 +1018,6 @@ def runlogs_latest(ctx, profile_id, output):
             # Calculate duration if we have logs
             if len(logs) >= 2:
                 try:
-                    from datetime import datetime
                     start_time = datetime.fromisoformat(logs[0]['timestamp'].replace('Z', '+00:00'))
                     end_time = datetime.fromisoformat(logs[-1]['timestamp'].replace('Z', '+00:00'))
                     duration = (end_time - start_time).total_seconds()
@@ -974,27 +1039,7 @@ def runlogs_latest(ctx, profile_id, output):
             if logs:
                 console.print(f"[bold cyan]Execution Logs[/bold cyan] ({len(logs)} entries)\n")
 
-                for log in logs:
-                    timestamp = log.get('timestamp', '')
-                    content = log.get('content', {})
-                    message = content.get('message', '')
-                    level = content.get('level', 'INFO')
-
-                    # Format timestamp
-                    try:
-                        from datetime import datetime
-                        dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                        time_str = dt.strftime('%H:%M:%S')
-                    except:
-                        time_str = timestamp[:8] if timestamp else ''
-
-                    # Color by level
-                    if level == 'ERROR':
-                        console.print(f"[red]{time_str}[/red] {message}")
-                    elif level == 'WARNING':
-                        console.print(f"[yellow]{time_str}[/yellow] {message}")
-                    else:
-                        console.print(f"[dim]{time_str}[/dim] {message}")
+                _print_log_lines(logs)
             else:
                 console.print("No logs found", style="yellow")
 
@@ -1028,15 +1073,9 @@ def cypher_query(ctx, query, file, columns, output, limit, start, depth, order,
             raise click.BadParameter("Cannot specify both query argument and --file option")
         elif file:
             try:
-                with open(file, 'r', encoding='utf-8') as f:
-                    query = f.read().strip()
-                # Remove comments and clean up multiline query
-                lines = []
-                for line in query.split('\n'):
-                    line = line.strip()
-                    if line and not line.startswith('//'):
-                        lines.append(line)
-                query = ' '.join(lines)
+                query = Path(file).read_text(encoding='utf-8')
+                # Remove comments and clean up multiline query in a single pass
+                query = ' '.join(s for s in (ln.strip() for ln in query.splitlines()) if s and not s.startswith('//'))
             except Exception as e:
                 raise click.BadParameter(f"Failed to read query file: {e}")
         elif not query:
@@ -1055,8 +1094,10 @@ def cypher_query(ctx, query, file, columns, output, limit, start, depth, order,
             'format': 'json'
         }
         
-        # Create cache key including all parameters that affect results
-        cache_key = f"{query}_{columns_norm}_{start}_{limit}_{depth}_{order}_{use_primary}"
+        # Create cache key including all parameters that affect results; hashed so
+        # multi-KB queries don't become multi-KB keys
+        key_material = f"{query}\x00{columns_norm}\x00{start}\x00{limit}\x00{depth}\x00{order}\x00{use_primary}".encode()
+        cache_key = hashlib.blake2b(key_material, digest_size=16).hexdigest()
         
         cached_result = None
         if client.cache_manager and not no_cache:
@@ -1066,12 +1107,15 @@ def cypher_query(ctx, query, file, columns, output, limit, start, depth, order,
         if not cached_result:
             base_url = client.get_base_url('asm')
             # Build URL with all query parameters
-            param_string = '&'.join([f"{k}={v}" for k, v in query_params.items()])
-            url = f"{base_url}?{param_string}"
+            url = f"{base_url}?{urlencode(query_params)}"
             body = {"columns": columns_parsed, "cypher": query}
+            # Piped compact JSON with nothing to cache: stream the body through without a parse/dump round trip
+            passthrough = (use_json and not _stdout_isatty() and os.environ.get('R7_JSON_COMPACT') == '1'
+                           and (no_cache or not client.cache_manager))
             if use_json:
-                response = client.make_request("POST", url, data=body)
+                response = client.make_request("POST", url, data=body, stream=passthrough)
             else:
+                from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
                 with Progress(
                     SpinnerColumn(),
                     TextColumn("Executing Cypher query..."),
@@ -1081,13 +1125,19 @@ def cypher_query(ctx, query, file, columns, output, limit, start, depth, order,
                     response = client.make_request("POST", url, data=body)
             if response.status_code != 200:
                 raise APIError(f"Query failed: {response.status_code} - {response.text}")
-            data = response.json()
+            if passthrough:
+                try:
+                    json_fast.write_raw(response.iter_content(chunk_size=65536))
+                finally:
+                    response.close()
+                return
+            data = _loads(response)
             if client.cache_manager and not no_cache:
                 client.cache_manager.set('cypher_query', cache_key, data)
         else:
             data = cached_result
         if use_json:
-            click.echo(json.dumps(data, indent=2))
+            _emit_json(data)
         else:
             if 'items' in data and data['items']:
                 columns_config = columns_parsed or []
@@ -1117,27 +1167,25 @@ def cypher_query(ctx, query, file, columns, output, limit, start, depth, order,
                         # Fallback to generic headers if parsing failed or length mismatch
                         col_headers = [f"Value {i+1}" for i in range(inferred_len)]
 
+                from rich.table import Table
                 table = Table(title="ASM Query Results")
                 for header in col_headers:
                     table.add_column(header, style="cyan")
 
                 # Display all items (API already limited by --limit parameter)
+                header_count = len(col_headers)
                 for item in data['items']:
                     row_data = item.get('data', [])
                     if not isinstance(row_data, list):
                         row_data = [row_data]
 
-                    pretty_cells = []
-                    for cell in row_data[: len(col_headers)]:
-                        if cell is None:
-                            pretty_cells.append('')
-                        elif isinstance(cell, list):
-                            pretty_cells.append(', '.join([str(x) for x in cell]))
-                        else:
-                            pretty_cells.append(str(cell))
-                    # Pad if fewer cells than headers
-                    if len(pretty_cells) < len(col_headers):
-                        pretty_cells.extend([''] * (len(col_headers) - len(pretty_cells)))
+                    pretty_cells = [
+                        '' if cell is None else ', '.join(map(str, cell)) if isinstance(cell, list) else str(cell)
+                        for cell in row_data[:header_count]
+                    ]
+                    # Short rows come out padded with blanks
+                    if len(pretty_cells) < header_count:
+                        pretty_cells.extend([''] * (header_count - len(pretty_cells)))
                     table.add_row(*pretty_cells)
 
                 console.print(table)
@@ -1153,8 +1201,6 @@ def cypher_query(ctx, query, file, columns, output, limit, start, depth, order,
 def cypher_docs():
     """Show Cypher DSL reference guide"""
     try:
-        from pathlib import Path
-        
         # Get the path to the Cypher reference file
         current_dir = Path(__file__).parent.parent
         cypher_file = current_dir / 'docs/cypher-dsl.md'
@@ -1174,14 +1220,100 @@ def cypher_docs():
         click.echo(f"❌ Error displaying Cypher help: {e}", err=True)
 
 
+def _parse_example(content, filename):
+    """Parse a .cypher example file into its metadata dict, or None if it has no query."""
+    lines = content.strip().splitlines()
+    title = ""
+    description = ""
+    columns = []
+    query_lines = []
+    
+    comment_count = 0
+    for line in lines:
+        if line.startswith('//'):
+            comment = line[2:].strip()
+            if comment:
+                if not title:
+                    title = comment
+                    comment_count += 1
+                elif comment_count == 1:
+                    description = comment
+                    comment_count += 1
+                elif comment.startswith('Columns:'):
+                    # Extract columns from comment
+                    cols_str = comment[8:].strip()
+                    if cols_str and cols_str != '[]':
+                        try:
+                            columns = json.loads(cols_str)
+                        except:
+                            columns = []
+        elif line.strip() and not line.startswith('//'):
+            query_lines.append(line.strip())
+    
+    # Join query lines
+    query = ' '.join(query_lines)
+    if not query:
+        return None
+    
+    # Get stem from filename (remove .cypher extension)
+    file_stem = filename.replace('.cypher', '')
+    return {
+        "title": title or file_stem.replace('_', ' ').title(),
+        "description": description,
+        "query": query,
+        "columns": columns,
+        "filename": filename
+    }
+
+def _example_commands(example):
+    """Build the (inline, file reference) `r7 asm cypher query` command lines for an example."""
+    columns_arg = f" --columns '{json.dumps(example['columns'])}'" if example['columns'] else ""
+    return (
+        f"r7 asm cypher query \"{example['query']}\"{columns_arg}",
+        f"r7 asm cypher query -f examples/asm/{example['filename']}{columns_arg}",
+    )
+
+# Parsed examples per (path, mtime) signature, so repeat loads in one process skip the parse
+_examples_memo = {}
+
+def _load_examples(cypher_files):
+    """Parse example files, reusing an earlier parse in this process while no file has changed.
+    Returns (examples, commands) where commands[i] is _example_commands(examples[i]).
+    """
+    try:
+        sig = tuple((str(f), f.stat().st_mtime_ns) for f in cypher_files)
+    except (AttributeError, OSError):
+        sig = None
+    if sig in _examples_memo:
+        return _examples_memo[sig]
+    
+    examples = []
+    complete = True
+    for cypher_file in cypher_files:
+        try:
+            example = _parse_example(cypher_file.read_text(encoding='utf-8'), cypher_file.name)
+        except Exception as e:
+            complete = False
+            file_display = getattr(cypher_file, 'name', str(cypher_file))
+            click.echo(f"⚠️  Failed to read {file_display}: {e}", err=True)
+            continue
+        if example:
+            examples.append(example)
+    
+    commands = [_example_commands(e) for e in examples]
+    
+    if sig is not None and complete:
+        _examples_memo[sig] = examples, commands
+    return examples, commands
+
 @cypher_group.command(name='examples')
 @click.option('--output', type=click.Choice(['table', 'json', 'plain', 'cmd']), default='plain', help='How to display the examples')
 @click.option('--test', is_flag=True, help='Execute each example and report results')
+@click.option('--concurrency', type=int, default=8, show_default=True, help='Number of examples to run in parallel with --test')
+@click.option('--use-cache', is_flag=True, help='With --test, reuse results cached by earlier runs (marked as cached) instead of re-running them')
 @click.pass_context
-def cypher_examples(ctx, output, test):
+def cypher_examples(ctx, output, test, concurrency, use_cache):
     """List and test Cypher query examples from files"""
-    from pathlib import Path
-    
     # Load examples from .cypher files
     try:
         import importlib.resources as resources
@@ -1202,8 +1334,6 @@ def cypher_examples(ctx, output, test):
         click.echo(f"❌ Error accessing examples: {e}", err=True)
         return
     
-    examples = []
-    
     # Read all .cypher files in order
     if 'examples_package' in locals():
         # Using importlib.resources (installed package)
@@ -1212,64 +1342,7 @@ def cypher_examples(ctx, output, test):
         # Using filesystem (development mode)
         cypher_files = sorted(examples_files, key=lambda x: x.name)
     
-    for cypher_file in cypher_files:
-        try:
-            # Handle both importlib.resources and filesystem paths
-            if 'examples_package' in locals():
-                # Using importlib.resources (installed package)
-                content = cypher_file.read_text(encoding='utf-8')
-                filename = cypher_file.name
-            else:
-                # Using filesystem (development mode)
-                with open(cypher_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                filename = cypher_file.name
-                
-            # Parse the file to extract metadata and query
-            lines = content.strip().split('\n')
-            title = ""
-            description = ""
-            columns = []
-            query_lines = []
-            
-            comment_count = 0
-            for line in lines:
-                if line.startswith('//'):
-                    comment = line[2:].strip()
-                    if comment:
-                        if not title:
-                            title = comment
-                            comment_count += 1
-                        elif comment_count == 1:
-                            description = comment
-                            comment_count += 1
-                        elif comment.startswith('Columns:'):
-                            # Extract columns from comment
-                            cols_str = comment[8:].strip()
-                            if cols_str and cols_str != '[]':
-                                try:
-                                    columns = json.loads(cols_str)
-                                except:
-                                    columns = []
-                elif line.strip() and not line.startswith('//'):
-                    query_lines.append(line.strip())
-            
-            # Join query lines
-            query = ' '.join(query_lines)
-            
-            if query:
-                # Get stem from filename (remove .cypher extension)
-                file_stem = filename.replace('.cypher', '')
-                examples.append({
-                    "title": title or file_stem.replace('_', ' ').title(),
-                    "description": description,
-                    "query": query,
-                    "columns": columns,
-                    "filename": filename
-                })
-        except Exception as e:
-            file_display = getattr(cypher_file, 'name', str(cypher_file))
-            click.echo(f"⚠️  Failed to read {file_display}: {e}", err=True)
+    examples, commands = _load_examples(cypher_files)
     
     if not examples:
         click.echo("No examples found", err=True)
@@ -1280,98 +1353,147 @@ def cypher_examples(ctx, output, test):
         client, _ = get_client_and_config(ctx)
         base_url = client.get_base_url('asm')
         
-        results = []
+        url = f"{base_url}?format=json&limit=10"
+        
+        # Every run stores its results; only --use-cache reads them back
+        store_results = client.cache_manager is not None
+        use_cache = use_cache and store_results
+        
+        def example_cache_key(e):
+            key_material = f"{e['query']}\x00{json.dumps(e['columns'], sort_keys=True)}".encode()
+            return hashlib.blake2b(key_material, digest_size=16).hexdigest()
+        
+        def status_for(data):
+            items = len(data.get('items', [])) if isinstance(data, dict) else 0
+            return "✓" if items > 0 else "empty"
+        
+        def run_one(e):
+            body = {"columns": e["columns"], "cypher": e["query"]}
+            data = None
+            try:
+                response = client.make_request("POST", url, data=body)
+                if response.status_code != 200:
+                    status = f"HTTP {response.status_code}"
+                else:
+                    data = _loads(response)
+                    status = status_for(data)
+            except Exception as ex:
+                status = f"error: {ex}"
+            return {
+                "title": e['title'], 
+                "status": status,
+                "filename": e['filename']
+            }, data
+        
+        # Examples are independent network round-trips, so run them concurrently
+        from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+        results = [None] * len(examples)
+        pending = list(range(len(examples)))
+        cache_keys = {i: example_cache_key(e) for i, e in enumerate(examples)} if store_results else {}
+        if use_cache:
+            # Cache lookups stay on this thread; only misses go to the pool
+            pending = []
+            for i, e in enumerate(examples):
+                cached = client.cache_manager.get('cypher_example', cache_keys[i])
+                if cached is None:
+                    pending.append(i)
+                else:
+                    results[i] = {"title": e['title'], "status": status_for(cached), "filename": e['filename'], "cached": True}
+        
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             TimeElapsedColumn(),
         ) as progress:
-            task = progress.add_task("Testing examples...", total=len(examples))
+            task = progress.add_task("Testing examples...", total=len(examples), completed=len(examples) - len(pending))
             
-            for e in examples:
-                url = f"{base_url}?format=json&limit=10"
-                body = {"columns": e["columns"], "cypher": e["query"]}
-                try:
-                    response = client.make_request("POST", url, data=body)
-                    if response.status_code != 200:
-                        results.append({
-                            "title": e['title'], 
-                            "status": f"HTTP {response.status_code}",
-                            "filename": e['filename']
-                        })
-                    else:
-                        data = response.json()
-                        items = len(data.get('items', [])) if isinstance(data, dict) else 0
-                        results.append({
-                            "title": e['title'], 
-                            "status": "✓" if items > 0 else "empty",
-                            "filename": e['filename']
-                        })
-                except Exception as ex:
-                    results.append({
-                        "title": e['title'], 
-                        "status": f"error: {ex}",
-                        "filename": e['filename']
-                    })
-                progress.advance(task)
+            with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(pending)))) as executor:
+                futures = {executor.submit(run_one, examples[i]): i for i in pending}
+                for future in as_completed(futures):
+                    i = futures[future]
+                    results[i], data = future.result()
+                    # Only successful responses are cached, so failures are retried next run
+                    if store_results and data is not None:
+                        client.cache_manager.set('cypher_example', cache_keys[i], data)
+                    progress.advance(task)
         
         # Display test results
         if output == 'json':
-            click.echo(json.dumps(results, indent=2))
+            _emit_json(results)
         else:
-            table = Table(title="Cypher Examples Test Results")
-            table.add_column("File", style="cyan")
-            table.add_column("Title", style="white")
-            table.add_column("Status", style="green")
+            table = OutputFormatter.create_standard_table("Cypher Examples Test Results", _EXAMPLE_TEST_COLUMNS)
             
             for r in results:
                 status_style = "green" if r['status'] == "✓" else "yellow" if r['status'] == "empty" else "red"
-                table.add_row(r['filename'], r['title'], f"[{status_style}]{r['status']}[/{status_style}]")
+                cached_marker = " [dim](cached)[/dim]" if r.get('cached') else ""
+                table.add_row(r['filename'], r['title'], f"[{status_style}]{r['status']}[/{status_style}]{cached_marker}")
             console.print(table)
         return
     
     # Display mode
     if output == 'json':
-        click.echo(json.dumps(examples, indent=2))
+        _emit_json(examples)
     elif output == 'cmd':
-        for e in examples:
-            if e['columns']:
-                click.echo(f"r7 asm cypher query -f examples/asm/{e['filename']} --columns '{json.dumps(e['columns'])}'")
-            else:
-                click.echo(f"r7 asm cypher query -f examples/asm/{e['filename']}")
+        # Build the whole listing first so it goes out in a single write
+        buf = [f"{by_file}\n" for _, by_file in commands]
+        click.echo(''.join(buf), nl=False)
     elif output == 'table':
-        table = Table(title="ASM Cypher Examples")
-        table.add_column("File", style="cyan")
-        table.add_column("Title", style="white")
-        table.add_column("Description", style="yellow")
+        table = OutputFormatter.create_standard_table("ASM Cypher Examples", _EXAMPLES_COLUMNS)
         
         for e in examples:
             table.add_row(e['filename'], e['title'], e['description'] or "")
         console.print(table)
     else:  # plain
-        for i, e in enumerate(examples, 1):
-            click.echo(f"{i}. {e['title']}")
+        buf = []
+        for i, (e, (inline, by_file)) in enumerate(zip(examples, commands), 1):
+            buf.append(f"{i}. {e['title']}\n")
             if e['description']:
-                click.echo(f"   {e['description']}")
-            click.echo("")
+                buf.append(f"   {e['description']}\n")
+            buf.append("\n")
             
             # Show direct query command if short enough, otherwise use file reference
-            if len(e['query']) < 150:  # Short queries can be shown inline
-                if e['columns']:
-                    click.echo(f"   r7 asm cypher query \"{e['query']}\" --columns '{json.dumps(e['columns'])}'")
-                else:
-                    click.echo(f"   r7 asm cypher query \"{e['query']}\"")
-            else:  # Long queries use file reference
-                if e['columns']:
-                    click.echo(f"   r7 asm cypher query -f examples/asm/{e['filename']} --columns '{json.dumps(e['columns'])}'")
-                else:
-                    click.echo(f"   r7 asm cypher query -f examples/asm/{e['filename']}")
-            click.echo()
+            # Short queries can be shown inline, long ones use the file reference
+            buf.append(f"   {inline if len(e['query']) < 150 else by_file}\n")
+            buf.append("\n")
+        click.echo(''.join(buf), nl=False)
+
+def _print_log_lines(logs):
+    """Print execution log entries as coloured HH:MM:SS lines in a single console write."""
+    lines = []
+    for log in logs:
+        timestamp = log.get('timestamp', '')
+        content = log.get('content', {})
+        message = content.get('message', '')
+        level = content.get('level', 'INFO')
+
+        # Format timestamp
+        try:
+            dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+            time_str = f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+        except:
+            time_str = timestamp[:8] if timestamp else ''
+
+        # Color by level
+        if level == 'ERROR':
+            lines.append(f"[red]{time_str}[/red] {message}")
+        elif level == 'WARNING':
+            lines.append(f"[yellow]{time_str}[/yellow] {message}")
+        else:
+            lines.append(f"[dim]{time_str}[/dim] {message}")
+    # Each line is still parsed for markup on its own, so a stray tag can't bleed into the next
+    console.print(*lines, sep='\n')
 
 def _run_surcom_command(ctx, command, args=None):
-    """Helper to run surcom SDK commands"""
+    """Helper to run surcom SDK commands.
+    On POSIX the r7 process is replaced by surcom via exec, so this does not return.
+    """
     try:
         cmd = ['surcom'] + ([command] if command else []) + (list(args) if args else [])
+        if os.name == 'posix':
+            # Pure passthrough: hand the terminal to surcom instead of waiting on a child
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.execvp('surcom', cmd)
         result = subprocess.run(cmd, text=True)
         if result.returncode != 0:
             ctx.exit(result.returncode)
@@ -1,11 +1,12 @@
+import types
 import click
-import json
-from utils.config import ConfigManager
+from utils.config import ConfigManager, get_config
 from utils.exceptions import ConfigurationError
-from commands.credential_commands import cred_group as _cred_group
+from utils import json_fast
+from utils.lazy import LazyGroup
 
-# Map CLI option names to config keys
-CONFIG_KEY_MAPPING = {
+# Map CLI option names to config keys (read-only)
+CONFIG_KEY_MAPPING = types.MappingProxyType({
     'output': 'default_output',
     'cache': 'cache_enabled',
     'cache_ttl': 'cache_ttl',
@@ -18,30 +19,31 @@ CONFIG_KEY_MAPPING = {
     'smart_columns': 'smart_columns_enabled',
     'smart_columns_max': 'smart_columns_max',
     'max_chars': 'max_chars'
-}
+})
 
-@click.group(name='config')
+# Shared click.Choice instances, also used by docs_commands
+_REGION_CHOICE = click.Choice(['us', 'eu', 'ca', 'ap', 'au'])
+_OUTPUT_CHOICE = click.Choice(['simple', 'table', 'json'])
+
+# Credential sub-commands load keyring, so they are only imported when `cred` is used
+@click.group(name='config', cls=LazyGroup,
+             lazy_subcommands={'cred': 'commands.credential_commands:cred_group'})
 def config_group():
     """manage local configuration"""
     pass
 
-# Attach credential sub-commands under config
-config_group.add_command(_cred_group, name='cred')
-
 
 @config_group.command()
 def show():
     """Show current configuration"""
     try:
-        config_manager = ConfigManager()
-        config_manager.validate()
-        click.echo(json.dumps(config_manager.config, indent=2))
+        json_fast.write(get_config().config)
     except ConfigurationError as e:
         click.echo(f"❌ Configuration error: {e}", err=True)
 
 @config_group.command()
-@click.option('--region', type=click.Choice(['us', 'eu', 'ca', 'ap', 'au']), help='Default region')
-@click.option('--output', type=click.Choice(['simple', 'table', 'json']), help='Default output format')
+@click.option('--region', type=_REGION_CHOICE, help='Default region')
+@click.option('--output', type=_OUTPUT_CHOICE, help='Default output format')
 @click.option('--max-pages', type=int, help='Default max pages for pagination')
 @click.option('--cache/--no-cache', default=None, help='Enable/disable caching')
 @click.option('--cache-ttl', type=int, help='Cache TTL in seconds')
@@ -56,25 +58,19 @@ def show():
 def set(**kwargs):
     """Set configuration values"""
     try:
-        config_manager = ConfigManager()
-        updates = {}
-        for cli_key, value in kwargs.items():
-            if value is not None:
-                config_key = CONFIG_KEY_MAPPING.get(cli_key, cli_key)
-                updates[config_key] = value
+        updates = {CONFIG_KEY_MAPPING.get(k, k): v for k, v in kwargs.items() if v is not None}
         
         if not updates:
             click.echo("❌ No configuration values provided to set")
             click.echo("Use --help to see available options")
             return
         
-        config_manager.update(updates)
-        config_manager.validate()
-        config_manager.save_config()
-        click.echo("✅ Configuration updated successfully")
-        click.echo("Updated values:")
-        for key, value in updates.items():
-            click.echo(f" {key}: {value}")
+        ConfigManager().update_many(updates)
+        get_config.cache_clear()
+        # One write for the whole confirmation instead of a flush per line
+        lines = ["✅ Configuration updated successfully", "Updated values:"]
+        lines.extend(f" {key}: {value}" for key, value in updates.items())
+        click.echo("\n".join(lines))
     except ConfigurationError as e:
         click.echo(f"❌ Configuration error: {e}", err=True)
 
@@ -86,6 +82,7 @@ def reset():
             config_manager = ConfigManager()
             config_manager.reset_to_defaults()
             config_manager.save_config()
+            get_config.cache_clear()
             click.echo("✅ Configuration reset to defaults")
         except ConfigurationError as e:
             click.echo(f"❌ Error resetting configuration: {e}", err=True)
@@ -94,8 +91,7 @@ def reset():
 def validate():
     """Validate current configuration"""
     try:
-        config_manager = ConfigManager()
-        config_manager.validate()
+        get_config()
         click.echo("✅ Configuration is valid")
     except ConfigurationError as e:
         click.echo(f"❌ Configuration error: {e}", err=True)
@@ -108,8 +104,7 @@ def test(ctx):
         from api.client import Rapid7Client
         from utils.credentials import CredentialManager
         
-        config_manager = ConfigManager()
-        config_manager.validate()
+        config_manager = get_config()
         
         api_key = CredentialManager.get_api_key()
         if not api_key:
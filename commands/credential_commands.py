@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 import click
 from utils.credentials import CredentialManager
 from utils.exceptions import AuthenticationError
@@ -94,11 +95,12 @@ def vm_delete_password():
 @vm_cred_group.command(name='status')
 def vm_status():
     """Show stored VM username and whether a password is stored"""
-    cfg = ConfigManager()
-    user = cfg.get('vm_username')
-    pwd = CredentialManager.get_vm_password()
-    if user:
-        click.echo(f"👤 VM username: {user}")
-    else:
-        click.echo("👤 VM username: not set")
-    click.echo(f"🔐 VM password: {'stored' if pwd else 'not stored'}")
\ No newline at end of file
+    # The keychain lookup is the slow part; overlap it with the config file parse
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pwd_future = pool.submit(CredentialManager.get_vm_password)
+        user = ConfigManager().get('vm_username')
+        pwd = pwd_future.result()
+    click.echo(
+        f"👤 VM username: {user or 'not set'}\n"
+        f"🔐 VM password: {'stored' if pwd else 'not stored'}"
+    )
\ No newline at end of file
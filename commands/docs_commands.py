@@ -1,73 +1,83 @@
-import json
+import os
 import sys
 import click
-from rich.console import Console
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
-from api.client import DocsClient
-from utils.config import ConfigManager
-from utils.cache import CacheManager
+from utils.config import get_config
 from utils.exceptions import *
-console = Console()
+from utils import json_fast
+from commands.config_commands import _OUTPUT_CHOICE
 @click.command(name='docs')
 @click.argument('search_query')
 @click.option('--limit', default=15, type=int, help='Maximum number of results to return (default: 15)')
-@click.option('--output', type=click.Choice(['simple', 'table', 'json']), help='Output format')
+@click.option('--output', type=_OUTPUT_CHOICE, help='Output format')
 @click.option('--no-cache', is_flag=True, help='Disable caching for this search')
 @click.pass_context
 def docs(ctx, search_query, limit, output, no_cache):
     """search docs.rapid7.com content"""
     try:
-        config_manager = ConfigManager()
-        config_manager.validate()
+        config_manager = get_config()
+        if not search_query.strip():
+            click.echo("❌ Empty search query", err=True)
+            return
+      
+        # Heavier imports wait until the config is known to be usable
+        from rich.console import Console
+        from utils.cache import CacheManager
+        from utils.keys import docs_search_key
+        console = Console()
       
         cache_manager = None
+        results = None
         if config_manager.get('cache_enabled') and not no_cache:
             cache_manager = CacheManager(ttl=config_manager.get('cache_ttl'))
-      
-        docs_client = DocsClient(cache_manager)
+            # A hit skips the HTTP client (and its imports) entirely
+            results = cache_manager.get('docs_search', docs_search_key(search_query, limit))
       
         # Determine output format
+        is_tty = sys.stdout.isatty()
         if output:
             use_format = output
-        elif not sys.stdout.isatty(): # Piped output
+        elif not is_tty: # Piped output
             use_format = 'simple'
         else:
             use_format = config_manager.get('default_output', 'simple')
       
-        # Perform search
-        if use_format != 'json':
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("Searching documentation..."),
-                TimeElapsedColumn(),
-            ) as progress:
-                task = progress.add_task("Searching...", total=None)
+        # Perform search unless the cache already answered
+        if not results:
+            from api.client import DocsClient
+            docs_client = DocsClient(cache_manager)
+            # The spinner only runs where there is a real terminal to draw on
+            if use_format != 'json' and is_tty and os.environ.get('TERM') != 'dumb':
+                from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+                with Progress(
+                    SpinnerColumn(),
+                    TextColumn("Searching documentation..."),
+                    TimeElapsedColumn(),
+                    transient=True,
+                    refresh_per_second=4,
+                ) as progress:
+                    task = progress.add_task("Searching...", total=None)
+                    results = docs_client.search_docs(search_query, limit)
+            else:
                 results = docs_client.search_docs(search_query, limit)
-        else:
-            results = docs_client.search_docs(search_query, limit)
       
         # Display results
         if use_format == 'json':
-            click.echo(json.dumps(results, indent=2))
+            json_fast.write(results)
         elif use_format == 'table':
             if results:
+                from rich.table import Table
                 table = Table(title=f"Documentation Search: '{search_query}'")
                 table.add_column("Title", style="cyan", width=40)
                 table.add_column("Product", style="yellow", width=15)
                 table.add_column("URL", style="blue", no_wrap=False)
               
-                for result in results:
-                    # Truncate title if too long
-                    title = result['title']
-                    if len(title) > 37:
-                        title = title[:34] + "..."
-                  
-                    table.add_row(
-                        title,
-                        result['product'],
-                        result['url']
-                    )
+                # Truncate long titles to fit the 40-wide column
+                rows = [
+                    (title[:34] + "..." if len(title := result['title']) > 37 else title, result['product'], result['url'])
+                    for result in results
+                ]
+                for row in rows:
+                    table.add_row(*row)
               
                 console.print(table)
               
@@ -77,8 +87,7 @@ def docs(ctx, search_query, limit, output, no_cache):
                 console.print("No documentation found matching your search", style="yellow")
         else: # simple format
             if results:
-                for result in results:
-                    click.echo(f"{result['title']} - {result['url']}")
+                click.echo(''.join(f"{result['title']} - {result['url']}\n" for result in results), nl=False)
             else:
                 click.echo("No documentation found matching your search")
               
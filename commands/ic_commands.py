@@ -1,10 +1,89 @@
+import functools
+import os
 import sys
+import types
 import click
-from rich.console import Console
 
-from utils.cli import ClientManager, OutputFormatter, common_output_options, error_handler
-
-console = Console()
+from utils.cli import ClientManager, OutputFormatter, cached_or_fetch, common_output_options, error_handler
+from utils import json_fast
+
+
+# Lets list/get commands answer from a recently expired cache entry while refreshing it
+_max_stale_option = click.option('--max-stale', default=0, type=int, metavar='SEC',
+                                 help='Serve a cached result up to SEC seconds past expiry and refresh it in the background. '
+                                      'Output appears sooner, but the command still waits for the refresh before exiting')
+
+# Shared read-only stand-in for a missing workflow version
+_EMPTY = types.MappingProxyType({})
+
+
+@functools.lru_cache(maxsize=1)
+def _get_console():
+    """Console shared by the table formatters, built on first use."""
+    from rich.console import Console
+    return Console()
+
+
+# Column specs for OutputFormatter.create_standard_table
+_FIELD_COLUMNS = (
+    {'name': 'Field', 'style': 'cyan'},
+    {'name': 'Value', 'style': 'white'},
+)
+_WORKFLOW_COLUMNS = (
+    {'name': 'ID', 'style': 'cyan'},
+    {'name': 'Name', 'style': 'white'},
+    {'name': 'State', 'style': 'green'},
+    {'name': 'Tags', 'style': 'yellow'},
+)
+_JOB_COLUMNS = (
+    {'name': 'Job ID', 'style': 'cyan'},
+    {'name': 'Name', 'style': 'white'},
+    {'name': 'Status', 'style': 'green'},
+    {'name': 'Duration (s)', 'style': 'yellow'},
+)
+_GA_COLUMNS = (
+    {'name': 'ID', 'style': 'cyan'},
+    {'name': 'Name', 'style': 'white'},
+    {'name': 'Tags', 'style': 'green'},
+    {'name': 'Entities', 'style': 'yellow'},
+)
+_GA_ENTITY_COLUMNS = (
+    {'name': 'ID', 'style': 'cyan'},
+    {'name': 'Data', 'style': 'white'},
+    {'name': 'Updated At', 'style': 'yellow'},
+)
+
+# Where an execute response may carry the job id: { data: { job: { jobId } } }, { jobId }, { data: { jobId } }
+_JOBID_PATHS = (('data', 'job', 'jobId'), ('jobId',), ('data', 'jobId'))
+
+
+def _dig(d, path):
+    """Follow path through nested dicts, returning None as soon as a step is missing."""
+    for key in path:
+        if not isinstance(d, dict):
+            return None
+        d = d.get(key)
+    return d
+
+
+@functools.lru_cache(maxsize=512)
+def _join_tags(tags):
+    """Comma-join a tag tuple; the same few tag sets recur across rows."""
+    return ", ".join(tags)
+
+
+class _FieldBuffer:
+    """Collects Field/Value rows for a single record and renders them as one table."""
+    def __init__(self, title):
+        self.title = title
+        self.rows = []
+    def add(self, field, value):
+        self.rows.append((field, value))
+    def flush(self):
+        table = OutputFormatter.create_standard_table(self.title, _FIELD_COLUMNS)
+        for row in self.rows:
+            table.add_row(*row)
+        _get_console().print(table)
 
 
 @click.group(name='ic')
@@ -26,47 +105,38 @@ def workflows_group():
 @click.option('--limit', default=30, type=int, help='Number of items (max 30)')
 @click.option('--offset', default=0, type=int, help='Offset for pagination')
 @common_output_options
+@_max_stale_option
 @click.pass_context
 @error_handler
-def list_workflows(ctx, limit, offset, output, no_cache):
+def list_workflows(ctx, limit, offset, output, no_cache, max_stale):
     """List workflows"""
     client, config_manager = ClientManager().get_client_and_config(ctx, cache_namespace='ic')
 
-    cache_key = f"workflows_{limit}_{offset}"
-    def fetch():
-        return client.ic_list_workflows(limit=limit, offset=offset)
-
-    data = None
-    if client.cache_manager and not no_cache:
-        data = client.cache_manager.get('ic', cache_key)
-        if data:
-            OutputFormatter.display_cached_message()
-    if not data:
-        data = fetch()
-        if client.cache_manager and not no_cache:
-            client.cache_manager.set('ic', cache_key, data)
+    cache_key = ('workflows', limit, offset)
+    data = cached_or_fetch(client, 'ic', cache_key, no_cache,
+                           lambda: client.ic_list_workflows(limit=limit, offset=offset), max_stale=max_stale)
 
     def table_fmt(d):
         payload = d.get('data', d)
         items = payload.get('workflows', payload) if isinstance(payload, dict) else payload
         if not items:
-            console.print("No workflows found", style="yellow")
+            _get_console().print("No workflows found", style="yellow")
             return
-        table = OutputFormatter.create_standard_table("InsightConnect Workflows", [
-            {'name': 'ID', 'style': 'cyan'},
-            {'name': 'Name', 'style': 'white'},
-            {'name': 'State', 'style': 'green'},
-            {'name': 'Tags', 'style': 'yellow'},
-        ])
+        table = OutputFormatter.create_standard_table("InsightConnect Workflows", _WORKFLOW_COLUMNS)
+        rows = []
         for wf in items:
             # workflow shape may already be flattened or under keys
             wf_id = wf.get('workflowId') or wf.get('id')
             state = wf.get('state', '')
             # name could be on publishedVersion or unpublishedVersion
-            name = (wf.get('publishedVersion') or {}).get('name') or (wf.get('unpublishedVersion') or {}).get('name') or wf.get('name', '')
-            tags = (wf.get('publishedVersion') or {}).get('tags') or (wf.get('unpublishedVersion') or {}).get('tags') or []
-            table.add_row(str(wf_id or ''), str(name or ''), str(state or ''), ", ".join(tags) if isinstance(tags, list) else str(tags))
-        console.print(table)
+            pub = wf.get('publishedVersion') or _EMPTY
+            unp = wf.get('unpublishedVersion') or _EMPTY
+            name = pub.get('name') or unp.get('name') or wf.get('name') or ''
+            tags = pub.get('tags') or unp.get('tags') or ()
+            rows.append((str(wf_id or ''), str(name), str(state or ''), _join_tags(tuple(tags)) if isinstance(tags, (list, tuple)) else str(tags)))
+        for row in rows:
+            table.add_row(*row)
+        _get_console().print(table)
 
     def simple_fmt(d):
         payload = d.get('data', d)
@@ -74,10 +144,12 @@ def list_workflows(ctx, limit, offset, output, no_cache):
         if not items:
             click.echo("No workflows found")
             return
+        lines = []
         for wf in items:
             wf_id = wf.get('workflowId') or wf.get('id')
-            name = (wf.get('publishedVersion') or {}).get('name') or (wf.get('unpublishedVersion') or {}).get('name') or wf.get('name', '')
-            click.echo(f"{name} {wf_id}")
+            name = (wf.get('publishedVersion') or _EMPTY).get('name') or (wf.get('unpublishedVersion') or _EMPTY).get('name') or wf.get('name', '')
+            lines.append(f"{name} {wf_id}")
+        click.echo("\n".join(lines))
 
     OutputFormatter.output_data(data, output, config_manager, table_formatter=table_fmt, simple_formatter=simple_fmt)
 
@@ -85,38 +157,28 @@ def list_workflows(ctx, limit, offset, output, no_cache):
 @workflows_group.command(name='get')
 @click.argument('workflow_id')
 @common_output_options
+@_max_stale_option
 @click.pass_context
 @error_handler
-def get_workflow(ctx, workflow_id, output, no_cache):
+def get_workflow(ctx, workflow_id, output, no_cache, max_stale):
     """Get a workflow by ID"""
     client, config_manager = ClientManager().get_client_and_config(ctx, cache_namespace='ic')
-    cache_key = f"workflow_{workflow_id}"
-    def fetch():
-        return client.ic_get_workflow(workflow_id)
-
-    data = None
-    if client.cache_manager and not no_cache:
-        data = client.cache_manager.get('ic', cache_key)
-        if data:
-            OutputFormatter.display_cached_message()
-    if not data:
-        data = fetch()
-        if client.cache_manager and not no_cache:
-            client.cache_manager.set('ic', cache_key, data)
+    cache_key = ('workflow', workflow_id)
+    data = cached_or_fetch(client, 'ic', cache_key, no_cache,
+                           lambda: client.ic_get_workflow(workflow_id), max_stale=max_stale)
 
     def table_fmt(d):
         wf = d.get('data', d)
-        table = OutputFormatter.create_standard_table(f"Workflow {workflow_id}", [
-            {'name': 'Field', 'style': 'cyan'},
-            {'name': 'Value', 'style': 'white'},
-        ])
-        name = (wf.get('publishedVersion') or {}).get('name') or (wf.get('unpublishedVersion') or {}).get('name') or wf.get('name', '')
+        buf = _FieldBuffer(f"Workflow {workflow_id}")
+        pub = wf.get('publishedVersion') or _EMPTY
+        unp = wf.get('unpublishedVersion') or _EMPTY
+        name = pub.get('name') or unp.get('name') or wf.get('name', '')
         state = wf.get('state', '')
         rrn = wf.get('rrn', '')
-        table.add_row('Name', str(name))
-        table.add_row('State', str(state))
-        table.add_row('RRN', str(rrn))
-        console.print(table)
+        buf.add('Name', str(name))
+        buf.add('State', str(state))
+        buf.add('RRN', str(rrn))
+        buf.flush()
 
     OutputFormatter.output_data(data, output, config_manager, table_formatter=table_fmt)
 
@@ -136,48 +198,42 @@ def run_workflow(ctx, workflow_id, params_, wait, timeout, interval, output, no_
 
     # Convert --param key=value pairs into a dict
     body = {}
-    for kv in params_:
-        if '=' not in kv:
-            raise click.BadParameter(f"Invalid --param '{kv}', expected key=value")
-        k, v = kv.split('=', 1)
-        body.setdefault('parameters', {}).setdefault('values', {})[k] = v
+    if params_:
+        values = body.setdefault('parameters', {}).setdefault('values', {})
+        for kv in params_:
+            k, sep, v = kv.partition('=')
+            if not sep:
+                raise click.BadParameter(f"Invalid --param '{kv}', expected key=value")
+            values[k] = v
 
     resp = client.ic_execute_workflow(workflow_id, body or None)
 
     # Attempt to find jobId in common places
-    job_id = None
-    try:
-        # sometimes returns { data: { job: { jobId } } } or { jobId } directly
-        job_id = resp.get('data', {}).get('job', {}).get('jobId') or resp.get('jobId')
-    except Exception:
-        job_id = None
+    job_id = next((v for path in _JOBID_PATHS if (v := _dig(resp, path))), None)
 
     if wait and job_id:
         resp = client.ic_wait_for_job(job_id, timeout=timeout, interval=interval)
 
     def table_fmt(d):
-        table = OutputFormatter.create_standard_table("Workflow Execution", [
-            {'name': 'Field', 'style': 'cyan'},
-            {'name': 'Value', 'style': 'white'},
-        ])
+        buf = _FieldBuffer("Workflow Execution")
         
         # Always show workflow ID
-        table.add_row('Workflow ID', str(workflow_id))
+        buf.add('Workflow ID', str(workflow_id))
         
         # Show execution status
         if d is None:
-            table.add_row('Status', 'Execution Started (202 Accepted)')
-            table.add_row('Response', 'Workflow execution accepted by server')
+            buf.add('Status', 'Execution Started (202 Accepted)')
+            buf.add('Response', 'Workflow execution accepted by server')
         else:
-            table.add_row('Status', 'Execution Response Received')
+            buf.add('Status', 'Execution Response Received')
         
         # Show job ID if found
         if job_id:
-            table.add_row('Job ID', str(job_id))
+            buf.add('Job ID', str(job_id))
             if not wait:
-                table.add_row('Next Step', f'Use: r7 ic jobs get {job_id}')
+                buf.add('Next Step', f'Use: r7 ic jobs get {job_id}')
         else:
-            table.add_row('Job ID', 'Not returned in response')
+            buf.add('Job ID', 'Not returned in response')
             
         # Show job details if available (when --wait is used)
         try:
@@ -186,11 +242,11 @@ def run_workflow(ctx, workflow_id, params_, wait, timeout, interval, output, no_
                 for field in ['status', 'name', 'duration', 'startedAt', 'endedAt']:
                     val = job.get(field, '')
                     if val:
-                        table.add_row(field, str(val))
+                        buf.add(field, str(val))
         except Exception:
             pass
             
-        console.print(table)
+        buf.flush()
 
     OutputFormatter.output_data(resp, output, config_manager, table_formatter=table_fmt)
 
@@ -206,15 +262,12 @@ def turn_on_workflow(ctx, workflow_id, output, no_cache):
     data = client.ic_activate_workflow(workflow_id)
     
     def table_fmt(d):
-        table = OutputFormatter.create_standard_table("Workflow Activation", [
-            {'name': 'Field', 'style': 'cyan'},
-            {'name': 'Value', 'style': 'white'},
-        ])
-        table.add_row('Workflow ID', str(workflow_id))
-        table.add_row('Status', 'Activated')
+        buf = _FieldBuffer("Workflow Activation")
+        buf.add('Workflow ID', str(workflow_id))
+        buf.add('Status', 'Activated')
         if isinstance(d, dict) and d.get('message'):
-            table.add_row('Message', str(d.get('message')))
-        console.print(table)
+            buf.add('Message', str(d.get('message')))
+        buf.flush()
     
     OutputFormatter.output_data(data, output, config_manager, table_formatter=table_fmt)
 
@@ -230,15 +283,12 @@ def turn_off_workflow(ctx, workflow_id, output, no_cache):
     data = client.ic_inactivate_workflow(workflow_id)
     
     def table_fmt(d):
-        table = OutputFormatter.create_standard_table("Workflow Deactivation", [
-            {'name': 'Field', 'style': 'cyan'},
-            {'name': 'Value', 'style': 'white'},
-        ])
-        table.add_row('Workflow ID', str(workflow_id))
-        table.add_row('Status', 'Deactivated')
+        buf = _FieldBuffer("Workflow Deactivation")
+        buf.add('Workflow ID', str(workflow_id))
+        buf.add('Status', 'Deactivated')
         if isinstance(d, dict) and d.get('message'):
-            table.add_row('Message', str(d.get('message')))
-        console.print(table)
+            buf.add('Message', str(d.get('message')))
+        buf.flush()
     
     OutputFormatter.output_data(data, output, config_manager, table_formatter=table_fmt)
 
@@ -252,6 +302,13 @@ def turn_off_workflow(ctx, workflow_id, output, no_cache):
 def export_workflow(ctx, workflow_id, exclude_config_details, output, no_cache):
     """Export a workflow definition."""
     client, config_manager = ClientManager().get_client_and_config(ctx, cache_namespace='ic')
+    
+    # Piped compact JSON (e.g. `R7_JSON_COMPACT=1 r7 ic workflows export ID > wf.json`) is the
+    # response body as-is; there is nothing to format, so skip the parse/re-serialise round trip
+    if output in (None, 'json') and not sys.stdout.isatty() and os.environ.get('R7_JSON_COMPACT') == '1':
+        json_fast.write_raw((client.ic_export_workflow_raw(workflow_id, exclude_config_details),))
+        return
+    
     data = client.ic_export_workflow(workflow_id, exclude_config_details)
     
     # Export should always default to JSON output since it's structured data to be used/saved
@@ -276,46 +333,32 @@ def jobs_group():
 @click.option('--offset', default=0, type=int, help='Offset for pagination')
 @click.option('--status', type=click.Choice(['queued', 'running', 'succeeded', 'failed', 'canceled', 'cancelled']), help='Filter by status')
 @common_output_options
+@_max_stale_option
 @click.pass_context
 @error_handler
-def list_jobs(ctx, limit, offset, status, output, no_cache):
+def list_jobs(ctx, limit, offset, status, output, no_cache, max_stale):
     """List jobs"""
     client, config_manager = ClientManager().get_client_and_config(ctx, cache_namespace='ic')
-    cache_key = f"jobs_{limit}_{offset}_{status or 'all'}"
-    def fetch():
-        return client.ic_list_jobs(limit=limit, offset=offset, status=status)
-
-    data = None
-    if client.cache_manager and not no_cache:
-        data = client.cache_manager.get('ic', cache_key)
-        if data:
-            OutputFormatter.display_cached_message()
-    if not data:
-        data = fetch()
-        if client.cache_manager and not no_cache:
-            client.cache_manager.set('ic', cache_key, data)
+    cache_key = ('jobs', limit, offset, status)
+    data = cached_or_fetch(client, 'ic', cache_key, no_cache,
+                           lambda: client.ic_list_jobs(limit=limit, offset=offset, status=status), max_stale=max_stale)
 
     def table_fmt(d):
         payload = d.get('data', d)
         items = payload.get('jobs', payload) if isinstance(payload, dict) else payload
         if not items:
-            console.print("No jobs found", style="yellow")
+            _get_console().print("No jobs found", style="yellow")
             return
-        table = OutputFormatter.create_standard_table("InsightConnect Jobs", [
-            {'name': 'Job ID', 'style': 'cyan'},
-            {'name': 'Name', 'style': 'white'},
-            {'name': 'Status', 'style': 'green'},
-            {'name': 'Duration (s)', 'style': 'yellow'},
-        ])
-        for jwrap in items:
-            job = jwrap.get('job', jwrap)
-            table.add_row(
-                str(job.get('jobId') or job.get('id', '')),
-                str(job.get('name', '')),
-                str(job.get('status', '')),
-                str(job.get('duration', '')),
-            )
-        console.print(table)
+        table = OutputFormatter.create_standard_table("InsightConnect Jobs", _JOB_COLUMNS)
+        jobs = [jwrap.get('job', jwrap) for jwrap in items]
+        rows = [
+            (str(job.get('jobId') or job.get('id', '')), str(job.get('name', '')),
+             str(job.get('status', '')), str(job.get('duration', '')))
+            for job in jobs
+        ]
+        for row in rows:
+            table.add_row(*row)
+        _get_console().print(table)
 
     def simple_fmt(d):
         payload = d.get('data', d)
@@ -323,9 +366,8 @@ def list_jobs(ctx, limit, offset, status, output, no_cache):
         if not items:
             click.echo("No jobs found")
             return
-        for jwrap in items:
-            job = jwrap.get('job', jwrap)
-            click.echo(f"{job.get('name','')} {job.get('jobId','')} {job.get('status','')}")
+        jobs = (jwrap.get('job', jwrap) for jwrap in items)
+        click.echo("\n".join(f"{job.get('name','')} {job.get('jobId','')} {job.get('status','')}" for job in jobs))
 
     OutputFormatter.output_data(data, output, config_manager, table_formatter=table_fmt, simple_formatter=simple_fmt)
 
@@ -336,36 +378,27 @@ def list_jobs(ctx, limit, offset, status, output, no_cache):
 @click.option('--timeout', default=600, type=int, help='Max seconds to wait when --wait is used')
 @click.option('--interval', default=3, type=int, help='Polling interval seconds')
 @common_output_options
+@_max_stale_option
 @click.pass_context
 @error_handler
-def get_job(ctx, job_id, wait, timeout, interval, output, no_cache):
+def get_job(ctx, job_id, wait, timeout, interval, output, no_cache, max_stale):
     """Get a job by ID"""
     client, config_manager = ClientManager().get_client_and_config(ctx, cache_namespace='ic')
     if wait:
         data = client.ic_wait_for_job(job_id, timeout=timeout, interval=interval)
     else:
-        cache_key = f"job_{job_id}"
-        data = None
-        if client.cache_manager and not no_cache:
-            data = client.cache_manager.get('ic', cache_key)
-            if data:
-                OutputFormatter.display_cached_message()
-        if not data:
-            data = client.ic_get_job(job_id)
-            if client.cache_manager and not no_cache:
-                client.cache_manager.set('ic', cache_key, data)
+        cache_key = ('job', job_id)
+        data = cached_or_fetch(client, 'ic', cache_key, no_cache,
+                               lambda: client.ic_get_job(job_id), max_stale=max_stale)
 
     def table_fmt(d):
         payload = d.get('data', d)
         jobwrap = payload.get('job', payload) if isinstance(payload, dict) else payload
         job = jobwrap.get('job', jobwrap) if isinstance(jobwrap, dict) else jobwrap
-        table = OutputFormatter.create_standard_table(f"Job {job.get('jobId','')}", [
-            {'name': 'Field', 'style': 'cyan'},
-            {'name': 'Value', 'style': 'white'},
-        ])
+        buf = _FieldBuffer(f"Job {job.get('jobId','')}")
         for field in ['name', 'status', 'duration', 'startedAt', 'endedAt', 'workflowVersionId', 'owner']:
-            table.add_row(field, str(job.get(field, '')))
-        console.print(table)
+            buf.add(field, str(job.get(field, '')))
+        buf.flush()
 
     OutputFormatter.output_data(data, output, config_manager, table_formatter=table_fmt)
 
@@ -385,44 +418,30 @@ def ga_group():
 @click.option('--name', type=str, help='Filter by name')
 @click.option('--tag', 'tags', multiple=True, help='Filter by tag (repeatable)')
 @common_output_options
+@_max_stale_option
 @click.pass_context
 @error_handler
-def ga_list(ctx, limit, offset, name, tags, output, no_cache):
+def ga_list(ctx, limit, offset, name, tags, output, no_cache, max_stale):
     client, config_manager = ClientManager().get_client_and_config(ctx, cache_namespace='ic')
-    cache_key = f"ga_list_{limit}_{offset}_{name}_{','.join(tags) if tags else ''}"
-    def fetch():
-        return client.ic_list_global_artifacts(limit=limit, offset=offset, name=name, tags=list(tags) if tags else None)
-
-    data = None
-    if client.cache_manager and not no_cache:
-        data = client.cache_manager.get('ic', cache_key)
-        if data:
-            OutputFormatter.display_cached_message()
-    if not data:
-        data = fetch()
-        if client.cache_manager and not no_cache:
-            client.cache_manager.set('ic', cache_key, data)
+    cache_key = ('ga_list', limit, offset, name, tags)
+    data = cached_or_fetch(client, 'ic', cache_key, no_cache,
+                           lambda: client.ic_list_global_artifacts(limit=limit, offset=offset, name=name, tags=list(tags) if tags else None), max_stale=max_stale)
 
     def table_fmt(d):
         payload = d.get('data', d)
         items = payload.get('globalArtifacts', payload) if isinstance(payload, dict) else payload
         if not items:
-            console.print('No global artifacts found', style='yellow')
+            _get_console().print('No global artifacts found', style='yellow')
             return
-        table = OutputFormatter.create_standard_table('Global Artifacts', [
-            {'name': 'ID', 'style': 'cyan'},
-            {'name': 'Name', 'style': 'white'},
-            {'name': 'Tags', 'style': 'green'},
-            {'name': 'Entities', 'style': 'yellow'},
-        ])
-        for ga in items:
-            table.add_row(
-                str(ga.get('id', '')),
-                str(ga.get('name', '')),
-                ", ".join(ga.get('tags', []) or []),
-                str(ga.get('entitiesCount', '')),
-            )
-        console.print(table)
+        table = OutputFormatter.create_standard_table('Global Artifacts', _GA_COLUMNS)
+        rows = [
+            (str(ga.get('id', '')), str(ga.get('name', '')),
+             _join_tags(tuple(ga.get('tags') or ())), str(ga.get('entitiesCount', '')))
+            for ga in items
+        ]
+        for row in rows:
+            table.add_row(*row)
+        _get_console().print(table)
 
     OutputFormatter.output_data(data, output, config_manager, table_formatter=table_fmt)
 
@@ -430,46 +449,37 @@ def ga_list(ctx, limit, offset, name, tags, output, no_cache):
 @ga_group.command(name='get')
 @click.argument('artifact_id')
 @common_output_options
+@_max_stale_option
 @click.pass_context
 @error_handler
-def ga_get(ctx, artifact_id, output, no_cache):
+def ga_get(ctx, artifact_id, output, no_cache, max_stale):
     client, config_manager = ClientManager().get_client_and_config(ctx, cache_namespace='ic')
-    cache_key = f"ga_get_{artifact_id}"
-    data = None
-    if client.cache_manager and not no_cache:
-        data = client.cache_manager.get('ic', cache_key)
-        if data:
-            OutputFormatter.display_cached_message()
-    if not data:
-        data = client.ic_get_global_artifact(artifact_id)
-        if client.cache_manager and not no_cache:
-            client.cache_manager.set('ic', cache_key, data)
+    cache_key = ('ga_get', artifact_id)
+    data = cached_or_fetch(client, 'ic', cache_key, no_cache,
+                           lambda: client.ic_get_global_artifact(artifact_id), max_stale=max_stale)
 
     def table_fmt(d):
         payload = d.get('data', d)
         ga = payload.get('globalArtifact', payload) if isinstance(payload, dict) else payload
-        table = OutputFormatter.create_standard_table(f"Global Artifact {artifact_id}", [
-            {'name': 'Field', 'style': 'cyan'},
-            {'name': 'Value', 'style': 'white'},
-        ])
+        buf = _FieldBuffer(f"Global Artifact {artifact_id}")
         
         # Basic info
-        table.add_row('ID', str(ga.get('id', '')))
-        table.add_row('Name', str(ga.get('name', '')))
-        table.add_row('Description', str(ga.get('description') or 'None'))
-        table.add_row('Tags', ", ".join(ga.get('tags', [])) if ga.get('tags') else 'None')
-        table.add_row('Entities Count', str(ga.get('entitiesCount', '')))
-        table.add_row('Entities Limit', str(ga.get('entitiesLimit', '')))
-        table.add_row('Created At', str(ga.get('createdAt', '')))
-        table.add_row('Updated At', str(ga.get('updatedAt', '')))
+        buf.add('ID', str(ga.get('id', '')))
+        buf.add('Name', str(ga.get('name', '')))
+        buf.add('Description', str(ga.get('description') or 'None'))
+        buf.add('Tags', ", ".join(ga.get('tags', [])) if ga.get('tags') else 'None')
+        buf.add('Entities Count', str(ga.get('entitiesCount', '')))
+        buf.add('Entities Limit', str(ga.get('entitiesLimit', '')))
+        buf.add('Created At', str(ga.get('createdAt', '')))
+        buf.add('Updated At', str(ga.get('updatedAt', '')))
         
         # Active workflows
         workflows = ga.get('activeWorkflowVersions', [])
         if workflows:
             workflow_names = [wf.get('name', '') for wf in workflows]
-            table.add_row('Active Workflows', ", ".join(workflow_names[:3]) + ('...' if len(workflow_names) > 3 else ''))
+            buf.add('Active Workflows', ", ".join(workflow_names[:3]) + ('...' if len(workflow_names) > 3 else ''))
         
-        console.print(table)
+        buf.flush()
 
     OutputFormatter.output_data(data, output, config_manager, table_formatter=table_fmt)
 
@@ -486,17 +496,14 @@ def ga_create(ctx, name, description, tags, output, no_cache):
     data = client.ic_create_global_artifact(name=name, description=description, schema=None, tags=list(tags) if tags else None)
     
     def table_fmt(d):
-        table = OutputFormatter.create_standard_table("Global Artifact Created", [
-            {'name': 'Field', 'style': 'cyan'},
-            {'name': 'Value', 'style': 'white'},
-        ])
+        buf = _FieldBuffer("Global Artifact Created")
         ga = d.get('data', {}).get('globalArtifact', d) if isinstance(d, dict) else {}
-        table.add_row('ID', str(ga.get('id', '')))
-        table.add_row('Name', str(name))
-        table.add_row('Description', str(description or 'None'))
-        table.add_row('Tags', ', '.join(tags) if tags else 'None')
-        table.add_row('Status', 'Created Successfully')
-        console.print(table)
+        buf.add('ID', str(ga.get('id', '')))
+        buf.add('Name', str(name))
+        buf.add('Description', str(description or 'None'))
+        buf.add('Tags', ', '.join(tags) if tags else 'None')
+        buf.add('Status', 'Created Successfully')
+        buf.flush()
     
     OutputFormatter.output_data(data, output, config_manager, table_formatter=table_fmt)
 
@@ -511,15 +518,12 @@ def ga_delete(ctx, artifact_id, output, no_cache):
     data = client.ic_delete_global_artifact(artifact_id)
     
     def table_fmt(d):
-        table = OutputFormatter.create_standard_table("Global Artifact Deletion", [
-            {'name': 'Field', 'style': 'cyan'},
-            {'name': 'Value', 'style': 'white'},
-        ])
-        table.add_row('Artifact ID', str(artifact_id))
-        table.add_row('Status', 'Deleted Successfully')
+        buf = _FieldBuffer("Global Artifact Deletion")
+        buf.add('Artifact ID', str(artifact_id))
+        buf.add('Status', 'Deleted Successfully')
         if isinstance(d, dict) and d.get('message'):
-            table.add_row('Message', str(d.get('message')))
-        console.print(table)
+            buf.add('Message', str(d.get('message')))
+        buf.flush()
     
     OutputFormatter.output_data(data, output, config_manager, table_formatter=table_fmt)
 
@@ -535,35 +539,26 @@ def ga_entities_group():
 @click.option('--limit', default=30, type=int)
 @click.option('--offset', default=0, type=int)
 @common_output_options
+@_max_stale_option
 @click.pass_context
 @error_handler
-def ga_entities_list(ctx, artifact_id, limit, offset, output, no_cache):
+def ga_entities_list(ctx, artifact_id, limit, offset, output, no_cache, max_stale):
     client, config_manager = ClientManager().get_client_and_config(ctx, cache_namespace='ic')
-    cache_key = f"ga_entities_{artifact_id}_{limit}_{offset}"
-    data = None
-    if client.cache_manager and not no_cache:
-        data = client.cache_manager.get('ic', cache_key)
-        if data:
-            OutputFormatter.display_cached_message()
-    if not data:
-        data = client.ic_list_global_artifact_entities(artifact_id, limit=limit, offset=offset)
-        if client.cache_manager and not no_cache:
-            client.cache_manager.set('ic', cache_key, data)
+    cache_key = ('ga_entities', artifact_id, limit, offset)
+    data = cached_or_fetch(client, 'ic', cache_key, no_cache,
+                           lambda: client.ic_list_global_artifact_entities(artifact_id, limit=limit, offset=offset), max_stale=max_stale)
 
     def table_fmt(d):
         payload = d.get('data', d)
         items = payload.get('entities', payload) if isinstance(payload, dict) else payload
         if not items:
-            console.print('No entities found', style='yellow')
+            _get_console().print('No entities found', style='yellow')
             return
-        table = OutputFormatter.create_standard_table('Global Artifact Entities', [
-            {'name': 'ID', 'style': 'cyan'},
-            {'name': 'Data', 'style': 'white'},
-            {'name': 'Updated At', 'style': 'yellow'},
-        ])
-        for e in items:
-            table.add_row(str(e.get('id','')), str(e.get('data','')), str(e.get('updatedAt','')))
-        console.print(table)
+        table = OutputFormatter.create_standard_table('Global Artifact Entities', _GA_ENTITY_COLUMNS)
+        rows = [(str(e.get('id','')), str(e.get('data','')), str(e.get('updatedAt',''))) for e in items]
+        for row in rows:
+            table.add_row(*row)
+        _get_console().print(table)
 
     OutputFormatter.output_data(data, output, config_manager, table_formatter=table_fmt)
 
@@ -579,17 +574,14 @@ def ga_entities_add(ctx, artifact_id, data, output, no_cache):
     resp = client.ic_add_global_artifact_entity(artifact_id, data)
     
     def table_fmt(d):
-        table = OutputFormatter.create_standard_table("Global Artifact Entity Added", [
-            {'name': 'Field', 'style': 'cyan'},
-            {'name': 'Value', 'style': 'white'},
-        ])
-        table.add_row('Artifact ID', str(artifact_id))
-        table.add_row('Entity Data', str(data)[:100] + ('...' if len(str(data)) > 100 else ''))
+        buf = _FieldBuffer("Global Artifact Entity Added")
+        buf.add('Artifact ID', str(artifact_id))
+        buf.add('Entity Data', str(data)[:100] + ('...' if len(str(data)) > 100 else ''))
         entity = d.get('data', {}).get('entity', d) if isinstance(d, dict) else {}
         if entity.get('id'):
-            table.add_row('Entity ID', str(entity.get('id')))
-        table.add_row('Status', 'Added Successfully')
-        console.print(table)
+            buf.add('Entity ID', str(entity.get('id')))
+        buf.add('Status', 'Added Successfully')
+        buf.flush()
     
     OutputFormatter.output_data(resp, output, config_manager, table_formatter=table_fmt)
 
@@ -605,15 +597,12 @@ def ga_entities_delete(ctx, artifact_id, entity_id, output, no_cache):
     resp = client.ic_delete_global_artifact_entity(artifact_id, entity_id)
     
     def table_fmt(d):
-        table = OutputFormatter.create_standard_table("Global Artifact Entity Deletion", [
-            {'name': 'Field', 'style': 'cyan'},
-            {'name': 'Value', 'style': 'white'},
-        ])
-        table.add_row('Artifact ID', str(artifact_id))
-        table.add_row('Entity ID', str(entity_id))
-        table.add_row('Status', 'Deleted Successfully')
+        buf = _FieldBuffer("Global Artifact Entity Deletion")
+        buf.add('Artifact ID', str(artifact_id))
+        buf.add('Entity ID', str(entity_id))
+        buf.add('Status', 'Deleted Successfully')
         if isinstance(d, dict) and d.get('message'):
-            table.add_row('Message', str(d.get('message')))
-        console.print(table)
+            buf.add('Message', str(d.get('message')))
+        buf.flush()
     
     OutputFormatter.output_data(resp, output, config_manager, table_formatter=table_fmt)
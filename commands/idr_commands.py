@@ -1,20 +1,33 @@
+import collections
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 import click
-import json
 import logging
-from rich.console import Console
+import requests
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
-from utils.config import ConfigManager
+from rich.text import Text
+from utils.config import get_config
 from utils.credentials import CredentialManager
 from utils.cache import CacheManager
 from api.client import Rapid7Client
 from utils.exceptions import *
-from commands.logs_commands import siem_logs_group
+from utils.lazy import LazyGroup
+from commands.config_commands import _OUTPUT_CHOICE
+from utils import json_fast
 
 logger = logging.getLogger(__name__)
 console = Console()
 
+_RRN_PREFIX = 'rrn:investigation:'
+# Failures reported as "Error: ..." rather than a traceback; anything else is a bug
+_USER_ERRORS = (Rapid7Error, requests.RequestException, ValueError, KeyError)
+# organization_id per region found via the sample-investigation fallback (None if it failed),
+# so that lookup runs at most once per process
+_org_id_cache = {}
+
 def determine_output_format(output, config):
     """Determine output format with pipe detection"""
     if output:
@@ -24,68 +37,199 @@ def determine_output_format(output, config):
     else:
         return config.get('default_output', 'simple')
 
+@lru_cache(maxsize=4096)
+def _short_id(rrn):
+    """Last segment of a full RRN (rrn:investigation:region:org_id:investigation:ID), else rrn unchanged"""
+    if rrn.count(':') >= 5:
+        return rrn.rpartition(':')[2]
+    return rrn
+
+def _org_id_from_rrn(rrn):
+    """Organization ID (4th segment) of a full RRN, or None"""
+    if rrn and rrn.count(':') >= 5:
+        return rrn.split(':', 4)[3]
+    return None
+
+@lru_cache(maxsize=8)
+def _get_client(api_key, region, cache_ttl, cache_enabled):
+    """Rapid7Client shared by every SIEM command using the same credentials, region and cache settings"""
+    cache_manager = CacheManager(ttl=cache_ttl) if cache_enabled else None
+    return Rapid7Client(api_key, region, cache_manager)
+
+def _setup(ctx, no_cache=False):
+    """Validated config, API client and region for a SIEM command"""
+    config_manager = get_config()
+    api_key = CredentialManager.get_api_key(ctx.obj.api_key)
+    if not api_key:
+        raise AuthenticationError("API key not found. Use 'r7 config cred store' to save credentials.")
+    region = ctx.obj.region or config_manager.get('region', 'us')
+    cache_enabled = bool(config_manager.get('cache_enabled')) and not no_cache
+    client = _get_client(api_key, region, config_manager.get('cache_ttl'), cache_enabled)
+    return client, config_manager, region
+
+_allow_stale_option = click.option('--allow-stale', is_flag=True,
+                                   help='Show the last cached result if the API request fails')
+
+# Shared click.Choice instances for investigation options
+_STATUS_CHOICES = click.Choice(['OPEN', 'INVESTIGATING', 'CLOSED'])
+_PRIORITY_CHOICES = click.Choice(['LOW', 'MEDIUM', 'HIGH', 'CRITICAL'])
+
+# (header, style) for the investigation, investigation-alert and alert tables
+_INVESTIGATION_COLS = (("ID", "cyan"), ("Title", "green"), ("Status", "yellow"),
+                       ("Priority", "red"), ("Assignee", "blue"), ("Created", "dim"))
+_INVESTIGATION_ALERT_COLS = (("Alert ID", "cyan"), ("Title", "green"), ("Type", "yellow"),
+                             ("Source", "blue"), ("Created", "dim"))
+_ALERT_COLS = (("ID", "cyan"), ("Title", "green"), ("Status", "yellow"),
+               ("Priority", "red"), ("Created", "dim"))
+
+# Fields kept per alert in `alert list` JSON output without --full-output (the table columns)
+_MINIMAL_ALERT_KEYS = ('rrn', 'title', 'status', 'priority', 'created_at')
+
+# (label, key) rows of the `investigation get` panel
+_INVESTIGATION_PANEL_FIELDS = (('ID:', 'rrn'), ('Title:', 'title'), ('Status:', 'status'),
+                               ('Priority:', 'priority'), ('Disposition:', 'disposition'),
+                               ('Assignee:', 'assignee'), ('Created:', 'created_time'),
+                               ('Updated:', 'last_accessed'))
+
+# Markup for the `alert get` panel, filled with format_map ('N/A' for missing keys)
+_ALERT_PANEL_TEMPLATE = """
+[bold cyan]ID:[/bold cyan] {display_id}
+[bold cyan]Title:[/bold cyan] {title}
+[bold cyan]Status:[/bold cyan] {status}
+[bold cyan]Priority:[/bold cyan] {priority}
+[bold cyan]Type:[/bold cyan] {type}
+[bold cyan]Disposition:[/bold cyan] {disposition}
+[bold cyan]External Source:[/bold cyan] {external_source}
+[bold cyan]Created:[/bold cyan] {created_at}
+[bold cyan]Updated:[/bold cyan] {updated_at}
+[bold cyan]Alerted At:[/bold cyan] {alerted_at}"""
+
+def _make_table(title, columns):
+    """Rich table with a styled column per (header, style) pair"""
+    table = Table(title=title)
+    for header, style in columns:
+        table.add_column(header, style=style)
+    return table
+
+def _as_dict(value):
+    """value if it is a dict, else an empty dict"""
+    return value if isinstance(value, dict) else {}
+
+def _rows(payload, key='data'):
+    """Dict rows of a list payload under key; a null or non-dict payload, a non-list value and non-dict rows are dropped"""
+    rows = _as_dict(payload).get(key)
+    return [row for row in rows if isinstance(row, dict)] if isinstance(rows, list) else []
+
+def _assignee_name(assignee):
+    """Display name for an assignee dict: name, else email, else 'Unknown'; 'Unassigned' if empty"""
+    if not assignee:
+        return "Unassigned"
+    return assignee.get('name') or assignee.get('email') or 'Unknown'
+
+def _truncate(s, n):
+    """s cut to at most n characters, ending in '...' when shortened"""
+    return s if n is None or len(s) <= n else s[:n - 3] + '...'
+
 def build_investigation_rrn(investigation_id, region, organization_id):
     """Build full investigation RRN from parts"""
-    return f"rrn:investigation:{region}:{organization_id}:investigation:{investigation_id}"
+    return f"{_RRN_PREFIX}{region}:{organization_id}:investigation:{investigation_id}"
 
 def extract_and_save_org_id(config_manager, investigation_data):
     """Extract organization_id from investigation data and save to config if not already set"""
     if config_manager.get('organization_id'):
         return  # Already have org_id
         
-    # Check if data is a list or single item
-    investigations = investigation_data.get('data', []) if isinstance(investigation_data, dict) else [investigation_data]
+    investigations = _rows(investigation_data)
     
-    for investigation in investigations:
-        rrn = investigation.get('rrn', '')
-        if rrn and ':' in rrn:
-            parts = rrn.split(':')
-            if len(parts) >= 6:
-                org_id = parts[3]
-                config_manager.set('organization_id', org_id)
-                config_manager.save_config()
-                logger.debug(f"Saved organization_id: {org_id}")
-                return
+    # Every investigation shares the org, so the first RRN that parses is enough
+    org_id = next(filter(None, (_org_id_from_rrn(i.get('rrn', '')) for i in investigations)), None)
+    if org_id:
+        _remember_org_id(config_manager, org_id)
+        logger.debug(f"Saved organization_id: {org_id}")
+
+def _remember_org_id(config_manager, org_id):
+    """Store organization_id in config, only writing the file when the value changes"""
+    if config_manager.get('organization_id') != org_id:
+        config_manager.set('organization_id', org_id)
+        config_manager.save_config()
 
 def resolve_investigation_id(client, investigation_id, region, config_manager, org_id_override=None):
     """Convert short investigation ID to full RRN if needed"""
-    if investigation_id.startswith('rrn:investigation:'):
+    if investigation_id.startswith(_RRN_PREFIX):
         return investigation_id
     
-    # Use org_id from CLI override, config, or attempt to get from API
-    org_id = org_id_override or config_manager.get('organization_id')
+    # Use org_id from CLI override, config, or one discovered earlier in this process
+    org_id = org_id_override or config_manager.get('organization_id') or _org_id_cache.get(region)
     
     if org_id:
         return build_investigation_rrn(investigation_id, region, org_id)
+    if region in _org_id_cache:
+        return investigation_id  # Sample lookup already failed for this region
     
     # Fallback: get organization_id from a sample investigation and save it
     try:
         sample_investigations = client.list_investigations({'limit': 1})
-        if sample_investigations.get('data') and len(sample_investigations['data']) > 0:
-            sample_rrn = sample_investigations['data'][0].get('rrn', '')
-            if sample_rrn:
-                # Extract org_id from sample RRN
-                parts = sample_rrn.split(':')
-                if len(parts) >= 6:
-                    org_id = parts[3]
-                    # Store org_id for future use
-                    config_manager.set('organization_id', org_id)
-                    config_manager.save_config()
-                    return build_investigation_rrn(investigation_id, region, org_id)
-    except:
-        pass
+        rows = _rows(sample_investigations)
+        org_id = _org_id_from_rrn(rows[0].get('rrn')) if rows else None
+    except (APIError, requests.RequestException):
+        logger.debug("org_id discovery failed", exc_info=True)
+        org_id = None
+    _org_id_cache[region] = org_id
     
+    if org_id:
+        _remember_org_id(config_manager, org_id)
+        return build_investigation_rrn(investigation_id, region, org_id)
     return investigation_id  # Return original if we can't build it
 
-@click.group('siem')
+def _split_ids(value):
+    """Investigation IDs from a comma-separated argument, de-duplicated in order"""
+    ids = list(dict.fromkeys(part.strip() for part in value.split(',') if part.strip()))
+    if not ids:
+        raise click.BadParameter("no investigation IDs given", param_hint='INVESTIGATION_ID')
+    return ids
+
+def _run_for_investigations(client, investigation_ids, region, config_manager, org_id, action):
+    """Call action(rrn) for each ID, over a thread pool when there are several.
+    Returns {id: result} in argument order; with several IDs a failure is stored as the exception.
+    """
+    rrns = {i: resolve_investigation_id(client, i, region, config_manager, org_id) for i in investigation_ids}
+    if len(rrns) == 1:
+        (investigation_id, rrn), = rrns.items()
+        return {investigation_id: action(rrn)}
+    results = {}
+    with ThreadPoolExecutor(max_workers=min(16, len(rrns))) as executor:
+        futures = {executor.submit(action, rrn): i for i, rrn in rrns.items()}
+        for future in as_completed(futures):
+            try:
+                results[futures[future]] = future.result()
+            except _USER_ERRORS as e:
+                results[futures[future]] = e
+    return {i: results[i] for i in rrns}
+
+def _report_investigation_results(results, output, config_manager, done):
+    """Print per-investigation results from _run_for_investigations, aborting if any failed"""
+    failed = {i: r for i, r in results.items() if isinstance(r, Exception)}
+    succeeded = {i: r for i, r in results.items() if i not in failed}
+    use_format = determine_output_format(output, config_manager)
+    if use_format == 'json':
+        if succeeded:
+            json_fast.write(next(iter(succeeded.values())) if len(results) == 1 else succeeded)
+    else:
+        for investigation_id in succeeded:
+            console.print(f"[green]✓ Investigation {investigation_id} {done}[/green]")
+    for investigation_id, e in failed.items():
+        console.print(f"[red]Error: {investigation_id}: {e}[/red]")
+    if failed:
+        raise click.Abort()
+
+# logs (and its LEQL/rendering deps) is only imported when `siem logs` is used
+@click.group('siem', cls=LazyGroup,
+             lazy_subcommands={'logs': 'commands.logs_commands:siem_logs_group'})
 @click.pass_context
 def siem_group(ctx):
     """search logs, manage alerts/investigations"""
     pass
 
-# Add logs subcommand to SIEM
-siem_group.add_command(siem_logs_group)
-
 @siem_group.group('investigation')
 @click.pass_context
 def investigation_group(ctx):
@@ -93,43 +237,32 @@ def investigation_group(ctx):
     pass
 
 @investigation_group.command('list')
-@click.option('--status', multiple=True, type=click.Choice(['OPEN', 'INVESTIGATING', 'CLOSED']),
+@click.option('--status', multiple=True, type=_STATUS_CHOICES,
               help='Filter by investigation status (can be used multiple times)')
-@click.option('--priority', multiple=True, type=click.Choice(['LOW', 'MEDIUM', 'HIGH', 'CRITICAL']),
+@click.option('--priority', multiple=True, type=_PRIORITY_CHOICES,
               help='Filter by investigation priority (can be used multiple times)')
 @click.option('--assignee', help='Filter by assignee email address')
 @click.option('--start-time', help='Start time filter (ISO 8601 format)')
 @click.option('--end-time', help='End time filter (ISO 8601 format)')
-@click.option('--output', type=click.Choice(['simple', 'table', 'json']),
+@click.option('--output', type=_OUTPUT_CHOICE,
               help='Output format')
 @click.option('--limit', type=int, default=None, help='Maximum number of investigations to return')
 @click.option('--no-cache', is_flag=True, help='Disable caching for this request')
+@_allow_stale_option
 @click.option('--full-output', is_flag=True, help='Include all fields in JSON output (default shows minimal fields matching table view)')
 @click.pass_context
-def list_investigations(ctx, status, priority, assignee, start_time, end_time, output, limit, no_cache, full_output):
+def list_investigations(ctx, status, priority, assignee, start_time, end_time, output, limit, no_cache, allow_stale, full_output):
     """List investigations with optional filtering"""
     try:
-        config_manager = ConfigManager()
-        config_manager.validate()
-
-        # Credentials and region
-        api_key = CredentialManager.get_api_key(ctx.obj.get('api_key'))
-        if not api_key:
-            raise AuthenticationError("API key not found. Use 'r7 config cred store' to save credentials.")
-        region = ctx.obj.get('region') or config_manager.get('region', 'us')
-
-        # Cache
-        cache_manager = None
-        if config_manager.get('cache_enabled') and not no_cache:
-            cache_manager = CacheManager(ttl=config_manager.get('cache_ttl'))
-        client = Rapid7Client(api_key, region, cache_manager)
+        client, config_manager, region = _setup(ctx, no_cache)
 
         # Build query parameters
         params = {}
+        # Sorted and de-duplicated, so flag order doesn't change the ETag cache key
         if status:
-            params['statuses'] = ','.join(status)
+            params['statuses'] = ','.join(sorted(set(status)))
         if priority:
-            params['priorities'] = ','.join(priority)
+            params['priorities'] = ','.join(sorted(set(priority)))
         if assignee:
             params['assignee.email'] = assignee
         if start_time:
@@ -140,93 +273,55 @@ def list_investigations(ctx, status, priority, assignee, start_time, end_time, o
             params['size'] = limit
 
         # Fetch investigations
-        investigations = client.list_investigations(params)
+        investigations = client.list_investigations(params, allow_stale=allow_stale)
         
         # Auto-save organization_id from response
         extract_and_save_org_id(config_manager, investigations)
 
         # Use data directly from API response
-        data = investigations.get('data', []) or []
+        data = _rows(investigations)
         investigations_display = {'data': data}
 
         # Output
         use_format = determine_output_format(output, config_manager)
         if use_format == 'json':
-            click.echo(json.dumps(investigations_display, indent=2))
+            json_fast.write(investigations_display)
         elif use_format == 'simple':
             for investigation in data:
                 # Extract short ID for simple output too
                 investigation_id = investigation.get('rrn', 'N/A')
-                if ':' in investigation_id:
-                    parts = investigation_id.split(':')
-                    if len(parts) >= 6:
-                        investigation_id = parts[-1]
-                click.echo(f"{investigation_id}: {investigation.get('title', 'N/A')} [{investigation.get('status', 'N/A')}]")
+                investigation_id = _short_id(investigation_id)
+                click.echo(f"{investigation_id}: {investigation.get('title') or 'N/A'} [{investigation.get('status') or 'N/A'}]")
         else:  # table
             title = "Investigations"
             if limit is not None:
                 title += f" (limit {limit})"
-            table = Table(title=title)
-            table.add_column("ID", style="cyan")
-            table.add_column("Title", style="green")
-            table.add_column("Status", style="yellow")
-            table.add_column("Priority", style="red")
-            table.add_column("Assignee", style="blue")
-            table.add_column("Created", style="dim")
+            table = _make_table(title, _INVESTIGATION_COLS)
 
             for investigation in data:
-                # Extract just the investigation ID from RRN
-                # Format: rrn:investigation:region:org_id:investigation:INVESTIGATION_ID
-                investigation_id = investigation.get('rrn', 'N/A')
-                if ':' in investigation_id:
-                    parts = investigation_id.split(':')
-                    if len(parts) >= 6:  # Should have at least 6 parts
-                        investigation_id = parts[-1]  # Last part is the actual investigation ID
-                
-                assignee_name = "Unassigned"
-                if investigation.get('assignee'):
-                    assignee_name = investigation['assignee'].get('name', investigation['assignee'].get('email', 'Unknown'))
-                
-                # Format created time to be more readable
-                created_time = investigation.get('created_time', 'N/A')
-                if created_time != 'N/A' and 'T' in created_time:
-                    created_time = created_time.split('T')[0]  # Just show date part
-                
                 table.add_row(
-                    investigation_id,
-                    investigation.get('title', 'N/A')[:50] + ('...' if len(investigation.get('title', '')) > 50 else ''),
-                    investigation.get('status', 'N/A'),
-                    investigation.get('priority', 'N/A'),
-                    assignee_name,
-                    created_time
+                    _short_id(investigation.get('rrn') or 'N/A'),
+                    _truncate(investigation.get('title') or 'N/A', 50),
+                    investigation.get('status') or 'N/A',
+                    investigation.get('priority') or 'N/A',
+                    _assignee_name(investigation.get('assignee')),
+                    (investigation.get('created_time') or 'N/A').partition('T')[0]  # Just the date
                 )
             console.print(table)
-    except Exception as e:
+    except _USER_ERRORS as e:
         console.print(f"[red]Error: {str(e)}[/red]")
         raise click.Abort()
 
 @investigation_group.command('get')
 @click.argument('investigation_id')
-@click.option('--output', type=click.Choice(['simple', 'table', 'json']),
+@click.option('--output', type=_OUTPUT_CHOICE,
               help='Output format')
 @click.pass_context
 def get_investigation(ctx, investigation_id, output):
     """Get investigation details"""
     try:
-        config_manager = ConfigManager()
-        cache_manager = CacheManager()
-        
-        # Get credentials
-        api_key = CredentialManager.get_api_key(ctx.obj.get('api_key'))
-        if not api_key:
-            raise AuthenticationError("API key not found. Use 'r7 config cred store' to save credentials.")
-        
-        # Get region and org_id
-        region = ctx.obj.get('region') or config_manager.get('region', 'us')
-        org_id = ctx.obj.get('org_id')
-        
-        # Create client and make request
-        client = Rapid7Client(api_key, region, cache_manager)
+        client, config_manager, region = _setup(ctx)
+        org_id = ctx.obj.org_id
         full_investigation_id = resolve_investigation_id(client, investigation_id, region, config_manager, org_id)
         investigation = client.get_investigation(full_investigation_id)
         
@@ -235,67 +330,40 @@ def get_investigation(ctx, investigation_id, output):
         
         use_format = determine_output_format(output, config_manager)
         if use_format == 'json':
-            click.echo(json.dumps(investigation, indent=2))
+            json_fast.write(investigation)
         else:
             # get_investigation returns data directly
-            investigation_data = investigation if isinstance(investigation, dict) else {}
-            
-            # Extract short ID from RRN for display
-            display_id = investigation_data.get('rrn', 'N/A')
-            if ':' in display_id:
-                parts = display_id.split(':')
-                if len(parts) >= 6:
-                    display_id = parts[-1]
-            
-            assignee_info = "Unassigned"
-            if investigation_data.get('assignee'):
-                assignee = investigation_data['assignee']
-                assignee_info = f"{assignee.get('name', assignee.get('email', 'Unknown'))}"
+            investigation_data = _as_dict(investigation)
             
-            panel_content = f"""
-[bold cyan]ID:[/bold cyan] {display_id}
-[bold cyan]Title:[/bold cyan] {investigation_data.get('title', 'N/A')}
-[bold cyan]Status:[/bold cyan] {investigation_data.get('status', 'N/A')}
-[bold cyan]Priority:[/bold cyan] {investigation_data.get('priority', 'N/A')}
-[bold cyan]Disposition:[/bold cyan] {investigation_data.get('disposition', 'N/A')}
-[bold cyan]Assignee:[/bold cyan] {assignee_info}
-[bold cyan]Created:[/bold cyan] {investigation_data.get('created_time', 'N/A')}
-[bold cyan]Updated:[/bold cyan] {investigation_data.get('last_accessed', 'N/A')}
-            """
-            console.print(Panel(panel_content, title=f"Investigation: {investigation_data.get('title', 'N/A')}", expand=False))
+            # Short ID and assignee name stand in for the raw rrn/assignee values
+            values = {**investigation_data,
+                      'rrn': _short_id(investigation_data.get('rrn', 'N/A')),
+                      'assignee': _assignee_name(investigation_data.get('assignee'))}
+            rows = [Text.assemble((label, 'bold cyan'), ' ', str(values.get(key, 'N/A')))
+                    for label, key in _INVESTIGATION_PANEL_FIELDS]
+            console.print(Panel(Group(Text(), *rows, Text()),
+                                title=f"Investigation: {investigation_data.get('title', 'N/A')}", expand=False))
             
-    except Exception as e:
+    except _USER_ERRORS as e:
         console.print(f"[red]Error: {str(e)}[/red]")
         raise click.Abort()
 
 @investigation_group.command('create')
 @click.argument('title')
-@click.option('--priority', type=click.Choice(['LOW', 'MEDIUM', 'HIGH', 'CRITICAL']), default='MEDIUM',
+@click.option('--priority', type=_PRIORITY_CHOICES, default='MEDIUM',
               help='Investigation priority')
-@click.option('--status', type=click.Choice(['OPEN', 'INVESTIGATING', 'CLOSED']), default='OPEN',
+@click.option('--status', type=_STATUS_CHOICES, default='OPEN',
               help='Investigation status')
 @click.option('--disposition', type=click.Choice(['BENIGN', 'MALICIOUS', 'NOT_APPLICABLE', 'UNDECIDED']),
               help='Investigation disposition')
 @click.option('--assignee', help='Assignee email address')
-@click.option('--output', type=click.Choice(['simple', 'table', 'json']),
+@click.option('--output', type=_OUTPUT_CHOICE,
               help='Output format')
 @click.pass_context
 def create_investigation(ctx, title, priority, status, disposition, assignee, output):
     """Create a new investigation"""
     try:
-        config_manager = ConfigManager()
-        cache_manager = CacheManager()
-        
-        # Get credentials
-        api_key = CredentialManager.get_api_key(ctx.obj.get('api_key'))
-        if not api_key:
-            raise AuthenticationError("API key not found. Use 'r7 config cred store' to save credentials.")
-        
-        # Get region
-        region = ctx.obj.get('region') or config_manager.get('region', 'us')
-        
-        # Create client and make request
-        client = Rapid7Client(api_key, region, cache_manager)
+        client, config_manager, region = _setup(ctx)
         
         # Build investigation data
         investigation_data = {
@@ -313,130 +381,82 @@ def create_investigation(ctx, title, priority, status, disposition, assignee, ou
         
         use_format = determine_output_format(output, config_manager)
         if use_format == 'json':
-            click.echo(json.dumps(investigation, indent=2))
+            json_fast.write(investigation)
         else:
-            investigation_data = investigation if isinstance(investigation, dict) else {}
+            investigation_data = _as_dict(investigation)
             console.print("[green]✓ Investigation created successfully[/green]")
             console.print(f"[bold cyan]ID:[/bold cyan] {investigation_data.get('id', 'N/A')}")
             console.print(f"[bold cyan]Title:[/bold cyan] {investigation_data.get('title', 'N/A')}")
             console.print(f"[bold cyan]Status:[/bold cyan] {investigation_data.get('status', 'N/A')}")
             
-    except Exception as e:
+    except _USER_ERRORS as e:
         console.print(f"[red]Error: {str(e)}[/red]")
         raise click.Abort()
 
 @investigation_group.command('set-status')
 @click.argument('investigation_id')
-@click.argument('status', type=click.Choice(['OPEN', 'INVESTIGATING', 'CLOSED']))
-@click.option('--output', type=click.Choice(['simple', 'table', 'json']),
+@click.argument('status', type=_STATUS_CHOICES)
+@click.option('--output', type=_OUTPUT_CHOICE,
               help='Output format')
 @click.pass_context
 def set_investigation_status(ctx, investigation_id, status, output):
-    """Set investigation status"""
+    """Set investigation status (comma-separate IDs to update several)"""
     try:
-        config_manager = ConfigManager()
-        cache_manager = CacheManager()
-        
-        # Get credentials
-        api_key = CredentialManager.get_api_key(ctx.obj.get('api_key'))
-        if not api_key:
-            raise AuthenticationError("API key not found. Use 'r7 config cred store' to save credentials.")
-        
-        # Get region and org_id
-        region = ctx.obj.get('region') or config_manager.get('region', 'us')
-        org_id = ctx.obj.get('org_id')
-        
-        # Create client and make request
-        client = Rapid7Client(api_key, region, cache_manager)
-        full_investigation_id = resolve_investigation_id(client, investigation_id, region, config_manager, org_id)
-        result = client.set_investigation_status(full_investigation_id, status)
-        
-        use_format = determine_output_format(output, config_manager)
-        if use_format == 'json':
-            click.echo(json.dumps(result, indent=2))
-        else:
-            console.print(f"[green]✓ Investigation {investigation_id} status set to {status}[/green]")
+        client, config_manager, region = _setup(ctx)
+        org_id = ctx.obj.org_id
+        results = _run_for_investigations(
+            client, _split_ids(investigation_id), region, config_manager, org_id,
+            lambda rrn: client.set_investigation_status(rrn, status))
+        _report_investigation_results(results, output, config_manager, f"status set to {status}")
             
-    except Exception as e:
+    except _USER_ERRORS as e:
         console.print(f"[red]Error: {str(e)}[/red]")
         raise click.Abort()
 
 @investigation_group.command('set-priority')
 @click.argument('investigation_id')
-@click.argument('priority', type=click.Choice(['LOW', 'MEDIUM', 'HIGH', 'CRITICAL']))
-@click.option('--output', type=click.Choice(['simple', 'table', 'json']),
+@click.argument('priority', type=_PRIORITY_CHOICES)
+@click.option('--output', type=_OUTPUT_CHOICE,
               help='Output format')
 @click.pass_context
 def set_investigation_priority(ctx, investigation_id, priority, output):
-    """Set investigation priority"""
+    """Set investigation priority (comma-separate IDs to update several)"""
     try:
-        config_manager = ConfigManager()
-        cache_manager = CacheManager()
-        
-        # Get credentials
-        api_key = CredentialManager.get_api_key(ctx.obj.get('api_key'))
-        if not api_key:
-            raise AuthenticationError("API key not found. Use 'r7 config cred store' to save credentials.")
-        
-        # Get region and org_id
-        region = ctx.obj.get('region') or config_manager.get('region', 'us')
-        org_id = ctx.obj.get('org_id')
-        
-        # Create client and make request
-        client = Rapid7Client(api_key, region, cache_manager)
-        full_investigation_id = resolve_investigation_id(client, investigation_id, region, config_manager, org_id)
-        result = client.set_investigation_priority(full_investigation_id, priority)
-        
-        use_format = determine_output_format(output, config_manager)
-        if use_format == 'json':
-            click.echo(json.dumps(result, indent=2))
-        else:
-            console.print(f"[green]✓ Investigation {investigation_id} priority set to {priority}[/green]")
+        client, config_manager, region = _setup(ctx)
+        org_id = ctx.obj.org_id
+        results = _run_for_investigations(
+            client, _split_ids(investigation_id), region, config_manager, org_id,
+            lambda rrn: client.set_investigation_priority(rrn, priority))
+        _report_investigation_results(results, output, config_manager, f"priority set to {priority}")
             
-    except Exception as e:
+    except _USER_ERRORS as e:
         console.print(f"[red]Error: {str(e)}[/red]")
         raise click.Abort()
 
 @investigation_group.command('assign')
 @click.argument('investigation_id')
 @click.argument('assignee_email')
-@click.option('--output', type=click.Choice(['simple', 'table', 'json']),
+@click.option('--output', type=_OUTPUT_CHOICE,
               help='Output format')
 @click.pass_context
 def assign_investigation(ctx, investigation_id, assignee_email, output):
-    """Assign investigation to a user"""
+    """Assign investigation to a user (comma-separate IDs to assign several)"""
     try:
-        config_manager = ConfigManager()
-        cache_manager = CacheManager()
-        
-        # Get credentials
-        api_key = CredentialManager.get_api_key(ctx.obj.get('api_key'))
-        if not api_key:
-            raise AuthenticationError("API key not found. Use 'r7 config cred store' to save credentials.")
-        
-        # Get region and org_id
-        region = ctx.obj.get('region') or config_manager.get('region', 'us')
-        org_id = ctx.obj.get('org_id')
-        
-        # Create client and make request
-        client = Rapid7Client(api_key, region, cache_manager)
-        full_investigation_id = resolve_investigation_id(client, investigation_id, region, config_manager, org_id)
-        result = client.assign_investigation(full_investigation_id, assignee_email)
-        
-        use_format = determine_output_format(output, config_manager)
-        if use_format == 'json':
-            click.echo(json.dumps(result, indent=2))
-        else:
-            console.print(f"[green]✓ Investigation {investigation_id} assigned to {assignee_email}[/green]")
+        client, config_manager, region = _setup(ctx)
+        org_id = ctx.obj.org_id
+        results = _run_for_investigations(
+            client, _split_ids(investigation_id), region, config_manager, org_id,
+            lambda rrn: client.assign_investigation(rrn, assignee_email))
+        _report_investigation_results(results, output, config_manager, f"assigned to {assignee_email}")
             
-    except Exception as e:
+    except _USER_ERRORS as e:
         console.print(f"[red]Error: {str(e)}[/red]")
         raise click.Abort()
 
 @investigation_group.command('update')
 @click.argument('investigation_id')
 @click.option('--title', help='Update investigation title')
-@click.option('--status', type=click.Choice(['OPEN', 'INVESTIGATING', 'CLOSED']),
+@click.option('--status', type=_STATUS_CHOICES,
               help='Update investigation status')
 @click.option('--priority', type=click.Choice(['UNSPECIFIED', 'LOW', 'MEDIUM', 'HIGH', 'CRITICAL']),
               help='Update investigation priority')
@@ -444,31 +464,19 @@ def assign_investigation(ctx, investigation_id, assignee_email, output):
               help='Update investigation disposition')
 @click.option('--assignee-email', help='Email address of user to assign the investigation to')
 @click.option('--multi-customer', is_flag=True, help='Indicates multi-customer access (requires RRN format)')
-@click.option('--output', type=click.Choice(['simple', 'table', 'json']),
+@click.option('--output', type=_OUTPUT_CHOICE,
               help='Output format')
 @click.pass_context
 def update_investigation(ctx, investigation_id, title, status, priority, disposition, assignee_email, multi_customer, output):
     """Update multiple fields in a single operation for an investigation"""
     try:
-        config_manager = ConfigManager()
-        cache_manager = CacheManager()
-        
-        # Get credentials
-        api_key = CredentialManager.get_api_key(ctx.obj.get('api_key'))
-        if not api_key:
-            raise AuthenticationError("API key not found. Use 'r7 config cred store' to save credentials.")
-        
-        # Get region and org_id
-        region = ctx.obj.get('region') or config_manager.get('region', 'us')
-        org_id = ctx.obj.get('org_id')
-        
-        # Create client
-        client = Rapid7Client(api_key, region, cache_manager)
+        client, config_manager, region = _setup(ctx)
+        org_id = ctx.obj.org_id
         
         # Resolve investigation ID to RRN if needed
         if multi_customer:
             # For multi-customer, must use RRN format
-            if not investigation_id.startswith('rrn:investigation:'):
+            if not investigation_id.startswith(_RRN_PREFIX):
                 raise APIError("Multi-customer access requires investigation ID in RRN format")
             full_investigation_id = investigation_id
         else:
@@ -503,14 +511,11 @@ def update_investigation(ctx, investigation_id, title, status, priority, disposi
         
         use_format = determine_output_format(output, config_manager)
         if use_format == 'json':
-            click.echo(json.dumps(result, indent=2))
+            json_fast.write(result)
         else:
             # Extract short ID for display
             display_id = investigation_id
-            if ':' in display_id:
-                parts = display_id.split(':')
-                if len(parts) >= 6:
-                    display_id = parts[-1]
+            display_id = _short_id(display_id)
             
             console.print(f"[green]✓ Investigation {display_id} updated successfully[/green]")
             
@@ -526,98 +531,55 @@ def update_investigation(ctx, investigation_id, title, status, priority, disposi
             if assignee_email:
                 console.print(f"  Assigned to: {assignee_email}")
             
-    except Exception as e:
+    except _USER_ERRORS as e:
         console.print(f"[red]Error: {str(e)}[/red]")
         raise click.Abort()
 
 @investigation_group.command('alerts')
 @click.argument('investigation_id')
 @click.option('--limit', type=int, default=20, help='Maximum number of alerts to return (default: 20)')
-@click.option('--output', type=click.Choice(['simple', 'table', 'json']),
+@click.option('--output', type=_OUTPUT_CHOICE,
               help='Output format')
 @click.option('--no-cache', is_flag=True, help='Disable caching for this request')
+@_allow_stale_option
 @click.pass_context
-def list_investigation_alerts(ctx, investigation_id, limit, output, no_cache):
+def list_investigation_alerts(ctx, investigation_id, limit, output, no_cache, allow_stale):
     """List alerts associated with an investigation"""
     try:
-        config_manager = ConfigManager()
-        config_manager.validate()
-
-        # Credentials and region
-        api_key = CredentialManager.get_api_key(ctx.obj.get('api_key'))
-        if not api_key:
-            raise AuthenticationError("API key not found. Use 'r7 config cred store' to save credentials.")
-        region = ctx.obj.get('region') or config_manager.get('region', 'us')
-        org_id = ctx.obj.get('org_id')
-
-        # Cache
-        cache_manager = None
-        if config_manager.get('cache_enabled') and not no_cache:
-            cache_manager = CacheManager(ttl=config_manager.get('cache_ttl'))
-        client = Rapid7Client(api_key, region, cache_manager)
+        client, config_manager, region = _setup(ctx, no_cache)
+        org_id = ctx.obj.org_id
 
         # Resolve investigation ID to full RRN if needed (same pattern as other investigation commands)
         full_investigation_id = resolve_investigation_id(client, investigation_id, region, config_manager, org_id)
         
         # Fetch investigation alerts
-        alerts = client.list_investigation_alerts(full_investigation_id, size=limit)
+        alerts = client.list_investigation_alerts(full_investigation_id, size=limit, allow_stale=allow_stale)
 
         # Output
         use_format = determine_output_format(output, config_manager)
         if use_format == 'json':
-            click.echo(json.dumps(alerts, indent=2))
+            json_fast.write(alerts)
         elif use_format == 'simple':
-            data = alerts.get('data', []) or []
+            data = _rows(alerts)
             for alert in data:
                 # Investigation alerts API uses 'id' field instead of 'rrn'
                 alert_id = alert.get('id', 'N/A')
-                if ':' in alert_id:
-                    parts = alert_id.split(':')
-                    if len(parts) >= 6:
-                        alert_id = parts[-1]
-                title = alert.get('title', 'N/A')
-                alert_type = alert.get('alert_type', 'N/A')
+                alert_id = _short_id(alert_id)
+                title = alert.get('title') or 'N/A'
+                alert_type = alert.get('alert_type') or 'N/A'
                 click.echo(f"{alert_id}: {title} [Type: {alert_type}]")
         else:  # table
-            table = Table(title=f"Investigation Alerts (Investigation: {investigation_id})")
-            table.add_column("Alert ID", style="cyan")
-            table.add_column("Title", style="green")
-            table.add_column("Type", style="yellow")
-            table.add_column("Source", style="blue")
-            table.add_column("Created", style="dim")
+            table = _make_table(f"Investigation Alerts (Investigation: {investigation_id})", _INVESTIGATION_ALERT_COLS)
 
-            data = alerts.get('data', []) or []
+            data = _rows(alerts)
+            # Investigation alerts API uses 'id' (an RRN) rather than 'rrn'
             for alert in data:
-                # Extract short ID from RRN - investigation alerts API uses 'id' field
-                alert_id = alert.get('id', 'N/A')
-                if ':' in alert_id:
-                    parts = alert_id.split(':')
-                    if len(parts) >= 6:
-                        alert_id = parts[-1]
-                
-                title = alert.get('title', 'N/A')
-                if len(title) > 50:
-                    title = title[:47] + '...'
-                
-                # Format created time - investigation alerts API uses 'created_time'
-                created_time = alert.get('created_time', 'N/A')
-                if created_time != 'N/A' and 'T' in created_time:
-                    created_time = created_time.split('T')[0]
-                
-                alert_type = alert.get('alert_type', 'N/A')
-                if len(alert_type) > 25:
-                    alert_type = alert_type[:22] + '...'
-                
-                alert_source = alert.get('alert_source', 'N/A')
-                if len(alert_source) > 15:
-                    alert_source = alert_source[:12] + '...'
-                
                 table.add_row(
-                    alert_id,
-                    title,
-                    alert_type,
-                    alert_source,
-                    created_time
+                    _short_id(alert.get('id') or 'N/A'),
+                    _truncate(alert.get('title') or 'N/A', 50),
+                    _truncate(alert.get('alert_type') or 'N/A', 25),
+                    _truncate(alert.get('alert_source') or 'N/A', 15),
+                    (alert.get('created_time') or 'N/A').partition('T')[0]
                 )
             console.print(table)
             
@@ -625,7 +587,7 @@ def list_investigation_alerts(ctx, investigation_id, limit, output, no_cache):
             if data:
                 console.print("[dim]💡 Use 'r7 siem alert get <alert_id>' to view detailed information for any alert[/dim]")
 
-    except Exception as e:
+    except _USER_ERRORS as e:
         console.print(f"[red]Error: {str(e)}[/red]")
         raise click.Abort()
 
@@ -639,7 +601,7 @@ def alert_group(ctx):
 @alert_group.command('list')
 @click.option('--limit', type=int, default=20, help='Maximum number of alerts to return (default: 20)')
 @click.option('--rrns-only', is_flag=True, help='Return only alert RRNs without details')
-@click.option('--output', type=click.Choice(['simple', 'table', 'json']),
+@click.option('--output', type=_OUTPUT_CHOICE,
               help='Output format')
 @click.option('--no-cache', is_flag=True, help='Disable caching for this request')
 @click.option('--full-output', is_flag=True, help='Include all fields in JSON output (default shows minimal fields matching table view)')
@@ -647,85 +609,55 @@ def alert_group(ctx):
 def list_alerts(ctx, limit, rrns_only, output, no_cache, full_output):
     """List alerts"""
     try:
-        config_manager = ConfigManager()
-        config_manager.validate()
-
-        # Credentials and region
-        api_key = CredentialManager.get_api_key(ctx.obj.get('api_key'))
-        if not api_key:
-            raise AuthenticationError("API key not found. Use 'r7 config cred store' to save credentials.")
-        region = ctx.obj.get('region') or config_manager.get('region', 'us')
-
-        # Cache
-        cache_manager = None
-        if config_manager.get('cache_enabled') and not no_cache:
-            cache_manager = CacheManager(ttl=config_manager.get('cache_ttl'))
-        client = Rapid7Client(api_key, region, cache_manager)
+        client, config_manager, region = _setup(ctx, no_cache)
 
         # Search alerts with default parameters
         alerts = client.search_alerts(
             rrns_only=rrns_only,
             size=limit
         )
+        alerts_data = _as_dict(alerts)
 
         # Output
         use_format = determine_output_format(output, config_manager)
         if use_format == 'json':
             if full_output:
                 # Full output - include all fields
-                click.echo(json.dumps(alerts, indent=2))
+                json_fast.write(alerts)
             else:
                 # Minimal output - only include fields shown in table view
                 if rrns_only:
                     # For rrns_only, keep simple structure
                     minimal_data = {
-                        'rrns': alerts.get('rrns', []),
-                        'metadata': alerts.get('metadata', {}),
-                        'region_failures': alerts.get('region_failures', [])
+                        'rrns': alerts_data.get('rrns', []),
+                        'metadata': alerts_data.get('metadata', {}),
+                        'region_failures': alerts_data.get('region_failures', [])
                     }
                 else:
                     # Create minimal alert data matching table view
-                    minimal_alerts = []
-                    for alert in alerts.get('alerts', []):
-                        # Extract only the fields shown in the table
-                        minimal_alert = {
-                            'rrn': alert.get('rrn'),
-                            'title': alert.get('title'),
-                            'status': alert.get('status'),
-                            'priority': alert.get('priority'),
-                            'created_at': alert.get('created_at')
-                        }
-                        minimal_alerts.append(minimal_alert)
+                    minimal_alerts = [{key: alert.get(key) for key in _MINIMAL_ALERT_KEYS}
+                                      for alert in _rows(alerts, 'alerts')]
                     
                     minimal_data = {
                         'alerts': minimal_alerts,
-                        'metadata': alerts.get('metadata', {}),
-                        'region_failures': alerts.get('region_failures', [])
+                        'metadata': alerts_data.get('metadata', {}),
+                        'region_failures': alerts_data.get('region_failures', [])
                     }
                 
-                click.echo(json.dumps(minimal_data, indent=2))
+                json_fast.write(minimal_data)
         elif use_format == 'simple':
             if rrns_only:
                 # When rrns_only=True, the response contains RRNs in the 'rrns' field
-                rrns = alerts.get('rrns', []) or []
+                rrns = alerts_data.get('rrns') or ()
                 for rrn in rrns:
-                    if ':' in rrn:
-                        parts = rrn.split(':')
-                        if len(parts) >= 6:
-                            alert_id = parts[-1]
-                            click.echo(alert_id)
-                    else:
-                        click.echo(rrn)
+                    click.echo(_short_id(rrn))
             else:
-                data = alerts.get('alerts', []) or []
+                data = _rows(alerts, 'alerts')
                 for alert in data:
                     alert_id = alert.get('rrn', 'N/A')
-                    if ':' in alert_id:
-                        parts = alert_id.split(':')
-                        if len(parts) >= 6:
-                            alert_id = parts[-1]
-                    title = alert.get('title', 'N/A')
-                    status = alert.get('status', 'N/A')
+                    alert_id = _short_id(alert_id)
+                    title = alert.get('title') or 'N/A'
+                    status = alert.get('status') or 'N/A'
                     click.echo(f"{alert_id}: {title} [{status}]")
         else:  # table
             if rrns_only:
@@ -733,39 +665,25 @@ def list_alerts(ctx, limit, rrns_only, output, no_cache, full_output):
                 table.add_column("Alert ID", style="cyan")
                 table.add_column("Full RRN", style="dim")
 
-                rrns = alerts.get('rrns', []) or []
+                rrns = alerts_data.get('rrns') or ()
                 for rrn in rrns:
-                    if ':' in rrn:
-                        parts = rrn.split(':')
-                        if len(parts) >= 6:
-                            alert_id = parts[-1]
-                            table.add_row(alert_id, rrn)
-                    else:
-                        table.add_row(rrn, rrn)
+                    table.add_row(_short_id(rrn), rrn)
                 console.print(table)
             else:
-                table = Table(title=f"Alerts (limit {limit})")
-                table.add_column("ID", style="cyan")
-                table.add_column("Title", style="green")
-                table.add_column("Status", style="yellow")
-                table.add_column("Priority", style="red")
-                table.add_column("Created", style="dim")
-
-                data = alerts.get('alerts', []) or []
+                table = _make_table(f"Alerts (limit {limit})", _ALERT_COLS)
+
+                data = _rows(alerts, 'alerts')
                 for alert in data:
                     # Extract short ID from RRN
                     alert_id = alert.get('rrn', 'N/A')
-                    if ':' in alert_id:
-                        parts = alert_id.split(':')
-                        if len(parts) >= 6:
-                            alert_id = parts[-1]
+                    alert_id = _short_id(alert_id)
                     
-                    title = alert.get('title', 'N/A')
+                    title = alert.get('title') or 'N/A'
                     if len(title) > 50:
                         title = title[:47] + '...'
                     
                     # Format created time  
-                    created_time = alert.get('created_at', 'N/A')
+                    created_time = alert.get('created_at') or 'N/A'
                     if created_time != 'N/A' and 'T' in created_time:
                         created_time = created_time.split('T')[0]
                     
@@ -777,32 +695,19 @@ def list_alerts(ctx, limit, rrns_only, output, no_cache, full_output):
                         created_time
                     )
                 console.print(table)
-    except Exception as e:
+    except _USER_ERRORS as e:
         console.print(f"[red]Error: {str(e)}[/red]")
         raise click.Abort()
 
 @alert_group.command('get')
 @click.argument('alert_id')
-@click.option('--output', type=click.Choice(['simple', 'table', 'json']),
+@click.option('--output', type=_OUTPUT_CHOICE,
               help='Output format')
 @click.pass_context
 def get_alert(ctx, alert_id, output):
     """Get alert details by ID or RRN"""
     try:
-        config_manager = ConfigManager()
-        config_manager.validate()
-
-        # Credentials and region
-        api_key = CredentialManager.get_api_key(ctx.obj.get('api_key'))
-        if not api_key:
-            raise AuthenticationError("API key not found. Use 'r7 config cred store' to save credentials.")
-        region = ctx.obj.get('region') or config_manager.get('region', 'us')
-
-        # Cache
-        cache_manager = None
-        if config_manager.get('cache_enabled'):
-            cache_manager = CacheManager(ttl=config_manager.get('cache_ttl'))
-        client = Rapid7Client(api_key, region, cache_manager)
+        client, config_manager, region = _setup(ctx)
 
         # Build full RRN if only short ID provided
         if ':' not in alert_id:
@@ -812,17 +717,17 @@ def get_alert(ctx, alert_id, output):
             if not org_id:
                 # Try to get org_id from a sample alert list
                 try:
-                    sample_alerts = client.search_alerts(size=1)
-                    if sample_alerts.get('alerts') and len(sample_alerts['alerts']) > 0:
-                        sample_rrn = sample_alerts['alerts'][0].get('rrn', '')
+                    sample_alerts = _rows(client.search_alerts(size=1), 'alerts')
+                    if sample_alerts:
+                        sample_rrn = str(sample_alerts[0].get('rrn') or '')
                         if sample_rrn:
                             parts = sample_rrn.split(':')
                             if len(parts) >= 6:
                                 org_id = parts[2]
                                 config_manager.set('organization_id', org_id)
                                 config_manager.save_config()
-                except:
-                    pass
+                except _USER_ERRORS:
+                    logger.debug("org_id discovery failed", exc_info=True)
             
             if org_id:
                 alert_rrn = f"rrn:alerts:{region}:{org_id}:alert:1:{alert_id}"
@@ -837,14 +742,12 @@ def get_alert(ctx, alert_id, output):
         # Output
         use_format = determine_output_format(output, config_manager)
         if use_format == 'json':
-            click.echo(json.dumps(alert, indent=2))
+            json_fast.write(alert)
         else:
+            alert = _as_dict(alert)
             # Extract short ID for display
             display_id = alert.get('rrn', 'N/A')
-            if ':' in display_id:
-                parts = display_id.split(':')
-                if len(parts) >= 6:
-                    display_id = parts[-1]
+            display_id = _short_id(display_id)
             
             if use_format == 'simple':
                 click.echo(f"ID: {display_id}")
@@ -855,36 +758,23 @@ def get_alert(ctx, alert_id, output):
                 click.echo(f"Created: {alert.get('created_at', 'N/A')}")
                 click.echo(f"Updated: {alert.get('updated_at', 'N/A')}")
                 if alert.get('investigation_rrn'):
-                    inv_parts = alert['investigation_rrn'].split(':')
-                    inv_id = inv_parts[-1] if len(inv_parts) >= 6 else alert['investigation_rrn']
+                    inv_id = _short_id(alert['investigation_rrn'])
                     click.echo(f"Investigation: {inv_id}")
             else:  # table
-                panel_content = f"""
-[bold cyan]ID:[/bold cyan] {display_id}
-[bold cyan]Title:[/bold cyan] {alert.get('title', 'N/A')}
-[bold cyan]Status:[/bold cyan] {alert.get('status', 'N/A')}
-[bold cyan]Priority:[/bold cyan] {alert.get('priority', 'N/A')}
-[bold cyan]Type:[/bold cyan] {alert.get('type', 'N/A')}
-[bold cyan]Disposition:[/bold cyan] {alert.get('disposition', 'N/A')}
-[bold cyan]External Source:[/bold cyan] {alert.get('external_source', 'N/A')}
-[bold cyan]Created:[/bold cyan] {alert.get('created_at', 'N/A')}
-[bold cyan]Updated:[/bold cyan] {alert.get('updated_at', 'N/A')}
-[bold cyan]Alerted At:[/bold cyan] {alert.get('alerted_at', 'N/A')}"""
-                
+                fields = collections.defaultdict(lambda: 'N/A', alert)
+                fields['display_id'] = display_id
+                panel_content = _ALERT_PANEL_TEMPLATE.format_map(fields)
                 if alert.get('investigation_rrn'):
-                    inv_parts = alert['investigation_rrn'].split(':')
-                    inv_id = inv_parts[-1] if len(inv_parts) >= 6 else alert['investigation_rrn']
+                    inv_id = _short_id(alert['investigation_rrn'])
                     panel_content += f"\n[bold cyan]Investigation:[/bold cyan] {inv_id}"
                 
                 if alert.get('assignee'):
-                    assignee = alert['assignee']
-                    assignee_info = assignee.get('name', assignee.get('email', 'Unknown'))
-                    panel_content += f"\n[bold cyan]Assignee:[/bold cyan] {assignee_info}"
+                    panel_content += f"\n[bold cyan]Assignee:[/bold cyan] {_assignee_name(alert['assignee'])}"
                 
                 console.print(Panel(panel_content, title=f"Alert: {alert.get('title', 'N/A')}", expand=False))
                 
                 # Show rule keys of interest if available
-                keys_of_interest = alert.get('rule_keys_of_interest', [])
+                keys_of_interest = _rows(alert, 'rule_keys_of_interest')
                 if keys_of_interest:
                     table = Table(title="Rule Keys of Interest")
                     table.add_column("Key", style="cyan")
@@ -892,7 +782,7 @@ def get_alert(ctx, alert_id, output):
                     
                     for key_info in keys_of_interest:
                         key_name = key_info.get('key', 'Unknown')
-                        values = key_info.get('values', [])
+                        values = key_info.get('values') or []
                         values_str = ', '.join(str(v) for v in values[:3])  # Show first 3 values
                         if len(values) > 3:
                             values_str += f" (and {len(values) - 3} more)"
@@ -900,7 +790,7 @@ def get_alert(ctx, alert_id, output):
                     
                     console.print(table)
 
-    except Exception as e:
+    except _USER_ERRORS as e:
         console.print(f"[red]Error: {str(e)}[/red]")
         raise click.Abort()
 
@@ -917,27 +807,14 @@ def get_alert(ctx, alert_id, output):
 @click.option('--add-tags', help='Comma-separated list of tags to add')
 @click.option('--remove-tags', help='Comma-separated list of tags to remove')
 @click.option('--comment', help='Reason for updating the alert (for audit log)')
-@click.option('--output', type=click.Choice(['simple', 'table', 'json']),
+@click.option('--output', type=_OUTPUT_CHOICE,
               help='Output format')
 @click.pass_context
 def update_alert(ctx, alert_id, status, disposition, priority, assignee_id, investigation_rrn, 
                 add_tags, remove_tags, comment, output):
     """Update a single alert"""
     try:
-        config_manager = ConfigManager()
-        config_manager.validate()
-
-        # Credentials and region
-        api_key = CredentialManager.get_api_key(ctx.obj.get('api_key'))
-        if not api_key:
-            raise AuthenticationError("API key not found. Use 'r7 config cred store' to save credentials.")
-        region = ctx.obj.get('region') or config_manager.get('region', 'us')
-
-        # Cache
-        cache_manager = None
-        if config_manager.get('cache_enabled'):
-            cache_manager = CacheManager(ttl=config_manager.get('cache_ttl'))
-        client = Rapid7Client(api_key, region, cache_manager)
+        client, config_manager, region = _setup(ctx)
 
         # Build full RRN if only short ID provided
         if ':' not in alert_id:
@@ -945,17 +822,17 @@ def update_alert(ctx, alert_id, status, disposition, priority, assignee_id, inve
             if not org_id:
                 # Try to get org_id from a sample alert list
                 try:
-                    sample_alerts = client.search_alerts(size=1)
-                    if sample_alerts.get('alerts') and len(sample_alerts['alerts']) > 0:
-                        sample_rrn = sample_alerts['alerts'][0].get('rrn', '')
+                    sample_alerts = _rows(client.search_alerts(size=1), 'alerts')
+                    if sample_alerts:
+                        sample_rrn = str(sample_alerts[0].get('rrn') or '')
                         if sample_rrn:
                             parts = sample_rrn.split(':')
                             if len(parts) >= 6:
                                 org_id = parts[2]
                                 config_manager.set('organization_id', org_id)
                                 config_manager.save_config()
-                except:
-                    pass
+                except _USER_ERRORS:
+                    logger.debug("org_id discovery failed", exc_info=True)
             
             if org_id:
                 alert_rrn = f"rrn:alerts:{region}:{org_id}:alert:1:{alert_id}"
@@ -1007,14 +884,11 @@ def update_alert(ctx, alert_id, status, disposition, priority, assignee_id, inve
         # Output
         use_format = determine_output_format(output, config_manager)
         if use_format == 'json':
-            click.echo(json.dumps(result, indent=2))
+            json_fast.write(result)
         else:
             # Extract short ID for display
             display_id = alert_rrn
-            if ':' in display_id:
-                parts = display_id.split(':')
-                if len(parts) >= 6:
-                    display_id = parts[-1]
+            display_id = _short_id(display_id)
             
             console.print(f"[green]✓ Alert {display_id} updated successfully[/green]")
             
@@ -1054,10 +928,9 @@ def update_alert(ctx, alert_id, status, disposition, priority, assignee_id, inve
                 try:
                     alert_info = client.get_alert(alert_rrn)
                     if alert_info.get('investigation_rrn'):
-                        inv_parts = alert_info['investigation_rrn'].split(':')
-                        inv_id = inv_parts[-1] if len(inv_parts) >= 6 else alert_info['investigation_rrn']
+                        inv_id = _short_id(alert_info['investigation_rrn'])
                         console.print(f"[dim]   • r7 siem investigation update {inv_id} --status CLOSED[/dim]")
-                except:
+                except _USER_ERRORS:
                     pass
             
             # Show validation errors if present
@@ -1069,7 +942,7 @@ def update_alert(ctx, alert_id, status, disposition, priority, assignee_id, inve
         else:
             console.print(f"[red]Error: {str(e)}[/red]")
         raise click.Abort()
-    except Exception as e:
+    except _USER_ERRORS as e:
         console.print(f"[red]Error: {str(e)}[/red]")
         raise click.Abort()
 
@@ -1083,27 +956,15 @@ def comment_group(ctx):
 @comment_group.command('list')
 @click.option('--target', help='Filter comments by target (investigation RRN)')
 @click.option('--investigation-id', help='Filter comments by investigation ID (will be converted to RRN)')
-@click.option('--output', type=click.Choice(['simple', 'table', 'json']),
+@click.option('--output', type=_OUTPUT_CHOICE,
               help='Output format')
 @click.option('--limit', type=int, help='Maximum number of comments to return')
 @click.pass_context
 def list_comments(ctx, target, investigation_id, output, limit):
     """List comments with optional filtering"""
     try:
-        config_manager = ConfigManager()
-        cache_manager = CacheManager()
-        
-        # Get credentials
-        api_key = CredentialManager.get_api_key(ctx.obj.get('api_key'))
-        if not api_key:
-            raise AuthenticationError("API key not found. Use 'r7 config cred store' to save credentials.")
-        
-        # Get region and org_id
-        region = ctx.obj.get('region') or config_manager.get('region', 'us')
-        org_id = ctx.obj.get('org_id')
-        
-        # Create client
-        client = Rapid7Client(api_key, region, cache_manager)
+        client, config_manager, region = _setup(ctx)
+        org_id = ctx.obj.org_id
         
         # Resolve investigation ID to RRN if provided
         resolved_target = target
@@ -1129,16 +990,14 @@ def list_comments(ctx, target, investigation_id, output, limit):
         # Output
         use_format = determine_output_format(output, config_manager)
         if use_format == 'json':
-            click.echo(json.dumps(comments, indent=2))
+            json_fast.write(comments)
         elif use_format == 'simple':
-            data = comments.get('data', []) or []
+            data = _rows(comments)
             for comment in data:
                 comment_id = comment.get('rrn', 'N/A')
-                if ':' in comment_id:
-                    parts = comment_id.split(':')
-                    if len(parts) >= 6:
-                        comment_id = parts[-1]
-                body_preview = comment.get('body', '')[:50] + ('...' if len(comment.get('body', '')) > 50 else '')
+                comment_id = _short_id(comment_id)
+                body = comment.get('body') or ''
+                body_preview = body[:50] + ('...' if len(body) > 50 else '')
                 click.echo(f"{comment_id}: {body_preview} [{comment.get('visibility', 'N/A')}]")
         else:  # table
             table = Table(title="Comments")
@@ -1148,20 +1007,17 @@ def list_comments(ctx, target, investigation_id, output, limit):
             table.add_column("Author", style="blue")
             table.add_column("Created", style="dim")
 
-            data = comments.get('data', []) or []
+            data = _rows(comments)
             for comment in data:
                 comment_id = comment.get('rrn', 'N/A')
-                if ':' in comment_id:
-                    parts = comment_id.split(':')
-                    if len(parts) >= 6:
-                        comment_id = parts[-1]
+                comment_id = _short_id(comment_id)
                 
-                body = comment.get('body', 'N/A')
+                body = comment.get('body') or 'N/A'
                 if len(body) > 50:
                     body = body[:47] + '...'
                 
-                author = comment.get('creator', {}).get('name', 'Unknown')
-                created_time = comment.get('created_time', 'N/A')
+                author = _as_dict(comment.get('creator')).get('name') or 'Unknown'
+                created_time = comment.get('created_time') or 'N/A'
                 if created_time != 'N/A' and 'T' in created_time:
                     created_time = created_time.split('T')[0]
                 
@@ -1174,30 +1030,21 @@ def list_comments(ctx, target, investigation_id, output, limit):
                 )
             console.print(table)
             
-    except Exception as e:
+    except _USER_ERRORS as e:
         console.print(f"[red]Error: {str(e)}[/red]")
         raise click.Abort()
 
 @comment_group.command('create')
 @click.argument('investigation_id')
 @click.argument('body')
-@click.option('--output', type=click.Choice(['simple', 'table', 'json']),
+@click.option('--output', type=_OUTPUT_CHOICE,
               help='Output format')
 @click.pass_context
 def create_comment(ctx, investigation_id, body, output):
     """Create a comment on an investigation"""
     try:
-        config_manager = ConfigManager()
-        cache_manager = CacheManager()
-        
-        # Get credentials
-        api_key = CredentialManager.get_api_key(ctx.obj.get('api_key'))
-        if not api_key:
-            raise AuthenticationError("API key not found. Use 'r7 config cred store' to save credentials.")
-        
-        region = ctx.obj.get('region') or config_manager.get('region', 'us')
-        org_id = ctx.obj.get('org_id')
-        client = Rapid7Client(api_key, region, cache_manager)
+        client, config_manager, region = _setup(ctx)
+        org_id = ctx.obj.org_id
         
         # Resolve investigation ID to RRN
         resolved_target = resolve_investigation_id(client, investigation_id, region, config_manager, org_id)
@@ -1206,44 +1053,35 @@ def create_comment(ctx, investigation_id, body, output):
         
         use_format = determine_output_format(output, config_manager)
         if use_format == 'json':
-            click.echo(json.dumps(comment, indent=2))
+            json_fast.write(comment)
         else:
-            comment_data = comment if isinstance(comment, dict) else {}
+            comment_data = _as_dict(comment)
             console.print("[green]✓ Comment created successfully[/green]")
             console.print(f"[bold cyan]RRN:[/bold cyan] {comment_data.get('rrn', 'N/A')}")
             console.print(f"[bold cyan]Target:[/bold cyan] {comment_data.get('target', 'N/A')}")
             
-    except Exception as e:
+    except _USER_ERRORS as e:
         console.print(f"[red]Error: {str(e)}[/red]")
         raise click.Abort()
 
 @comment_group.command('delete')
 @click.argument('comment_rrn')
-@click.option('--output', type=click.Choice(['simple', 'table', 'json']),
+@click.option('--output', type=_OUTPUT_CHOICE,
               help='Output format')
 @click.pass_context
 def delete_comment(ctx, comment_rrn, output):
     """Delete a comment"""
     try:
-        config_manager = ConfigManager()
-        cache_manager = CacheManager()
-        
-        # Get credentials
-        api_key = CredentialManager.get_api_key(ctx.obj.get('api_key'))
-        if not api_key:
-            raise AuthenticationError("API key not found. Use 'r7 config cred store' to save credentials.")
-        
-        region = ctx.obj.get('region') or config_manager.get('region', 'us')
-        client = Rapid7Client(api_key, region, cache_manager)
+        client, config_manager, region = _setup(ctx)
         result = client.delete_comment(comment_rrn)
         
         use_format = determine_output_format(output, config_manager)
         if use_format == 'json':
-            click.echo(json.dumps(result, indent=2))
+            json_fast.write(result)
         else:
             console.print("[green]✓ Comment deleted successfully[/green]")
             
-    except Exception as e:
+    except _USER_ERRORS as e:
         console.print(f"[red]Error: {str(e)}[/red]")
         raise click.Abort()
 
@@ -2,6 +2,8 @@ import json
 import sys
 import re
 from datetime import datetime, timedelta
+from functools import lru_cache
+from operator import itemgetter
 import click
 from urllib.parse import quote
 from rich.console import Console
@@ -208,20 +210,23 @@ def _render_groupby_table(statistics, title_suffix=""):
     if not rows:
         return False
 
+    columns = metric_keys or ["count"]
     table = Table(title=f"Group Results{f' - {title_suffix}' if title_suffix else ''}")
     table.add_column("Group", style="cyan")
-    for mk in metric_keys or ["count"]:
+    for mk in columns:
         table.add_column(mk.capitalize(), style="yellow", justify="right")
 
-    # Sort rows by primary metric if available
-    primary_metric = metric_keys[0] if metric_keys else "count"
+    # Sort rows by primary metric; fill it in first so the C-level itemgetter can be the key
+    primary_metric = columns[0]
+    for r in rows:
+        r.setdefault(primary_metric, 0)
     try:
-        rows = sorted(rows, key=lambda r: r.get(primary_metric, 0), reverse=True)
-    except Exception:
+        rows.sort(key=itemgetter(primary_metric), reverse=True)
+    except TypeError:
         pass
 
     for r in rows[:100]:  # cap rows for readability
-        values = [r.get(mk, 0) for mk in metric_keys or ["count"]]
+        values = [r.get(mk, 0) for mk in columns]
         table.add_row(r.get("group", ""), *[f"{v:.0f}" if isinstance(v, float) else str(v) for v in values])
 
     console.print(table)
@@ -230,16 +235,39 @@ def _render_groupby_table(statistics, title_suffix=""):
         console.print(f"[dim]... and {len(rows) - 100} more groups (use --output json to see all)[/dim]")
     return True
 
+def _write_event_messages(events):
+    """Write each event's message to stdout as one JSON array (JSON messages parsed, others raw).
+    Elements are encoded one at a time, so neither the message list nor the full string is built;
+    the output is identical to json.dumps(messages).
+    """
+    loads, dumps, write = json.loads, json.dumps, sys.stdout.write
+    write('[')
+    separator = ''
+    for event in events:
+        message = event.get('message', '')
+        try:
+            message = loads(message)
+        except (json.JSONDecodeError, TypeError):
+            pass
+        write(separator + dumps(message))
+        separator = ', '
+    write(']\n')
+    sys.stdout.flush()
+
+# limit(N) clause in a LEQL query, case insensitive
+_LIMIT_RE = re.compile(r'limit\s*\(\s*(\d+)\s*\)', re.IGNORECASE)
+
+@lru_cache(maxsize=256)
 def parse_leql_limit(query):
     """
     Parse LEQL query to extract limit value if present.
     Returns the limit as an integer, or None if no limit found.
+    Memoised, since pagination asks for the same query's limit more than once.
     """
     if not query:
         return None
     
-    # Look for limit(N) pattern, case insensitive
-    limit_match = re.search(r'limit\s*\(\s*(\d+)\s*\)', query, re.IGNORECASE)
+    limit_match = _LIMIT_RE.search(query)
     if limit_match:
         return int(limit_match.group(1))
     
@@ -324,14 +352,18 @@ def display_raw_events_table(events, title, max_events=50, extra_columns=None, m
     
     return total_events
 
+@lru_cache(maxsize=1024)
+def _fmt_sec(seconds):
+    """Local-time string for a whole unix second; events often share one"""
+    return datetime.fromtimestamp(seconds).strftime('%Y-%m-%d %H:%M:%S')
+
 def format_timestamp(timestamp):
     """Convert unix timestamp (milliseconds) to readable format"""
     if not timestamp:
         return ''
     try:
-        # Convert milliseconds to seconds
-        dt = datetime.fromtimestamp(timestamp / 1000)
-        return dt.strftime('%Y-%m-%d %H:%M:%S')
+        # Whole seconds; the format has no sub-second part
+        return _fmt_sec(timestamp // 1000)
     except (ValueError, TypeError):
         return str(timestamp)
 
@@ -367,16 +399,23 @@ def get_topkeys_for_log(client, log_id):
     return []
 
 
+@lru_cache(maxsize=256)
+def _parse_field_name(field_name):
+    """(key path for a json.* field or None for a top-level event field, display title).
+    Split once per field name rather than once per event and column."""
+    path = tuple(field_name[5:].split('.')) if field_name.startswith('json.') else None
+    return path, field_name.rpartition('.')[2].replace('_', ' ').title()
+
 def extract_smart_field_value(field_name, parsed_data, event):
     """
     Intelligently extract a useful value from a field, handling nested objects.
     Returns (display_name, clean_value) or None if no useful value found.
     """
     value = None
+    field_path, field_title = _parse_field_name(field_name)
     
-    if field_name.startswith('json.'):
+    if field_path is not None:
         # Navigate nested JSON structure
-        field_path = field_name[5:].split('.')
         value = parsed_data
         for path_part in field_path:
             if isinstance(value, dict) and path_part in value:
@@ -434,8 +473,8 @@ def extract_smart_field_value(field_name, parsed_data, event):
     
     # Handle primitive values
     elif value is not None and str(value).strip():
-        # Create clean display name from field path
-        display_name = field_name.split('.')[-1].replace('_', ' ').title()
+        # Clean display name from the last segment of the field path
+        display_name = field_title
         clean_value = str(value)[:30]
         if len(str(value)) > 30:
             clean_value += "..."
@@ -550,7 +589,7 @@ def get_client_and_config(ctx, api_key=None):
     # Preserve api_key override support if provided
     return ClientManager().get_client_and_config(ctx, api_key=api_key)
 
-# This group will be added to siem_group in idr_commands.py
+# Loaded lazily by siem_group in idr_commands.py
 @click.group(name='logs')
 def siem_logs_group():
     """Commands for SIEM logs"""
@@ -679,17 +718,7 @@ def query_log(ctx, log_name_or_id, query, time_range, from_time, to_time, from_d
                 click.echo(json.dumps(data, indent=2))
             else:
                 # Show only raw log messages by default
-                events = data.get('events', [])
-                messages = []
-                for event in events:
-                    message = event.get('message', '')
-                    # Try to parse JSON message, fallback to raw string if not JSON
-                    try:
-                        parsed_message = json.loads(message)
-                        messages.append(parsed_message)
-                    except (json.JSONDecodeError, TypeError):
-                        messages.append(message)
-                click.echo(json.dumps(messages))
+                _write_event_messages(data.get('events') or ())
         else:
             # Check if we have events OR statistics
             has_events = 'events' in data and data['events']
@@ -866,17 +895,7 @@ def query_logset(ctx, logset_name_or_id, query, time_range, from_time, to_time,
                 click.echo(json.dumps(data, indent=2))
             else:
                 # Show only raw log messages by default
-                events = data.get('events', [])
-                messages = []
-                for event in events:
-                    message = event.get('message', '')
-                    # Try to parse JSON message, fallback to raw string if not JSON
-                    try:
-                        parsed_message = json.loads(message)
-                        messages.append(parsed_message)
-                    except (json.JSONDecodeError, TypeError):
-                        messages.append(message)
-                click.echo(json.dumps(messages))
+                _write_event_messages(data.get('events') or ())
         else:
             # Check if we have events OR statistics
             has_events = 'events' in data and data['events']
@@ -992,17 +1011,7 @@ def query_all_logsets(ctx, query, time_range, from_time, to_time, from_date, to_
                 click.echo(json.dumps(data, indent=2))
             else:
                 # Show only raw log messages by default
-                events = data.get('events', [])
-                messages = []
-                for event in events:
-                    message = event.get('message', '')
-                    # Try to parse JSON message, fallback to raw string if not JSON
-                    try:
-                        parsed_message = json.loads(message)
-                        messages.append(parsed_message)
-                    except (json.JSONDecodeError, TypeError):
-                        messages.append(message)
-                click.echo(json.dumps(messages))
+                _write_event_messages(data.get('events') or ())
         else:
             # Check if we have events OR statistics
             has_events = 'events' in data and data['events']
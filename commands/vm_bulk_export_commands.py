@@ -30,8 +30,8 @@ def determine_output_format(output, config):
 def _get_vm_cloud_client(ctx) -> InsightVMCloudClient:
     """Get InsightVM Cloud API client from context"""
     # First try context (CLI flags)
-    api_key = ctx.obj.get('api_key')
-    region = ctx.obj.get('region')
+    api_key = ctx.obj.api_key
+    region = ctx.obj.region
     
     # If not in context, get from config
     if not api_key or not region:
@@ -29,8 +29,8 @@ def _get_vm_console_client(config: ConfigManager) -> InsightVMConsoleClient:
 
 def _get_vm_cloud_client(ctx) -> InsightVMCloudClient:
     """Get InsightVM Cloud API client from context"""
-    api_key = ctx.obj.get('api_key')
-    region = ctx.obj.get('region')
+    api_key = ctx.obj.api_key
+    region = ctx.obj.region
     
     if not api_key:
         raise AuthenticationError("API key required. Set via --api-key or R7_API_KEY env var")
@@ -4,16 +4,8 @@ r7 CLI
 """
 import click
 import logging
-from commands.config_commands import config_group
-from commands.account_commands import account_group
-from commands.appsec_commands import appsec_group
-# logs_group now moved to siem.logs
-from commands.asm_commands import asm_group
-from commands.docs_commands import docs
-from commands.idr_commands import siem_group
-from commands.vm_commands import vm_group
-from commands.ic_commands import ic_group
-from commands.agents_commands import agents_group
+from utils.lazy import LazyGroup
+from utils.context import R7Context
 
 logging.basicConfig(
     level=logging.INFO,
@@ -21,7 +13,22 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@click.group()
+# Command groups (nested commands are attached within their modules); each module is
+# only imported when its group is actually run, so `r7 docs ...` never loads asm or siem
+_COMMAND_GROUPS = {
+    'config': 'commands.config_commands:config_group',
+    'account': 'commands.account_commands:account_group',
+    'agents': 'commands.agents_commands:agents_group',
+    'appsec': 'commands.appsec_commands:appsec_group',
+    # logs_group now part of siem group
+    'asm': 'commands.asm_commands:asm_group',
+    'docs': 'commands.docs_commands:docs',
+    'ic': 'commands.ic_commands:ic_group',
+    'siem': 'commands.idr_commands:siem_group',
+    'vm': 'commands.vm_commands:vm_group',
+}
+
+@click.group(cls=LazyGroup, lazy_subcommands=_COMMAND_GROUPS)
 @click.option('--api-key', envvar='R7_API_KEY', help='Rapid7 API Key (or use keychain/env)')
 @click.option('--region', type=click.Choice(['us', 'eu', 'ca', 'ap', 'au']), help='API Region')
 @click.option('--org-id', help='Organization ID for RRN reconstruction')
@@ -36,23 +43,7 @@ def cli(ctx, api_key, region, org_id, verbose):
         logging.getLogger('utils').setLevel(logging.DEBUG)
         logging.getLogger('api').setLevel(logging.DEBUG)
         logging.getLogger('commands').setLevel(logging.DEBUG)
-    ctx.ensure_object(dict)
-    ctx.obj['api_key'] = api_key
-    ctx.obj['region'] = region
-    ctx.obj['org_id'] = org_id
-    ctx.obj['verbose'] = verbose
-
-# Register command groups (nested commands are attached within their modules)
-cli.add_command(config_group)
-cli.add_command(account_group)
-cli.add_command(agents_group)
-cli.add_command(appsec_group)
-# logs_group now part of siem group
-cli.add_command(asm_group)
-cli.add_command(docs)
-cli.add_command(siem_group)
-cli.add_command(vm_group)
-cli.add_command(ic_group)
+    ctx.obj = R7Context(api_key, region, org_id, verbose)
 
 def main():
     """Entry point for the r7 CLI"""
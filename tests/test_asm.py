@@ -0,0 +1,95 @@
+"""
+Test ASM cypher helper parsing
+"""
+import pytest
+from pathlib import Path
+import sys
+
+# Add parent directory to path to import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import commands.asm_commands as asm_commands
+from commands.asm_commands import _parse_columns_arg, _parse_return_clause, _to_columnar, should_use_json_output
+from utils.exceptions import QueryError
+
+
+class TestParseReturnClause:
+    def test_aliases_and_properties(self):
+        """Aliases win, property access uses the last segment"""
+        query = "MATCH (s:Service) RETURN s.service_port, count(*) AS total LIMIT 5"
+        assert _parse_return_clause(query) == ['service_port', 'total']
+
+    def test_nested_commas_not_split(self):
+        """Commas inside function calls and lists stay in one column"""
+        query = "MATCH (m) RETURN coalesce(m.name, m.id), [m.a, m.b] AS pair, m ORDER BY m.name"
+        assert _parse_return_clause(query) == ['coalesce', 'pair', 'm']
+
+    def test_no_return_clause(self):
+        """Queries without RETURN yield no headers"""
+        assert _parse_return_clause("MATCH (m) DELETE m") == []
+
+
+class TestParseColumnsArg:
+    @pytest.mark.parametrize("value", [None, "", "[]", "none", "auto"])
+    def test_empty_values(self, value):
+        """Empty sentinels normalise to an empty list"""
+        assert _parse_columns_arg(value) == ([], '[]')
+
+    def test_csv(self):
+        """CSV form splits alias and property"""
+        cols, norm = _parse_columns_arg("m.name, m.asset_class,hostname")
+        assert cols == [
+            {"alias": "m", "property_name": "name"},
+            {"alias": "m", "property_name": "asset_class"},
+            {"alias": "", "property_name": "hostname"},
+        ]
+        assert norm.startswith('[{"alias":"m"')
+
+    def test_json(self):
+        """JSON form is parsed as-is"""
+        cols, _ = _parse_columns_arg('[{"alias":"u","property_name":"name"}]')
+        assert cols == [{"alias": "u", "property_name": "name"}]
+
+    def test_json_norm_ignores_key_order_and_whitespace(self):
+        """Equivalent JSON spellings share one normalized cache key"""
+        _, a = _parse_columns_arg('[{"alias":"u","property_name":"name"}]')
+        _, b = _parse_columns_arg('[ {"property_name": "name", "alias": "u"} ]')
+        assert a == b
+
+    def test_invalid_json(self):
+        """Malformed JSON raises QueryError"""
+        with pytest.raises(QueryError):
+            _parse_columns_arg('[{"alias":')
+
+
+class TestColumnarShape:
+    def test_union_of_keys(self):
+        """Keys are unioned across records and missing fields become None"""
+        shaped = _to_columnar({'a': {'name': 'A', 'version': '1'}, 'b': {'name': 'B', 'types': ['x']}})
+        assert shaped == {
+            'keys': ['name', 'version', 'types'],
+            'ids': ['a', 'b'],
+            'rows': [['A', '1', None], ['B', None, ['x']]],
+        }
+
+
+class TestShouldUseJsonOutput:
+    def test_explicit_output_wins(self):
+        """An explicit --output choice is honoured regardless of the terminal"""
+        assert should_use_json_output('table', 'json') is False
+        assert should_use_json_output('json', 'table') is True
+
+    def test_piped_defaults_to_json(self, monkeypatch):
+        """Piped stdout is probed once and then defaults to JSON"""
+        calls = []
+
+        class FakeStdout:
+            def isatty(self):
+                calls.append(1)
+                return False
+
+        monkeypatch.setattr(asm_commands, '_STDOUT_ISATTY', None)
+        monkeypatch.setattr(sys, 'stdout', FakeStdout())
+        assert should_use_json_output(None, 'table') is True
+        assert should_use_json_output(None, 'table') is True
+        assert len(calls) == 1
@@ -5,15 +5,20 @@ import pytest
 import tempfile
 from pathlib import Path
 import sys
+import threading
+from unittest.mock import MagicMock, patch
 
 # Add parent directory to path to import modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from utils.config import ConfigManager
+from utils.config import ConfigManager, get_config
 from utils.credentials import CredentialManager
 from utils.cache import CacheManager
-from utils.exceptions import ConfigurationError, AuthenticationError
+from utils.exceptions import ConfigurationError, AuthenticationError, APIError, RateLimitError
 from api.client import Rapid7Client
+from utils import json_fast
+from utils.cli import cached_or_fetch
+from commands import idr_commands
 
 
 class TestConfigManager:
@@ -62,6 +67,35 @@ class TestConfigManager:
         finally:
             Path(config_path).unlink(missing_ok=True)
 
+    def test_update_many_saves_only_valid_updates(self):
+        """update_many persists valid values and refuses invalid ones"""
+        with tempfile.NamedTemporaryFile(delete=True) as f:
+            config_path = f.name
+            
+        try:
+            config = ConfigManager(config_path)
+            config.update_many({'region': 'eu', 'cache_ttl': 60})
+            assert ConfigManager(config_path).get('cache_ttl') == 60
+            
+            with pytest.raises(ConfigurationError):
+                config.update_many({'region': 'invalid'})
+            assert ConfigManager(config_path).get('region') == 'eu'
+        finally:
+            Path(config_path).unlink(missing_ok=True)
+
+    def test_get_config_is_shared_until_cleared(self, tmp_path):
+        """get_config hands back one validated instance until cache_clear"""
+        get_config.cache_clear()
+        try:
+            with patch.object(ConfigManager, 'DEFAULT_CONFIG_PATH', tmp_path / '.rapid7_config.json'):
+                first = get_config()
+                assert get_config() is first
+                get_config.cache_clear()
+                assert get_config() is not first
+                assert first.config_path.parent == tmp_path
+        finally:
+            get_config.cache_clear()
+
 
 class TestCredentialManager:
     def test_valid_api_key(self):
@@ -95,6 +129,38 @@ class TestCacheManager:
                 # Test cache miss
                 result = cache.get('test', 'nonexistent')
                 assert result is None
+                
+                # Tuple keys are hashed by value, so equal tuples hit
+                cache.set('test', ('jobs', 30, 0, None), ['job'])
+                assert cache.get('test', ('jobs', 30, 0, None)) == ['job']
+                assert cache.get('test', ('jobs', 30, 30, None)) is None
+            finally:
+                cache.close()
+
+    def test_json_namespace_round_trip(self):
+        """Values in JSON namespaces come back equal whether or not orjson is used"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = CacheManager(cache_dir=temp_dir, ttl=3600)
+            try:
+                payload = {'data': {'workflows': [{'id': 'w1', 'tags': ['a']}]}}
+                cache.set('ic', ('workflows', 30, 0), payload)
+                assert cache.get('ic', ('workflows', 30, 0)) == payload
+            finally:
+                cache.close()
+
+    def test_ttl_policy(self):
+        """Policy TTLs apply only at the default ttl; an explicit ttl is not part of the key"""
+        assert CacheManager(ttl=0).ttl_for('log_lookup') == 0
+        assert CacheManager(ttl=60).ttl_for('log_lookup') == 60
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = CacheManager(cache_dir=temp_dir)
+            try:
+                assert cache.ttl_for('log_lookup') == 86400
+                assert cache.ttl_for('leql_query') == 3600
+                cache.set('log_lookup', 'name', 'id-1')
+                cache.set('graphql', 'organization_id', 'org-1', ttl=3600)
+                assert cache.get('log_lookup', 'name') == 'id-1'
+                assert cache.get('graphql', 'organization_id') == 'org-1'
             finally:
                 cache.close()
 
@@ -144,4 +210,199 @@ class TestAPIClient:
         """Test base URL generation for different regions"""
         client = Rapid7Client("a1b2c3d4-e5f6-7890-1234-567890abcdef", region='eu')
         url = client.get_base_url('idr')
-        assert 'eu.api.insight.rapid7.com' in url
\ No newline at end of file
+        assert 'eu.api.insight.rapid7.com' in url
+
+    def test_etag_revalidation_and_stale_fallback(self):
+        """A 304 reuses the cached body; allow_stale covers a failed request"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = CacheManager(cache_dir=temp_dir, ttl=3600)
+            client = Rapid7Client("a1b2c3d4-e5f6-7890-1234-567890abcdef", region='eu', cache_manager=cache)
+            ok = MagicMock(status_code=200, headers={'ETag': '"v1"'})
+            ok.json.return_value = {'data': [{'rrn': 'x'}]}
+            not_modified = MagicMock(status_code=304, headers={})
+            try:
+                with patch.object(client, 'make_request', side_effect=[ok, not_modified]) as request:
+                    assert client.list_investigations({'size': 5}) == {'data': [{'rrn': 'x'}]}
+                    assert client.list_investigations({'size': 5}) == {'data': [{'rrn': 'x'}]}
+                    assert request.call_args.kwargs['headers'] == {'If-None-Match': '"v1"'}
+                with patch.object(client, 'make_request', side_effect=APIError('down')):
+                    with pytest.raises(APIError):
+                        client.list_investigations({'size': 5})
+                    assert client.list_investigations({'size': 5}, allow_stale=True) == {'data': [{'rrn': 'x'}]}
+                with patch.object(client, 'make_request', side_effect=RateLimitError('slow down')):
+                    assert client.list_investigations({'size': 5}, allow_stale=True) == {'data': [{'rrn': 'x'}]}
+            finally:
+                cache.close()
+
+    def test_etag_body_not_stored_with_zero_ttl(self):
+        """cache_ttl=0 keeps investigation bodies off disk"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = CacheManager(cache_dir=temp_dir, ttl=0)
+            client = Rapid7Client("a1b2c3d4-e5f6-7890-1234-567890abcdef", region='eu', cache_manager=cache)
+            ok = MagicMock(status_code=200, headers={'ETag': '"v1"'})
+            ok.json.return_value = {'data': []}
+            try:
+                with patch.object(client, 'make_request', return_value=ok):
+                    client.list_investigations({'size': 5})
+                assert cache.stats()['size'] == 0
+            finally:
+                cache.close()
+
+
+class TestCachedOrFetch:
+    def test_fetches_once_then_hits_cache(self):
+        """Second call is served from the cache; no_cache always fetches"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            client = MagicMock()
+            client.cache_manager = CacheManager(cache_dir=temp_dir, ttl=3600)
+            fetch = MagicMock(return_value={'items': [1]})
+            try:
+                assert cached_or_fetch(client, 'test', ('k', 1), False, fetch) == {'items': [1]}
+                assert cached_or_fetch(client, 'test', ('k', 1), False, fetch) == {'items': [1]}
+                assert fetch.call_count == 1
+                cached_or_fetch(client, 'test', ('k', 1), True, fetch)
+                assert fetch.call_count == 2
+            finally:
+                client.cache_manager.close()
+
+    def test_stale_entry_is_served_then_refreshed(self):
+        """Within max_stale an expired entry is returned while a refresh runs"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            client = MagicMock()
+            client.cache_manager = CacheManager(cache_dir=temp_dir, ttl=0)
+            fetch = MagicMock(side_effect=[{'v': 1}, {'v': 2}])
+            try:
+                assert cached_or_fetch(client, 'test', 'k', False, fetch, max_stale=60) == {'v': 1}
+                assert cached_or_fetch(client, 'test', 'k', False, fetch, max_stale=60) == {'v': 1}
+                for thread in threading.enumerate():
+                    if thread is not threading.current_thread():
+                        thread.join(timeout=5)
+                assert fetch.call_count == 2
+                assert client.cache_manager.get_stale('test', 'k', 60)[0] == {'v': 2}
+            finally:
+                client.cache_manager.close()
+
+    def test_grace_does_not_extend_plain_reads(self):
+        """An entry written with grace is a miss for a plain read once its TTL has passed"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            client = MagicMock()
+            client.cache_manager = CacheManager(cache_dir=temp_dir, ttl=0)
+            fetch = MagicMock(side_effect=[{'v': 1}, {'v': 2}])
+            try:
+                assert cached_or_fetch(client, 'test', 'k', False, fetch, max_stale=3600) == {'v': 1}
+                assert cached_or_fetch(client, 'test', 'k', False, fetch) == {'v': 2}
+                assert fetch.call_count == 2
+            finally:
+                client.cache_manager.close()
+
+    def test_stale_window_is_bounded_by_reader(self):
+        """get_stale serves an expired entry only within the reader's max_stale"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = CacheManager(cache_dir=temp_dir, ttl=0)
+            try:
+                cache.set('test', 'k', {'v': 1}, grace=3600)
+                assert cache.get_stale('test', 'k', 3600) == ({'v': 1}, True)
+                assert cache.get_stale('test', 'k', 0) == (None, False)
+            finally:
+                cache.close()
+
+class TestResolveInvestigationId:
+    def test_sample_lookup_runs_once_per_region(self):
+        """The org-id fallback hits the API once, then reuses the discovered id"""
+        idr_commands._org_id_cache.clear()
+        client = MagicMock()
+        client.list_investigations.return_value = {
+            'data': [{'rrn': 'rrn:investigation:au:ORG1:investigation:ABC'}]}
+        config_manager = MagicMock()
+        config_manager.get.return_value = None
+        try:
+            for short_id in ('X1', 'X2'):
+                rrn = idr_commands.resolve_investigation_id(client, short_id, 'au', config_manager)
+                assert rrn == f'rrn:investigation:au:ORG1:investigation:{short_id}'
+            assert client.list_investigations.call_count == 1
+            config_manager.save_config.assert_called_once()
+        finally:
+            idr_commands._org_id_cache.clear()
+
+    def test_failed_lookup_is_not_retried(self):
+        """An empty sample leaves the short id as-is without a second API call"""
+        idr_commands._org_id_cache.clear()
+        client = MagicMock()
+        client.list_investigations.return_value = {'data': []}
+        config_manager = MagicMock()
+        config_manager.get.return_value = None
+        try:
+            assert idr_commands.resolve_investigation_id(client, 'X1', 'au', config_manager) == 'X1'
+            assert idr_commands.resolve_investigation_id(client, 'X2', 'au', config_manager) == 'X2'
+            assert client.list_investigations.call_count == 1
+            config_manager.save_config.assert_not_called()
+        finally:
+            idr_commands._org_id_cache.clear()
+
+    def test_null_data_leaves_short_id(self):
+        """A null or malformed sample page falls back to the short id instead of raising"""
+        config_manager = MagicMock()
+        config_manager.get.return_value = None
+        for payload in ({'data': None}, {'data': ['not-a-dict']}, {}):
+            idr_commands._org_id_cache.clear()
+            client = MagicMock()
+            client.list_investigations.return_value = payload
+            try:
+                assert idr_commands.resolve_investigation_id(client, 'X1', 'au', config_manager) == 'X1'
+            finally:
+                idr_commands._org_id_cache.clear()
+        config_manager.save_config.assert_not_called()
+
+    def test_several_ids_run_in_order_and_keep_failures(self):
+        """Comma-separated IDs each get a result, failures included, in argument order"""
+        config_manager = MagicMock()
+        config_manager.get.return_value = 'ORG1'
+
+        def action(rrn):
+            if rrn.endswith(':B'):
+                raise idr_commands.APIError('nope')
+            return {'rrn': rrn}
+
+        results = idr_commands._run_for_investigations(
+            MagicMock(), idr_commands._split_ids('A, B,A,C'), 'au', config_manager, None, action)
+        assert list(results) == ['A', 'B', 'C']
+        assert results['A'] == {'rrn': 'rrn:investigation:au:ORG1:investigation:A'}
+        assert isinstance(results['B'], idr_commands.APIError)
+
+
+class TestPayloadRows:
+    def test_malformed_payloads_yield_no_rows(self):
+        """Null, non-dict and non-list payloads give no rows instead of raising"""
+        for payload in (None, [], 'x', {'data': None}, {'data': {'a': 1}}, {'data': 5}):
+            assert idr_commands._rows(payload) == []
+        assert idr_commands._rows({'alerts': [{'rrn': 'a'}, None, 'b']}, 'alerts') == [{'rrn': 'a'}]
+
+
+class TestJsonFast:
+    def test_round_trip(self):
+        """dumps/loads round-trip regardless of whether orjson is installed"""
+        data = {'region': 'au', 'pages': 3, 'tags': ['a', 'b'], 'org': None}
+        assert json_fast.loads(json_fast.dumps(data)) == data
+        assert json_fast.loads(json_fast.dumps(data, indent=False).encode()) == data
+
+    def test_write_raw_passes_bytes_through(self, capsys):
+        """Pre-encoded chunks reach stdout unchanged, followed by a newline"""
+        json_fast.write_raw((b'{"a":', b'1}'))
+        assert capsys.readouterr().out == '{"a":1}\n'
+
+    def test_write_falls_back_for_non_str_keys(self, capsys):
+        """Data orjson rejects is still written, via the stdlib encoder"""
+        json_fast.write({1: 'a'})
+        assert capsys.readouterr().out == '{\n  "1": "a"\n}\n'
+
+    def test_write_honours_compact_env(self, capsys, monkeypatch):
+        """R7_JSON_COMPACT=1 drops indentation unless the caller asks for it"""
+        monkeypatch.setenv('R7_JSON_COMPACT', '1')
+        json_fast.write({'a': [1, 2]})
+        assert capsys.readouterr().out == '{"a":[1,2]}\n'
+        json_fast.write({'a': 1}, indent=True)
+        assert capsys.readouterr().out == '{\n  "a": 1\n}\n'
+
+    def test_compact_has_no_whitespace(self):
+        """Compact output matches json.dumps with tight separators"""
+        assert json_fast.dumps({'a': [1, 2]}, indent=False) == '{"a":[1,2]}'
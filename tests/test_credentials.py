@@ -62,10 +62,42 @@ class TestCredentialPrecedence:
             assert result.exit_code == 0
 
 
+class TestKeychainCache:
+    """Keychain reads are remembered per process and invalidated on writes"""
+    
+    def setup_method(self):
+        CredentialManager.clear_cache()
+    
+    def teardown_method(self):
+        CredentialManager.clear_cache()
+    
+    def test_repeated_reads_hit_keyring_once(self):
+        """A second lookup is served from the cache"""
+        with patch('keyring.get_password', return_value='vm-secret') as get_password:
+            assert CredentialManager.get_vm_password() == 'vm-secret'
+            assert CredentialManager.get_vm_password() == 'vm-secret'
+            assert get_password.call_count == 1
+    
+    def test_store_invalidates(self):
+        """Storing a new password drops the cached read"""
+        with patch('keyring.get_password', side_effect=['old', 'new']), \
+             patch('keyring.set_password'):
+            assert CredentialManager.get_vm_password() == 'old'
+            CredentialManager.store_vm_password('new')
+            assert CredentialManager.get_vm_password() == 'new'
+    
+    def test_failures_not_cached(self):
+        """A keyring error is retried on the next lookup"""
+        with patch('keyring.get_password', side_effect=[Exception("locked"), 'vm-secret']):
+            assert CredentialManager.get_vm_password() is None
+            assert CredentialManager.get_vm_password() == 'vm-secret'
+
+
 class TestKeyringFallback:
     """Test behavior when keyring is unavailable (common on headless Linux)"""
     
     def setup_method(self):
+        CredentialManager.clear_cache()
         self.cred_manager = CredentialManager()
     
     def test_keyring_unavailable_no_crash(self):
@@ -0,0 +1,60 @@
+"""
+Test SIEM log command helpers
+"""
+import json
+from pathlib import Path
+import sys
+
+# Add parent directory to path to import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from commands.logs_commands import (_render_groupby_table, _write_event_messages,
+                                    extract_smart_field_value, parse_leql_limit)
+
+
+class TestWriteEventMessages:
+    def test_matches_json_dumps(self, capsys):
+        """Streamed output is byte-for-byte what json.dumps of the message list gives"""
+        events = [{'message': '{"a": 1}'}, {'message': 'plain text'}, {'message': None}, {}]
+        _write_event_messages(events)
+        expected = json.dumps([{'a': 1}, 'plain text', None, ''])
+        assert capsys.readouterr().out == expected + '\n'
+
+    def test_empty(self, capsys):
+        """No events still produce a valid JSON array"""
+        _write_event_messages(())
+        assert capsys.readouterr().out == '[]\n'
+
+
+class TestExtractSmartFieldValue:
+    def test_nested_json_path(self):
+        """json.* fields walk the parsed message; the title comes from the last segment"""
+        parsed = {'src': {'user_name': 'bob'}}
+        assert extract_smart_field_value('json.src.user_name', parsed, {}) == ('User Name', 'bob')
+        assert extract_smart_field_value('json.src.missing', parsed, {}) is None
+
+    def test_top_level_event_field(self):
+        """Other fields are read straight from the event"""
+        assert extract_smart_field_value('host', {}, {'host': 'h1'}) == ('Host', 'h1')
+
+
+class TestParseLeqlLimit:
+    def test_limit_clause(self):
+        """limit(N) is found regardless of case and spacing"""
+        assert parse_leql_limit("where(x) groupby(y) LIMIT ( 25 )") == 25
+        assert parse_leql_limit("where(x)") is None
+        assert parse_leql_limit("") is None
+
+
+class TestRenderGroupbyTable:
+    def test_sorted_by_primary_metric(self, capsys):
+        """Groups print busiest first; a group without the metric counts as 0"""
+        statistics = {'groups': [{'alpha': {'count': 2.0}}, {'beta': {'count': 9.0}},
+                                 {'gamma': {'totals': {'other': 1}}}]}
+        assert _render_groupby_table(statistics) is True
+        out = capsys.readouterr().out
+        assert out.index('beta') < out.index('alpha') < out.index('gamma')
+
+    def test_no_groups(self):
+        """Nothing is rendered without groups"""
+        assert _render_groupby_table({}) is False
@@ -1,4 +1,15 @@
 from .exceptions import *
-from .config import ConfigManager
-from .credentials import CredentialManager
-from .cache import CacheManager
\ No newline at end of file
+# Managers are resolved on first access so importing one utils module
+# doesn't pull in keyring and diskcache for commands that never use them
+_LAZY_EXPORTS = {
+    'ConfigManager': '.config',
+    'CredentialManager': '.credentials',
+    'CacheManager': '.cache',
+}
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        import importlib
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
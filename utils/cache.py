@@ -1,11 +1,25 @@
 import hashlib
 import json
 import platform
+import time
+import types
 from pathlib import Path
 from diskcache import Cache
 from .exceptions import ConfigurationError
+from . import json_fast
 class CacheManager:
-    def __init__(self, cache_dir=None, ttl=3600, max_size=1000):
+    # Namespaces holding plain JSON API payloads; with orjson installed these are
+    # stored as orjson bytes, which load faster than unpickling nested dicts
+    JSON_NAMESPACES = frozenset(('ic', 'etag'))
+    DEFAULT_TTL = 3600
+    # TTLs for namespaces that change far less often than API listings (log/logset
+    # name -> id lookups), used only while cache_ttl is left at DEFAULT_TTL
+    TTL_POLICY = types.MappingProxyType({
+        'log_lookup': 86400,
+        'logset_lookup': 86400,
+        'logs_metadata': 86400,
+    })
+    def __init__(self, cache_dir=None, ttl=DEFAULT_TTL, max_size=1000):
         if cache_dir:
             self.cache_dir = Path(cache_dir)
         else:
@@ -48,15 +62,48 @@ class CacheManager:
         key_string = json.dumps(key_data, sort_keys=True)
         return hashlib.md5(key_string.encode()).hexdigest()
     def get(self, query_type, query, **kwargs):
-        """Get cached result if exists and not expired"""
+        """Get cached result if exists and not expired (past its TTL, even if kept for grace)"""
         self._ensure_cache()
         key = self._generate_key(query_type, query, **kwargs)
-        return self.cache.get(key)
-    def set(self, query_type, query, result, **kwargs):
-        """Cache query result with TTL"""
+        value, fresh_until = self.cache.get(key, tag=True)
+        if fresh_until is not None and time.time() > fresh_until:
+            return None
+        if isinstance(value, bytes) and query_type in self.JSON_NAMESPACES:
+            return json_fast.loads(value)
+        return value
+    def get_stale(self, query_type, query, max_stale, **kwargs):
+        """Get a cached result plus whether it is past its TTL.
+        Entries written with grace stay readable here for up to max_stale seconds after
+        the fresh-until time stored with them; anything older is a miss.
+        """
         self._ensure_cache()
         key = self._generate_key(query_type, query, **kwargs)
-        self.cache.set(key, result, expire=self.ttl)
+        value, fresh_until = self.cache.get(key, tag=True)
+        if value is None:
+            return None, False
+        is_stale = fresh_until is not None and time.time() > fresh_until
+        if is_stale and time.time() > fresh_until + max_stale:
+            return None, False
+        if isinstance(value, bytes) and query_type in self.JSON_NAMESPACES:
+            value = json_fast.loads(value)
+        return value, is_stale
+    def ttl_for(self, query_type):
+        """TTL for a namespace: its TTL_POLICY entry unless cache_ttl was changed from the default"""
+        if self.ttl != self.DEFAULT_TTL:
+            return self.ttl
+        return self.TTL_POLICY.get(query_type, self.ttl)
+    def set(self, query_type, query, result, grace=0, ttl=None, **kwargs):
+        """Cache query result with TTL (ttl, else ttl_for the namespace),
+        kept for an extra grace seconds that only get_stale will serve"""
+        self._ensure_cache()
+        key = self._generate_key(query_type, query, **kwargs)
+        if query_type in self.JSON_NAMESPACES and json_fast.orjson is not None:
+            result = json_fast.orjson.dumps(result)
+        expire = self.ttl_for(query_type) if ttl is None else ttl
+        # With grace the entry outlives its TTL for get_stale only; the tag records
+        # when it stops being fresh, so get() still treats it as expired after expire
+        fresh_until = time.time() + expire if grace else None
+        self.cache.set(key, result, expire=expire + grace, tag=fresh_until)
     def clear(self):
         """Clear all cached results"""
         self._ensure_cache()
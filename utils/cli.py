@@ -2,9 +2,9 @@
 Centralized CLI utilities and base classes for command modules.
 This module reduces code duplication across all command modules.
 """
-import json
 import sys
 import logging
+import threading
 from datetime import datetime
 from functools import wraps
 from typing import Dict, Any, Optional, Union, List
@@ -13,10 +13,11 @@ import click
 from rich.console import Console
 from rich.table import Table
 
-from .config import ConfigManager
+from .config import ConfigManager, get_config
 from .cache import CacheManager
 from .credentials import CredentialManager
 from .exceptions import *
+from . import json_fast
 from api.client import Rapid7Client
 
 logger = logging.getLogger(__name__)
@@ -81,7 +82,7 @@ class OutputFormatter:
         use_json = OutputFormatter.should_use_json_output(output_format, config_manager.get('default_output'))
         
         if use_json:
-            click.echo(json.dumps(data, indent=2))
+            json_fast.write(data)
         elif output_format == 'table' and table_formatter:
             table_formatter(data)
         elif output_format == 'simple' and simple_formatter:
@@ -90,7 +91,7 @@ class OutputFormatter:
             table_formatter(data)
         else:
             # Fallback to JSON
-            click.echo(json.dumps(data, indent=2))
+            json_fast.write(data)
 
     @staticmethod
     def create_standard_table(title: str, columns: List[Dict[str, str]]) -> Table:
@@ -150,10 +151,9 @@ class ClientManager:
             Tuple of (client, config_manager)
         """
         try:
-            config_manager = ConfigManager()
-            config_manager.validate()
+            config_manager = get_config()
             
-            final_api_key = CredentialManager.get_api_key(api_key or ctx.obj.get('api_key'))
+            final_api_key = CredentialManager.get_api_key(api_key or ctx.obj.api_key)
             if not final_api_key:
                 raise AuthenticationError(
                     "No API key found. Use --api-key, set R7_API_KEY environment variable, "
@@ -161,7 +161,7 @@ class ClientManager:
                 )
             
             # Create cache key for client reuse
-            region = ctx.obj.get('region') or config_manager.get('region')
+            region = ctx.obj.region or config_manager.get('region')
             client_key = f"{final_api_key[:8]}_{region}_{cache_namespace}"
             
             if client_key not in self._clients:
@@ -178,6 +178,45 @@ class ClientManager:
             ctx.exit(1)
 
 
+def cached_or_fetch(client: Rapid7Client, namespace: str, cache_key: Any,
+                    no_cache: bool, fetch: callable, max_stale: int = 0) -> Any:
+    """
+    Return cached data for cache_key, or call fetch() and cache its result.
+    
+    The cache is skipped entirely when the client has no cache manager or
+    no_cache is set. Empty cached values count as misses.
+    
+    With max_stale > 0, an entry up to max_stale seconds past its TTL is
+    returned straight away and refreshed on a background thread; the process
+    waits for that refresh before exiting. A failed refresh keeps the old entry.
+    """
+    cache_manager = client.cache_manager
+    if cache_manager and not no_cache:
+        if max_stale > 0:
+            data, is_stale = cache_manager.get_stale(namespace, cache_key, max_stale)
+        else:
+            data, is_stale = cache_manager.get(namespace, cache_key), False
+        if data:
+            OutputFormatter.display_cached_message()
+            if is_stale:
+                threading.Thread(target=_refresh_cache_entry,
+                                 args=(cache_manager, namespace, cache_key, fetch, max_stale)).start()
+            return data
+    data = fetch()
+    if cache_manager and not no_cache:
+        cache_manager.set(namespace, cache_key, data, grace=max_stale)
+    return data
+
+
+def _refresh_cache_entry(cache_manager: CacheManager, namespace: str, cache_key: Any,
+                         fetch: callable, max_stale: int) -> None:
+    """Background half of stale-while-revalidate; errors leave the stale entry in place."""
+    try:
+        cache_manager.set(namespace, cache_key, fetch(), grace=max_stale)
+    except Exception as e:
+        logger.debug(f"Background cache refresh failed for {namespace}: {e}")
+
+
 class CacheableCommand:
     """Base class for commands that support caching."""
     
@@ -199,19 +238,7 @@ class CacheableCommand:
         Returns:
             The requested data (cached or fresh)
         """
-        cached_result = None
-        if client.cache_manager and not no_cache:
-            cached_result = client.cache_manager.get(self.cache_namespace, cache_key)
-            if cached_result:
-                OutputFormatter.display_cached_message()
-        
-        if not cached_result:
-            data = data_fetcher()
-            if client.cache_manager and not no_cache:
-                client.cache_manager.set(self.cache_namespace, cache_key, data)
-            return data
-        
-        return cached_result
+        return cached_or_fetch(client, self.cache_namespace, cache_key, no_cache, data_fetcher)
 
 
 # Common Click decorators for reuse
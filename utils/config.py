@@ -1,4 +1,7 @@
+import functools
 import json
+import os
+import tempfile
 from pathlib import Path
 from .exceptions import ConfigurationError
 class ConfigManager:
@@ -41,11 +44,19 @@ class ConfigManager:
         except (json.JSONDecodeError, IOError) as e:
             raise ConfigurationError(f"Failed to load config from {self.config_path}: {e}")
     def save_config(self):
-        """Save current configuration to file"""
+        """Save current configuration to file.
+        Written to a temp file and renamed over the config, so a concurrent reader never sees half a file.
+        """
         try:
             self.config_path.parent.mkdir(exist_ok=True, parents=True)
-            with open(self.config_path, 'w') as f:
+            with tempfile.NamedTemporaryFile('w', dir=self.config_path.parent, prefix='.rapid7_config.',
+                                             suffix='.tmp', delete=False) as f:
                 json.dump(self.config, f, indent=2)
+            try:
+                os.replace(f.name, self.config_path)
+            except OSError:
+                os.unlink(f.name)
+                raise
         except IOError as e:
             raise ConfigurationError(f"Failed to save config to {self.config_path}: {e}")
     def get(self, key, default=None):
@@ -57,6 +68,11 @@ class ConfigManager:
     def update(self, updates):
         """Update multiple configuration values"""
         self.config.update(updates)
+    def update_many(self, updates):
+        """Apply several values, validate them and save the file in one write"""
+        self.config.update(updates)
+        self.validate()
+        self.save_config()
     def reset_to_defaults(self):
         """Reset configuration to defaults"""
         self.config = self.DEFAULT_CONFIG.copy()
@@ -74,3 +90,11 @@ class ConfigManager:
             raise ConfigurationError("query_timeout must be at least 30 seconds")
         if not isinstance(self.config.get('cache_ttl'), int) or self.config.get('cache_ttl') < 0:
             raise ConfigurationError("cache_ttl must be a non-negative integer")
+@functools.lru_cache(maxsize=1)
+def get_config():
+    """Return the process-wide ConfigManager for the default path, validated once.
+    Code that saves config changes should call get_config.cache_clear() afterwards.
+    """
+    config_manager = ConfigManager()
+    config_manager.validate()
+    return config_manager
@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+@dataclass(slots=True)
+class R7Context:
+    """Global CLI options, stored as ctx.obj by the root group and read by attribute."""
+    api_key: str | None = None
+    region: str | None = None
+    org_id: str | None = None
+    verbose: bool = False
@@ -7,6 +7,24 @@ class CredentialManager:
     # VM console password stored under a dedicated service namespace
     VM_SERVICE_NAME = "rapid7-cli-vm"
     VM_PASSWORD_NAME = "vm-password"
+    # Keychain reads per (service, name); entries can't change mid-process except
+    # through the store/delete methods below, which invalidate them
+    _keychain_cache = {}
+    @classmethod
+    def _keychain_get(cls, service, name):
+        """keyring.get_password, remembered for the life of the process.
+        Failed lookups raise as before and are not cached.
+        """
+        key = (service, name)
+        if key in cls._keychain_cache:
+            return cls._keychain_cache[key]
+        value = keyring.get_password(service, name)
+        cls._keychain_cache[key] = value
+        return value
+    @classmethod
+    def clear_cache(cls):
+        """Forget all remembered keychain reads."""
+        cls._keychain_cache.clear()
     @classmethod
     def get_api_key(cls, provided_key=None):
         """Get API key from various sources in priority order:
@@ -20,7 +38,7 @@ class CredentialManager:
         if env_key:
             return env_key
         try:
-            keychain_key = keyring.get_password(cls.SERVICE_NAME, cls.API_KEY_NAME)
+            keychain_key = cls._keychain_get(cls.SERVICE_NAME, cls.API_KEY_NAME)
             if keychain_key:
                 return keychain_key
         except Exception:
@@ -36,6 +54,7 @@ class CredentialManager:
     @classmethod
     def store_api_key(cls, api_key):
         """Store API key in keychain or config file (Linux fallback)"""
+        cls._keychain_cache.pop((cls.SERVICE_NAME, cls.API_KEY_NAME), None)
         try:
             keyring.set_password(cls.SERVICE_NAME, cls.API_KEY_NAME, api_key)
             return True
@@ -54,6 +73,7 @@ class CredentialManager:
     @classmethod
     def delete_api_key(cls):
         """Delete API key from keychain or config file"""
+        cls._keychain_cache.pop((cls.SERVICE_NAME, cls.API_KEY_NAME), None)
         try:
             keyring.delete_password(cls.SERVICE_NAME, cls.API_KEY_NAME)
             return True
@@ -97,6 +117,7 @@ class CredentialManager:
         """Store VM console password in macOS Keychain"""
         if not password:
             raise AuthenticationError("Password is empty")
+        cls._keychain_cache.pop((cls.VM_SERVICE_NAME, cls.VM_PASSWORD_NAME), None)
         try:
             keyring.set_password(cls.VM_SERVICE_NAME, cls.VM_PASSWORD_NAME, password)
             return True
@@ -107,13 +128,14 @@ class CredentialManager:
     def get_vm_password(cls) -> str | None:
         """Retrieve VM console password from macOS Keychain"""
         try:
-            return keyring.get_password(cls.VM_SERVICE_NAME, cls.VM_PASSWORD_NAME)
+            return cls._keychain_get(cls.VM_SERVICE_NAME, cls.VM_PASSWORD_NAME)
         except Exception:
             return None
 
     @classmethod
     def delete_vm_password(cls) -> bool:
         """Delete VM console password from macOS Keychain"""
+        cls._keychain_cache.pop((cls.VM_SERVICE_NAME, cls.VM_PASSWORD_NAME), None)
         try:
             keyring.delete_password(cls.VM_SERVICE_NAME, cls.VM_PASSWORD_NAME)
             return True
@@ -0,0 +1,55 @@
+import json
+import os
+import sys
+try:
+    import orjson
+except ImportError:
+    orjson = None
+def dumps(data, indent=True):
+    """Serialize data to a JSON string, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0).decode('utf-8')
+    if indent:
+        return json.dumps(data, indent=2)
+    return json.dumps(data, separators=(',', ':'))
+def loads(raw):
+    """Parse JSON from bytes or str, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+def write(data, indent=None):
+    """Write data to stdout as JSON plus a newline.
+    orjson output goes straight to the binary buffer, skipping the str round trip;
+    data orjson can't encode falls back to json.dump.
+    indent defaults to pretty-printing unless R7_JSON_COMPACT=1 is set.
+    """
+    if indent is None:
+        indent = os.environ.get('R7_JSON_COMPACT') != '1'
+    payload = None
+    if orjson is not None and hasattr(sys.stdout, 'buffer'):
+        try:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+        except TypeError:
+            # e.g. non-str dict keys or >64-bit ints, which the stdlib handles
+            payload = None
+    if payload is not None:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(payload)
+        sys.stdout.buffer.write(b'\n')
+        sys.stdout.buffer.flush()
+    else:
+        json.dump(data, sys.stdout, indent=2 if indent else None, separators=None if indent else (',', ':'))
+        sys.stdout.write('\n')
+        sys.stdout.flush()
+def write_raw(chunks):
+    """Write an already-encoded JSON body (an iterable of bytes) to stdout untouched, plus a newline."""
+    if hasattr(sys.stdout, 'buffer'):
+        sys.stdout.flush()
+        out = sys.stdout.buffer
+        for chunk in chunks:
+            out.write(chunk)
+        out.write(b'\n')
+        out.flush()
+    else:
+        sys.stdout.write(b''.join(chunks).decode('utf-8'))
+        sys.stdout.write('\n')
@@ -0,0 +1,3 @@
+def docs_search_key(query, limit):
+    """Cache key for a docs search, shared by DocsClient and the docs command."""
+    return f"docs_search_{query.lower()}_{limit}"
@@ -0,0 +1,23 @@
+import importlib
+import click
+class LazyGroup(click.Group):
+    """click.Group whose listed subcommands are only imported when first looked up.
+    lazy_subcommands maps a command name to 'module.path:attribute'.
+    """
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = dict(lazy_subcommands or {})
+    def list_commands(self, ctx):
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            return self._load(cmd_name)
+        return super().get_command(ctx, cmd_name)
+    def _load(self, cmd_name):
+        """Import a lazy subcommand and register it like an eager one."""
+        module_name, attr = self.lazy_subcommands.pop(cmd_name).split(':')
+        cmd = getattr(importlib.import_module(module_name), attr)
+        if not isinstance(cmd, click.Command):
+            raise TypeError(f"{module_name}:{attr} is not a click command")
+        self.add_command(cmd, name=cmd_name)
+        return cmd